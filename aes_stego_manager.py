@@ -3,11 +3,19 @@ import os
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
 from Crypto.Random import get_random_bytes
-from stegano import lsb
+
+from cover_cache import default_cover_cache
 
 class SecurityIntegrator:
-    def __init__(self):
+    def __init__(self, cover_cache=default_cover_cache, verbose=True):
+        """
+        cover_cache: CoverCache untuk array pixel cover yang sudah di-decode.
+        Isi None untuk selalu memakai stegano.lsb.hide (baca & decode ulang dari disk).
+        verbose: jika False, hanya pesan gagal yang di-print.
+        """
         self.block_size = AES.block_size
+        self.cover_cache = cover_cache
+        self.verbose = verbose
     
     def generate_aes_key(self):
         """Membuat kunci AES acak 32 bytes (256 bit)."""
@@ -54,10 +62,21 @@ class SecurityIntegrator:
         secret_message: Harus berupa string (hasil dari encrypt_data_aes).
         """
         try:
-            print(f"[*] Sedang menyembunyikan data ke {cover_image_path}...")
-            secret_image = lsb.hide(cover_image_path, secret_message)
+            if self.verbose:
+                print(f"[*] Sedang menyembunyikan data ke {cover_image_path}...")
+            if self.cover_cache is not None:
+                from PIL import Image
+                from lsb_array import embed_message
+                
+                # Salin dari array cache (copy-on-write), tanpa I/O dan decode PNG
+                cover_pixels = self.cover_cache.get(cover_image_path)
+                secret_image = Image.fromarray(embed_message(cover_pixels, secret_message))
+            else:
+                from stegano import lsb
+                secret_image = lsb.hide(cover_image_path, secret_message)
             secret_image.save(output_path)
-            print(f"[+] Sukses! Gambar steganografi disimpan di: {output_path}")
+            if self.verbose:
+                print(f"[+] Sukses! Gambar steganografi disimpan di: {output_path}")
             return True
         except Exception as e:
             print(f"[-] Gagal menyembunyikan data: {str(e)}")
@@ -68,7 +87,9 @@ class SecurityIntegrator:
         Mengambil string rahasia dari gambar steganografi.
         """
         try:
-            print(f"[*] Sedang mengekstrak data dari {stego_image_path}...")
+            if self.verbose:
+                print(f"[*] Sedang mengekstrak data dari {stego_image_path}...")
+            from stegano import lsb
             secret_message = lsb.reveal(stego_image_path)
             return secret_message
         except Exception as e:
@@ -0,0 +1,241 @@
+"""
+batch_runner.py
+====================================
+Menjalankan banyak job encrypt_and_hide (file, cover) secara paralel di
+process pool. Setiap worker memuat IntegratedSecuritySystem (dan kunci)
+satu kali; progress per tahap dikirim lewat multiprocessing.Queue sehingga
+GUI/CLI cukup memanggil poll() secara berkala tanpa blocking.
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from integrated_system import IntegratedSecuritySystem, OperationCancelled
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+REPORT_FIELDS = ("job_id", "plaintext", "cover", "output", "status", "message", "bytes", "seconds")
+
+
+class BatchJob(NamedTuple):
+    job_id: int
+    plaintext_path: str
+    cover_path: str
+    output_path: str
+
+
+# ============================================================================
+# WORKER PROCESS
+# ============================================================================
+
+_worker_system = None
+_worker_events = None
+_worker_cancel = None
+
+
+def _init_worker(key_paths: dict, events, cancel_event):
+    global _worker_system, _worker_events, _worker_cancel
+    _worker_system = IntegratedSecuritySystem(**key_paths, verbose=False)
+    _worker_events = events
+    _worker_cancel = cancel_event
+
+
+def _run_job(job: BatchJob):
+    def progress(stage, step, total):
+        if _worker_cancel.is_set():
+            raise OperationCancelled()
+        _worker_events.put(("progress", job.job_id, stage, step, total))
+
+    start = time.perf_counter()
+    success, message = _worker_system.encrypt_and_hide(
+        job.plaintext_path, job.cover_path, job.output_path, progress=progress
+    )
+    return success, message, time.perf_counter() - start
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def plan_folder_jobs(input_paths: List[str], cover_paths: List[str], output_dir: str,
+                     first_id: int = 0) -> List[BatchJob]:
+    """
+    Buat job untuk setiap file input (folder diekspansi satu level).
+    Cover dibagi round-robin; output: <output_dir>/<nama file>_<job_id>_stego.png
+    (ekstensi ikut di nama, mis. report_pdf_3_stego.png). job_id membuat nama
+    unik antar batch yang masih berjalan; jika file dengan nama itu sudah ada
+    di output_dir (mis. dari sesi sebelumnya), ditambah penghitung (_3-1, _3-2, ...).
+    """
+    if not cover_paths:
+        raise ValueError("Minimal satu cover image diperlukan")
+
+    files = []
+    for path in input_paths:
+        if os.path.isdir(path):
+            files.extend(sorted(str(p) for p in Path(path).iterdir() if p.is_file()))
+        else:
+            files.append(path)
+
+    jobs = []
+    for i, path in enumerate(files):
+        job_id = first_id + i
+        base = os.path.join(output_dir, f"{Path(path).name.replace('.', '_')}_{job_id}")
+        output, n = f"{base}_stego.png", 0
+        while os.path.exists(output):
+            n += 1
+            output = f"{base}-{n}_stego.png"
+        jobs.append(BatchJob(job_id, path, cover_paths[i % len(cover_paths)], output))
+    return jobs
+
+
+def list_covers(path: str) -> List[str]:
+    """Satu file cover, atau semua gambar di dalam folder"""
+    if os.path.isdir(path):
+        return sorted(str(p) for p in Path(path).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+    return [path]
+
+
+class BatchRunner:
+    """
+    Process pool untuk job batch.
+
+    Event dari poll():
+      ("progress", job_id, stage, step, total)
+      ("done", job_id, success, message, seconds)
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 sender_private_key_path="private_key.pem",
+                 sender_public_key_path="public_key.pem",
+                 receiver_public_key_path="public_key.pem",
+                 receiver_private_key_path="private_key.pem"):
+        self.workers = workers or os.cpu_count() or 2
+        self.key_paths = {
+            'sender_private_key_path': sender_private_key_path,
+            'sender_public_key_path': sender_public_key_path,
+            'receiver_public_key_path': receiver_public_key_path,
+            'receiver_private_key_path': receiver_private_key_path,
+        }
+        self.results = {}
+        self._pool = None
+        self._events = None
+        self._cancel = None
+        self._done = queue.Queue()
+        self._futures = {}
+        self._started_at = None
+
+    @property
+    def pending(self) -> int:
+        """Jumlah job yang hasilnya belum diterima lewat poll()"""
+        return sum(r['status'] in ('queued', 'running') for r in self.results.values())
+
+    def start(self, jobs: List[BatchJob]):
+        """Submit semua job; kembali segera"""
+        if self._pool is None:
+            # Pastikan kunci sudah ada sebelum worker dibuat
+            IntegratedSecuritySystem(**self.key_paths)
+            self._events = multiprocessing.Queue()
+            self._cancel = multiprocessing.Event()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(self.key_paths, self._events, self._cancel)
+            )
+        self._cancel.clear()
+        if not self.pending:
+            self._started_at = time.perf_counter()
+
+        for job in jobs:
+            self.results[job.job_id] = {
+                'job_id': job.job_id, 'plaintext': job.plaintext_path, 'cover': job.cover_path,
+                'output': job.output_path, 'status': 'queued', 'message': '', 'bytes': None, 'seconds': None,
+            }
+            future = self._pool.submit(_run_job, job)
+            future.add_done_callback(lambda f, job_id=job.job_id: self._done.put((job_id, f)))
+            self._futures[job.job_id] = future
+
+    def poll(self) -> list:
+        """Ambil semua event yang tersedia (non-blocking)"""
+        events = []
+        while self._events is not None:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            result = self.results.get(event[1])
+            if result is not None and result['status'] == 'queued':
+                result['status'] = 'running'
+            events.append(event)
+
+        while True:
+            try:
+                job_id, future = self._done.get_nowait()
+            except queue.Empty:
+                break
+            result = self.results[job_id]
+            if future.cancelled():
+                success, message, seconds = False, "Proses dibatalkan", None
+            elif future.exception() is not None:
+                success, message, seconds = False, str(future.exception()), None
+            else:
+                success, message, seconds = future.result()
+            result['status'] = 'ok' if success else ('cancelled' if message == "Proses dibatalkan" else 'failed')
+            result['message'] = message.replace("\n", " ")
+            result['seconds'] = seconds
+            if success and os.path.exists(result['plaintext']):
+                result['bytes'] = os.path.getsize(result['plaintext'])
+            events.append(("done", job_id, success, message, seconds))
+        return events
+
+    def forget(self, job_id: int):
+        """Buang hasil job yang sudah diproses (untuk runner yang berjalan lama)"""
+        self.results.pop(job_id, None)
+        self._futures.pop(job_id, None)
+
+    def cancel(self):
+        """Batalkan job yang belum mulai; job yang berjalan berhenti di batas tahap"""
+        if self._cancel is not None:
+            self._cancel.set()
+        for future in self._futures.values():
+            future.cancel()
+
+    def summary(self) -> dict:
+        done = [r for r in self.results.values() if r['status'] in ('ok', 'failed', 'cancelled')]
+        ok = [r for r in done if r['status'] == 'ok']
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        total_bytes = sum(r['bytes'] or 0 for r in ok)
+        return {
+            'jobs': len(self.results),
+            'ok': len(ok),
+            'failed': sum(r['status'] == 'failed' for r in done),
+            'cancelled': sum(r['status'] == 'cancelled' for r in done),
+            'elapsed_s': elapsed,
+            'jobs_per_s': len(done) / elapsed if elapsed else 0.0,
+            'mb_per_s': total_bytes / 1e6 / elapsed if elapsed else 0.0,
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self.cancel()
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def write_report(path: str, results: List[dict], summary: Optional[dict] = None):
+    """Tulis laporan batch sebagai CSV (default) atau JSON (.json)"""
+    if path.lower().endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({'summary': summary, 'jobs': results}, f, indent=2)
+        return
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        for row in results:
+            writer.writerow({k: row.get(k) for k in REPORT_FIELDS})
@@ -0,0 +1,460 @@
+"""
+bench_suite.py
+====================================
+Benchmark reproducible untuk setiap tahap pipeline.
+
+- Timer perf_counter, putaran warmup lalu `repeat` sampel per kasus.
+- Data sintetis acak (seed tetap): plaintext, payload ASCII dan cover noise.
+- Grid ukuran data x resolusi cover.
+- Output JSON: median/mean/p90/p99, ops/s dan MB/s per kasus, metadata
+  environment, plus tabel kalibrasi (fixed_s + mb_per_s per tahap) dalam
+  format yang dibaca IntegratedSecuritySystem.estimate_payload.
+- `compare` menandai regresi terhadap baseline JSON (median lebih lambat
+  dari ambang batas) dan keluar dengan status 1.
+
+Run: python bench_suite.py run -o bench.json
+     python bench_suite.py run --quick -o bench.json
+     python bench_suite.py compare baseline.json bench.json --threshold 0.1
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+DEFAULT_SIZES = [1024, 64 * 1024, 1024 * 1024]
+DEFAULT_RESOLUTIONS = [(256, 256), (512, 512), (1024, 1024)]
+QUICK_SIZES = [1024, 64 * 1024]
+QUICK_RESOLUTIONS = [(256, 256), (512, 512)]
+
+# Tahap ENCRYPT_STAGES -> kasus benchmark yang mengkalibrasinya (dimensi: ukuran data).
+# Tahap "embed" dikalibrasi dari lsb_embed + png_save terhadap byte cover (w*h*3),
+# sama seperti stage_bytes di IntegratedSecuritySystem.estimate_payload.
+CALIBRATION_SOURCES = {
+    'read': 'file_read',
+    'sign': 'rsa_sign',
+    'combine': 'combine',
+    'encrypt': 'aes_encrypt',
+    'wrap': 'rsa_wrap',
+    'package': 'package',
+}
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+def time_op(func, warmup: int = 2, repeat: int = 10) -> list:
+    """Jalankan func warmup kali (tidak diukur) lalu repeat kali; return durasi (detik)"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _percentile(sorted_samples: list, q: float) -> float:
+    """Persentil dengan interpolasi linear (q dalam 0..100)"""
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    pos = (len(sorted_samples) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_samples) - 1)
+    return sorted_samples[lo] + (sorted_samples[hi] - sorted_samples[lo]) * (pos - lo)
+
+
+def summarize(samples: list, nbytes: int) -> dict:
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    return {
+        'repeat': len(ordered),
+        'min_s': ordered[0],
+        'median_s': median,
+        'mean_s': statistics.fmean(ordered),
+        'p90_s': _percentile(ordered, 90),
+        'p99_s': _percentile(ordered, 99),
+        'max_s': ordered[-1],
+        'stdev_s': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        'ops_per_s': 1.0 / median if median else None,
+        'mb_per_s': nbytes / 1e6 / median if median and nbytes else None,
+    }
+
+
+# ============================================================================
+# CASES
+# ============================================================================
+
+class BenchContext:
+    """Objek bersama (engine, kunci, data acak) untuk semua kasus benchmark"""
+
+    def __init__(self, workdir: str, seed: int = 0):
+        from aes_stego_manager import SecurityIntegrator
+        from Crypto.PublicKey import RSA
+        from rsa_manager import RSAManager
+
+        self.workdir = workdir
+        self.rng = random.Random(seed)
+        # cover_cache=None: embed diukur terhadap array, bukan cache
+        self.engine = SecurityIntegrator(cover_cache=None, verbose=False)
+        self.rsa = RSAManager()
+        # Kunci tetap dari seed, supaya hasil bisa diulang; tidak menyentuh kunci di disk
+        self.private_key = RSA.generate(2048, randfunc=self._randbytes)
+        self.public_key = self.private_key.publickey()
+        self.aes_key = self._randbytes(32)
+
+    def _randbytes(self, n: int) -> bytes:
+        return self.rng.randbytes(n)
+
+    def data(self, size: int) -> bytes:
+        return self._randbytes(size)
+
+    def ascii_payload(self, size: int) -> str:
+        return base64.b64encode(self._randbytes(size * 3 // 4 + 3)).decode('ascii')[:size]
+
+    def cover(self, resolution: tuple):
+        import numpy as np
+        width, height = resolution
+        return np.frombuffer(self._randbytes(width * height * 3), dtype=np.uint8).reshape(height, width, 3).copy()
+
+
+def _case_file_read(ctx, size, resolution):
+    path = os.path.join(ctx.workdir, f"read_{size}.bin")
+    with open(path, 'wb') as f:
+        f.write(ctx.data(size))
+
+    def run():
+        with open(path, 'rb') as f:
+            f.read()
+    return run, size
+
+
+def _case_aes_encrypt(ctx, size, resolution):
+    data = ctx.data(size)
+    return (lambda: ctx.engine.encrypt_data_aes(data, ctx.aes_key)), size
+
+
+def _case_aes_decrypt(ctx, size, resolution):
+    # decrypt_data_aes men-decode hasil sebagai UTF-8, jadi plaintext harus teks
+    ciphertext = ctx.engine.encrypt_data_aes(ctx.ascii_payload(size), ctx.aes_key)
+    return (lambda: ctx.engine.decrypt_data_aes(ciphertext, ctx.aes_key)), size
+
+
+def _case_rsa_sign(ctx, size, resolution):
+    data = ctx.data(size)
+    return (lambda: ctx.rsa.sign_data(data, ctx.private_key)), size
+
+
+def _case_rsa_verify(ctx, size, resolution):
+    data = ctx.data(size)
+    signature = ctx.rsa.sign_data(data, ctx.private_key)
+    return (lambda: ctx.rsa.verify_signature(data, signature, ctx.public_key)), size
+
+
+def _case_combine(ctx, size, resolution):
+    data = ctx.data(size)
+    signature = ctx.rsa.sign_data(b"", ctx.private_key)
+
+    def run():
+        json.dumps({'data': base64.b64encode(data).decode('utf-8'), 'signature': signature})
+    return run, size
+
+
+def _case_package(ctx, size, resolution):
+    ciphertext = ctx.ascii_payload(size)
+    encrypted_key = ctx.rsa.encrypt_aes_key_with_rsa(ctx.aes_key, ctx.public_key)
+    return (lambda: json.dumps({'ciphertext': ciphertext, 'encrypted_key': encrypted_key})), size
+
+
+def _case_rsa_wrap(ctx, size, resolution):
+    return (lambda: ctx.rsa.encrypt_aes_key_with_rsa(ctx.aes_key, ctx.public_key)), len(ctx.aes_key)
+
+
+def _case_rsa_unwrap(ctx, size, resolution):
+    encrypted_key = ctx.rsa.encrypt_aes_key_with_rsa(ctx.aes_key, ctx.public_key)
+    return (lambda: ctx.rsa.decrypt_aes_key_with_rsa(encrypted_key, ctx.private_key)), len(ctx.aes_key)
+
+
+def _case_lsb_embed(ctx, size, resolution):
+    from lsb_array import capacity_bytes, embed_message
+    pixels = ctx.cover(resolution)
+    if size + len(str(size)) + 1 > capacity_bytes(pixels):  # prefix "<n>:" ikut disisipkan
+        return None
+    message = ctx.ascii_payload(size)
+    return (lambda: embed_message(pixels, message)), pixels.nbytes
+
+
+def _case_lsb_extract(ctx, size, resolution):
+    from PIL import Image
+    from stegano import lsb
+    from lsb_array import capacity_bytes, embed_message
+    pixels = ctx.cover(resolution)
+    if size + len(str(size)) + 1 > capacity_bytes(pixels):  # prefix "<n>:" ikut disisipkan
+        return None
+    image = Image.fromarray(embed_message(pixels, ctx.ascii_payload(size)))
+    return (lambda: lsb.reveal(image, close_file=False)), pixels.nbytes
+
+
+def _case_png_save(ctx, size, resolution):
+    from PIL import Image
+    image = Image.fromarray(ctx.cover(resolution))
+    return (lambda: image.save(io.BytesIO(), format='PNG')), image.width * image.height * 3
+
+
+def _case_png_decode(ctx, size, resolution):
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.fromarray(ctx.cover(resolution)).save(buffer, format='PNG')
+    encoded = buffer.getvalue()
+
+    def run():
+        with Image.open(io.BytesIO(encoded)) as img:
+            img.load()
+    return run, len(encoded)
+
+
+# nama -> (fungsi setup, dimensi grid): 'size', 'cover', 'both' atau None
+CASES = {
+    'file_read': (_case_file_read, 'size'),
+    'aes_encrypt': (_case_aes_encrypt, 'size'),
+    'aes_decrypt': (_case_aes_decrypt, 'size'),
+    'rsa_sign': (_case_rsa_sign, 'size'),
+    'rsa_verify': (_case_rsa_verify, 'size'),
+    'combine': (_case_combine, 'size'),
+    'package': (_case_package, 'size'),
+    'rsa_wrap': (_case_rsa_wrap, None),
+    'rsa_unwrap': (_case_rsa_unwrap, None),
+    'lsb_embed': (_case_lsb_embed, 'both'),
+    'lsb_extract': (_case_lsb_extract, 'both'),
+    'png_save': (_case_png_save, 'cover'),
+    'png_decode': (_case_png_decode, 'cover'),
+}
+
+
+def _grid(dimension, sizes, resolutions):
+    if dimension == 'size':
+        return [(size, None) for size in sizes]
+    if dimension == 'cover':
+        return [(None, res) for res in resolutions]
+    if dimension == 'both':
+        return [(size, res) for size in sizes for res in resolutions]
+    return [(None, None)]
+
+
+def run_suite(sizes=None, resolutions=None, cases=None, warmup: int = 2, repeat: int = 10,
+              seed: int = 0, log=print) -> dict:
+    """Jalankan semua kasus di grid; return dokumen hasil (siap di-dump sebagai JSON)"""
+    sizes = sizes or DEFAULT_SIZES
+    resolutions = resolutions or DEFAULT_RESOLUTIONS
+    results = []
+    with tempfile.TemporaryDirectory(prefix="kripto_bench_") as workdir:
+        ctx = BenchContext(workdir, seed)
+        for name in cases or CASES:
+            setup, dimension = CASES[name]
+            for size, resolution in _grid(dimension, sizes, resolutions):
+                prepared = setup(ctx, size, resolution)
+                if prepared is None:
+                    continue  # payload tidak muat di cover
+                func, nbytes = prepared
+                stats = summarize(time_op(func, warmup, repeat), nbytes)
+                params = {}
+                if size is not None:
+                    params['size'] = size
+                if resolution is not None:
+                    params['resolution'] = f"{resolution[0]}x{resolution[1]}"
+                results.append({'name': name, 'params': params, 'bytes': nbytes, 'stats': stats})
+                if log:
+                    label = " ".join(f"{k}={v}" for k, v in params.items())
+                    rate = f"{stats['mb_per_s']:9.1f} MB/s" if stats['mb_per_s'] else " " * 14
+                    log(f"{name:<12} {label:<32} median {stats['median_s'] * 1e3:9.3f} ms  {rate}"
+                        f"  {stats['ops_per_s']:10.1f} ops/s")
+
+    return {
+        'meta': environment_info(warmup, repeat, seed),
+        'results': results,
+        'calibration': calibrate(results),
+    }
+
+
+def environment_info(warmup: int, repeat: int, seed: int) -> dict:
+    info = {
+        'time': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'warmup': warmup,
+        'repeat': repeat,
+        'seed': seed,
+    }
+    for module in ('Crypto', 'numpy', 'PIL', 'stegano'):
+        try:
+            info[module] = getattr(__import__(module), '__version__', None)
+        except ImportError:
+            info[module] = None
+    return info
+
+
+# ============================================================================
+# CALIBRATION
+# ============================================================================
+
+def _fit_linear(points: list) -> dict:
+    """Least squares seconds = fixed_s + bytes / (mb_per_s * 1e6)"""
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        return {'fixed_s': statistics.fmean(y for _, y in points), 'mb_per_s': None}
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / sum((x - mean_x) ** 2 for x, _ in points)
+    if slope <= 0:
+        return {'fixed_s': mean_y, 'mb_per_s': None}
+    return {'fixed_s': max(mean_y - slope * mean_x, 0.0), 'mb_per_s': 1.0 / (slope * 1e6)}
+
+
+def calibrate(results: list) -> dict:
+    """Tabel kalibrasi per tahap ENCRYPT_STAGES dari median hasil benchmark"""
+    stages = {}
+    for stage, name in CALIBRATION_SOURCES.items():
+        points = [(r['params'].get('size', r['bytes']), r['stats']['median_s'])
+                  for r in results if r['name'] == name]
+        if points:
+            stages[stage] = _fit_linear(points)
+
+    # Embed: payload terkecil per resolusi (biaya didominasi ukuran cover) + encode PNG
+    embed = {}
+    for r in results:
+        if r['name'] == 'lsb_embed':
+            resolution = r['params']['resolution']
+            if resolution not in embed or r['params']['size'] < embed[resolution][0]:
+                embed[resolution] = (r['params']['size'], r['stats']['median_s'])
+    points = [(r['bytes'], r['stats']['median_s'] + embed[r['params']['resolution']][1])
+              for r in results if r['name'] == 'png_save' and r['params']['resolution'] in embed]
+    if points:
+        stages['embed'] = _fit_linear(points)
+    return {'stages': stages}
+
+
+# ============================================================================
+# COMPARE
+# ============================================================================
+
+def _case_key(result: dict) -> tuple:
+    return result['name'], tuple(sorted(result['params'].items()))
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list:
+    """
+    Bandingkan median per kasus. Status: 'regression' jika lebih lambat dari
+    (1 + threshold) x baseline, 'improvement' jika lebih cepat dengan margin
+    yang sama, selain itu 'ok'. Kasus yang hanya ada di satu sisi: 'new'/'missing'.
+    """
+    base = {_case_key(r): r for r in baseline['results']}
+    rows = []
+    for r in current['results']:
+        key = _case_key(r)
+        old = base.pop(key, None)
+        if old is None:
+            rows.append({'name': r['name'], 'params': r['params'], 'status': 'new', 'ratio': None})
+            continue
+        ratio = r['stats']['median_s'] / old['stats']['median_s']
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({
+            'name': r['name'], 'params': r['params'], 'status': status, 'ratio': ratio,
+            'baseline_median_s': old['stats']['median_s'], 'median_s': r['stats']['median_s'],
+        })
+    for old in base.values():
+        rows.append({'name': old['name'], 'params': old['params'], 'status': 'missing', 'ratio': None})
+    return rows
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _resolution(text: str) -> tuple:
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height or width)
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cmd_run(args) -> int:
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    resolutions = args.resolutions or (QUICK_RESOLUTIONS if args.quick else DEFAULT_RESOLUTIONS)
+    repeat = args.repeat or (5 if args.quick else 10)
+    report = run_suite(sizes, resolutions, args.case, args.warmup, repeat, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"[✓] Hasil disimpan: {args.output}")
+    if args.baseline:
+        return print_comparison(_load(args.baseline), report, args.threshold)
+    return 0
+
+
+def print_comparison(baseline: dict, current: dict, threshold: float) -> int:
+    rows = compare(baseline, current, threshold)
+    marks = {'regression': "✗", 'improvement': "+", 'ok': "✓", 'new': "*", 'missing': "?"}
+    for row in rows:
+        label = " ".join(f"{k}={v}" for k, v in row['params'].items())
+        ratio = f"{row['ratio']:6.2f}x" if row['ratio'] is not None else "      -"
+        print(f"[{marks[row['status']]}] {row['name']:<12} {label:<32} {ratio}  {row['status']}")
+    regressions = sum(row['status'] == 'regression' for row in rows)
+    print(f"[*] {regressions} regresi (ambang {threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def cmd_compare(args) -> int:
+    return print_comparison(_load(args.baseline), _load(args.current), args.threshold)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Pipeline benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="jalankan benchmark")
+    p.add_argument("-o", "--output", help="simpan hasil JSON")
+    p.add_argument("--quick", action="store_true", help="grid kecil, repeat 5")
+    p.add_argument("--sizes", type=int, nargs="+", help="ukuran data (byte)")
+    p.add_argument("--resolutions", type=_resolution, nargs="+", help="resolusi cover, mis. 512x512")
+    p.add_argument("--case", action="append", choices=sorted(CASES), help="hanya kasus ini (boleh berulang)")
+    p.add_argument("--warmup", type=int, default=2)
+    p.add_argument("--repeat", type=int)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--baseline", help="bandingkan langsung dengan baseline JSON")
+    p.add_argument("--threshold", type=float, default=0.10, help="ambang regresi (0.10 = 10%%)")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("compare", help="bandingkan dua hasil JSON")
+    p.add_argument("baseline")
+    p.add_argument("current")
+    p.add_argument("--threshold", type=float, default=0.10, help="ambang regresi (0.10 = 10%%)")
+    p.set_defaults(func=cmd_compare)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+cover_cache.py
+====================================
+LRU cache untuk array pixel cover image yang sudah di-decode.
+
+Workflow yang menyisipkan banyak payload ke beberapa template cover yang sama
+tidak perlu membaca dan men-decode PNG berulang kali. Array yang disimpan
+bersifat read-only; embedder wajib menyalin (copy-on-write) sebelum menulis.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+def decode_cover(path: str):
+    """Decode gambar menjadi array uint8 HxWx3 (RGB) atau HxWx4 (RGBA)"""
+    import numpy as np
+    from PIL import Image
+    
+    with Image.open(path) as img:
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGB")
+        return np.asarray(img, dtype=np.uint8)
+
+
+class CoverCache:
+    """
+    LRU cache array pixel cover, dengan kunci (path, mtime, size) dan batas
+    total ukuran dalam byte. Aman dipakai dari beberapa thread.
+    """
+    
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # path -> ((mtime_ns, size), array)
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, path: str):
+        """Ambil array pixel (read-only) untuk path, decode jika belum ada/berubah"""
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        
+        # Decode di luar lock supaya thread lain tidak ikut menunggu
+        pixels = decode_cover(key)
+        pixels.setflags(write=False)
+        
+        with self._lock:
+            self._discard(key)
+            if pixels.nbytes <= self.max_bytes:
+                self._entries[key] = (signature, pixels)
+                self._current_bytes += pixels.nbytes
+                while self._current_bytes > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._current_bytes -= evicted.nbytes
+                    self.evictions += 1
+        return pixels
+    
+    def invalidate(self, path: str):
+        """Hapus satu entry dari cache"""
+        with self._lock:
+            self._discard(os.path.abspath(path))
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+    
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry[1].nbytes
+
+
+# Cache bersama untuk satu proses
+default_cover_cache = CoverCache()
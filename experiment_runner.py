@@ -0,0 +1,383 @@
+"""
+experiment_runner.py
+====================================
+Grid eksperimen untuk paper: covers x ukuran payload x mode embedding x
+cipher suite, dijalankan paralel di process pool.
+
+Setiap sel menghasilkan satu baris tabel: timing (median dari `repeat`),
+ukuran payload dan pemakaian kapasitas, metrik kualitas (MSE/PSNR/SSIM),
+opsional skor steganalysis dan verifikasi round-trip.
+
+Hasil per sel disimpan di cache_dir dengan kunci hash parameter sel + isi
+file cover, jadi re-run hanya mengerjakan sel baru/berubah (--force untuk
+mengulang semuanya).
+
+CONFIG (JSON, atau YAML jika PyYAML terpasang); path relatif terhadap file config:
+{
+  "covers": ["test_images/"],               file atau folder
+  "payload_sizes": [1024, 4096, 16384],     byte plaintext
+  "modes": ["lsb_array", "stegano", "container"],
+  "suites": ["hybrid", "aes", "plain"],
+  "repeat": 3,
+  "seed": 0,
+  "ssim": true,
+  "steganalysis": false,
+  "verify": true,
+  "workers": null,
+  "output": "results/experiment.csv",
+  "cache_dir": "results/cache",
+  "private_key": "private_key.pem",
+  "public_key": "public_key.pem"
+}
+
+Mode embedding:
+  lsb_array - embedder NumPy (lsb_array.embed_message), format stegano
+  stegano   - stegano.lsb.hide (implementasi referensi)
+  container - stego_container (directory + entry)
+
+Cipher suite (payload ASCII yang disisipkan):
+  hybrid - pipeline lengkap: signature RSA + AES-256-CBC + kunci dibungkus RSA-OAEP
+  aes    - AES-256-CBC saja (Base64), tanpa signature/RSA
+  plain  - Base64 plaintext tanpa enkripsi (baseline)
+
+Run: python experiment_runner.py experiment_example.json
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, NamedTuple
+
+# Naikkan jika cara pengukuran berubah, supaya cache lama tidak dipakai
+RUNNER_VERSION = 2
+
+MODES = ("lsb_array", "stegano", "container")
+SUITES = ("hybrid", "aes", "plain")
+COVER_EXTENSIONS = (".png", ".bmp", ".jpg", ".jpeg", ".tif", ".tiff")
+
+DEFAULT_CONFIG = {
+    'covers': [],
+    'payload_sizes': [1024],
+    'modes': ["lsb_array"],
+    'suites': ["hybrid"],
+    'repeat': 3,
+    'seed': 0,
+    'ssim': True,
+    'steganalysis': False,
+    'verify': True,
+    'workers': None,
+    'output': "experiment_results.csv",
+    'cache_dir': ".experiment_cache",
+    'private_key': "private_key.pem",
+    'public_key': "public_key.pem",
+}
+
+RESULT_FIELDS = (
+    "cover", "payload_size", "mode", "suite", "width", "height",
+    "payload_bytes", "capacity_bytes", "capacity_used", "fits",
+    "suite_s", "embed_s", "save_s", "total_s", "png_bytes",
+    "mse", "psnr", "ssim", "chi2_p", "rs", "verified", "error",
+)
+
+
+class Cell(NamedTuple):
+    cover: str
+    payload_size: int
+    mode: str
+    suite: str
+
+
+# ============================================================================
+# CONFIG
+# ============================================================================
+
+def load_config(path: str) -> dict:
+    """Baca config JSON/YAML dan resolve path relatif terhadap folder config"""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            import yaml
+            raw = yaml.safe_load(f)
+        else:
+            raw = json.load(f)
+
+    unknown = set(raw) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"Key config tidak dikenal: {', '.join(sorted(unknown))}")
+    config = {**DEFAULT_CONFIG, **raw}
+    for name in config['modes']:
+        if name not in MODES:
+            raise ValueError(f"Mode tidak dikenal: {name} (pilihan: {', '.join(MODES)})")
+    for name in config['suites']:
+        if name not in SUITES:
+            raise ValueError(f"Suite tidak dikenal: {name} (pilihan: {', '.join(SUITES)})")
+
+    base = os.path.dirname(os.path.abspath(path))
+    resolve = lambda p: p if os.path.isabs(p) else os.path.join(base, p)
+    config['covers'] = [resolve(p) for p in config['covers']]
+    for key in ('output', 'cache_dir', 'private_key', 'public_key'):
+        config[key] = resolve(config[key])
+    return config
+
+
+def expand_covers(paths: List[str]) -> List[str]:
+    covers = []
+    for path in paths:
+        if os.path.isdir(path):
+            covers.extend(sorted(str(p) for p in Path(path).iterdir() if p.suffix.lower() in COVER_EXTENSIONS))
+        else:
+            covers.append(path)
+    return covers
+
+
+def build_grid(config: dict) -> List[Cell]:
+    return [
+        Cell(cover, size, mode, suite)
+        for cover in expand_covers(config['covers'])
+        for size in config['payload_sizes']
+        for mode in config['modes']
+        for suite in config['suites']
+    ]
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cell_key(cell: Cell, cover_digest: str, config: dict) -> str:
+    """Hash semua yang mempengaruhi hasil sel"""
+    material = {
+        'version': RUNNER_VERSION,
+        'cover': cover_digest,
+        'payload_size': cell.payload_size,
+        'mode': cell.mode,
+        'suite': cell.suite,
+        **{k: config[k] for k in ('repeat', 'seed', 'ssim', 'steganalysis', 'verify')},
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode('utf-8')).hexdigest()[:32]
+
+
+# ============================================================================
+# SUITES & MODES
+# ============================================================================
+
+def _suite_payload(suite: str, plaintext: bytes) -> str:
+    import base64
+    if suite == "hybrid":
+        return _worker_system.build_payload(plaintext)
+    if suite == "aes":
+        engine = _worker_system.security
+        return engine.encrypt_data_aes(plaintext, engine.generate_aes_key())
+    return base64.b64encode(plaintext).decode('ascii')
+
+
+def _embed(mode: str, pixels, payload: str):
+    import numpy as np
+    if mode == "lsb_array":
+        from lsb_array import embed_message
+        return embed_message(pixels, payload)
+    if mode == "stegano":
+        from PIL import Image
+        from stegano import lsb
+        # Dari array cover yang sudah di-decode (RGB/RGBA): tanpa decode ulang per repeat,
+        # dan stegano tidak meminta input() untuk cover grayscale/palette
+        return np.asarray(lsb.hide(Image.fromarray(pixels), payload))
+    import stego_container
+    stego = np.array(pixels, copy=True)
+    directory = stego_container.init_container(stego)
+    stego_container.append_entry(stego, "payload", payload.encode('ascii'), directory)
+    return stego
+
+
+def _extract(mode: str, stego) -> str:
+    if mode == "container":
+        import stego_container
+        return stego_container.read_entry(stego, "payload").decode('ascii')
+    from lsb_array import read_bytes, read_frame_header
+    offset, length = read_frame_header(stego)
+    return read_bytes(stego, offset, length).decode('utf-8')
+
+
+def _capacity_needed(mode: str, payload: str) -> int:
+    if mode == "container":
+        import stego_container
+        return stego_container.HEADER.size + stego_container.SLOT.size * stego_container.DEFAULT_SLOTS + len(payload)
+    return len(str(len(payload))) + 1 + len(payload)
+
+
+# ============================================================================
+# WORKER
+# ============================================================================
+
+_worker_system = None
+
+
+def _init_worker(key_paths: dict):
+    global _worker_system
+    from integrated_system import IntegratedSecuritySystem
+    _worker_system = IntegratedSecuritySystem(**key_paths, verbose=False)
+
+
+def run_cell(cell: Cell, config: dict) -> dict:
+    """
+    Jalankan satu sel grid; error dicatat di kolom 'error', tidak di-raise.
+    Payload yang tidak muat adalah hasil valid (fits=False, tanpa metrik), bukan error.
+    """
+    from PIL import Image
+    from cover_cache import default_cover_cache
+    from lsb_array import capacity_bytes
+
+    row = {**cell._asdict(), 'error': ''}
+    try:
+        pixels = default_cover_cache.get(cell.cover)
+        plaintext = random.Random(f"{config['seed']}:{cell.payload_size}").randbytes(cell.payload_size)
+        row.update({'width': pixels.shape[1], 'height': pixels.shape[0], 'capacity_bytes': capacity_bytes(pixels)})
+
+        timings = {'suite_s': [], 'embed_s': [], 'save_s': [], 'total_s': []}
+        for _ in range(max(1, config['repeat'])):
+            start = time.perf_counter()
+            payload = _suite_payload(cell.suite, plaintext)
+            t_suite = time.perf_counter()
+
+            needed = _capacity_needed(cell.mode, payload)
+            row.update({
+                'payload_bytes': len(payload),
+                'capacity_used': needed / row['capacity_bytes'],
+                'fits': needed <= row['capacity_bytes'],
+            })
+            if not row['fits']:
+                return row
+
+            stego = _embed(cell.mode, pixels, payload)
+            t_embed = time.perf_counter()
+            buffer = io.BytesIO()
+            Image.fromarray(stego).save(buffer, format='PNG')
+            t_save = time.perf_counter()
+
+            timings['suite_s'].append(t_suite - start)
+            timings['embed_s'].append(t_embed - t_suite)
+            timings['save_s'].append(t_save - t_embed)
+            timings['total_s'].append(t_save - start)
+        row.update({name: statistics.median(values) for name, values in timings.items()})
+        row['png_bytes'] = buffer.getbuffer().nbytes
+
+        from image_metrics import compare_arrays
+        quality = compare_arrays(pixels[..., :3], stego[..., :3], ssim=config['ssim'])
+        row.update({k: quality.get(k) for k in ('mse', 'psnr', 'ssim')})
+
+        if config['steganalysis']:
+            from steganalysis import analyze_array
+            scores = analyze_array(stego)
+            row.update({'chi2_p': scores['chi2_p'], 'rs': scores['rs']})
+        if config['verify']:
+            row['verified'] = _extract(cell.mode, stego) == payload
+    except Exception as e:
+        row['error'] = str(e)
+    return row
+
+
+def _run_cell_task(args):
+    cell, config = args
+    return run_cell(cell, config)
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def run_experiment(config: dict, workers: int = None, force: bool = False, log=print) -> List[dict]:
+    """Jalankan semua sel (paralel), pakai cache untuk sel yang sudah ada; return baris urut grid"""
+    from integrated_system import IntegratedSecuritySystem
+
+    grid = build_grid(config)
+    os.makedirs(config['cache_dir'], exist_ok=True)
+    digests = {cover: _file_digest(cover) for cover in {cell.cover for cell in grid} if os.path.exists(cover)}
+
+    rows = {}
+    todo = []
+    for cell in grid:
+        if cell.cover not in digests:
+            rows[cell] = {**cell._asdict(), 'error': "Cover tidak ditemukan"}
+            continue
+        path = os.path.join(config['cache_dir'], cell_key(cell, digests[cell.cover], config) + ".json")
+        if not force and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                rows[cell] = json.load(f)
+        else:
+            todo.append((cell, path))
+
+    if log:
+        log(f"[*] {len(grid)} sel: {len(rows)} dari cache, {len(todo)} dijalankan")
+
+    if todo:
+        key_paths = {
+            'sender_private_key_path': config['private_key'],
+            'sender_public_key_path': config['public_key'],
+            'receiver_public_key_path': config['public_key'],
+            'receiver_private_key_path': config['private_key'],
+        }
+        # Pastikan kunci sudah ada sebelum worker dibuat
+        IntegratedSecuritySystem(**key_paths, verbose=False)
+        workers = workers or config['workers']
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(key_paths,)) as pool:
+            futures = {pool.submit(_run_cell_task, (cell, config)): (cell, path) for cell, path in todo}
+            for done, future in enumerate(as_completed(futures), 1):
+                cell, path = futures[future]
+                row = future.result()
+                rows[cell] = row
+                if not row['error']:
+                    tmp = path + ".tmp"
+                    with open(tmp, "w", encoding="utf-8") as f:
+                        json.dump(row, f)
+                    os.replace(tmp, path)
+                if log:
+                    if row['error']:
+                        status = row['error']
+                    elif not row['fits']:
+                        status = f"tidak muat ({row['capacity_used']:.0%} kapasitas)"
+                    else:
+                        status = f"{row['total_s'] * 1e3:.1f} ms, PSNR {row['psnr']:.2f} dB"
+                    log(f"[{done}/{len(todo)}] {Path(cell.cover).name} {cell.payload_size}B "
+                        f"{cell.mode}/{cell.suite}: {status}")
+
+    return [rows[cell] for cell in grid]
+
+
+def main(argv=None):
+    from image_metrics import write_table
+
+    parser = argparse.ArgumentParser(description="Experiment grid runner")
+    parser.add_argument("config", help="file config JSON/YAML")
+    parser.add_argument("--workers", type=int, help="menimpa 'workers' di config")
+    parser.add_argument("-o", "--output", help="menimpa 'output' di config (.csv atau .parquet)")
+    parser.add_argument("--force", action="store_true", help="abaikan cache, jalankan semua sel")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    output = args.output or config['output']
+    if os.path.dirname(output):
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+
+    start = time.perf_counter()
+    rows = run_experiment(config, args.workers, args.force)
+    write_table(output, rows, RESULT_FIELDS)
+    failed = sum(bool(row['error']) for row in rows)
+    oversized = sum(row.get('fits') is False for row in rows)
+    print(f"[✓] {len(rows)} baris ditulis ke {output} ({oversized} tidak muat, {failed} error, "
+          f"{time.perf_counter() - start:.1f}s)")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+extraction_cache.py
+====================================
+Cache hasil ekstraksi + verifikasi untuk stego image yang dibuka berulang.
+
+Kunci cache: BLAKE2b dari bidang LSB (bit terendah kanal RGB, di-pack)
+gambar yang sudah di-decode + fingerprint kunci privat (unwrap) dan kunci
+publik (verify). Gambar yang di-rename, di-copy, atau di-encode ulang tanpa
+mengubah LSB tetap cache hit; perubahan satu bit LSB = cache miss.
+
+Yang disimpan: ciphertext AES hasil ekstraksi, kunci AES yang sudah
+di-unwrap, dan verdict signature. Plaintext TIDAK disimpan, jadi open
+berikutnya hanya perlu decrypt AES (tanpa ekstraksi LSB, unwrap RSA dan
+verify). Cache hanya di memori proses dan tidak pernah ditulis ke disk.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from payload_cache import key_fingerprint
+
+
+class ExtractionEntry(NamedTuple):
+    ciphertext: str      # Base64(IV + AES-CBC(combined))
+    aes_key: bytes
+    signature_valid: bool
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.ciphertext) + len(self.aes_key)
+
+
+def lsb_digest(pixels) -> str:
+    """BLAKE2b (128-bit) dari bidang LSB kanal RGB (alpha diabaikan, seperti stegano)"""
+    import numpy as np
+    plane = np.packbits(pixels[..., :3] & 1)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(pixels.shape[:2]).encode('ascii'))
+    digest.update(plane)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    LRU cache ExtractionEntry dengan batas total ukuran dalam byte.
+    Aman dipakai dari beberapa thread.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> ExtractionEntry
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def make_key(self, pixels, private_key_path: str, public_key_path: str) -> tuple:
+        return lsb_digest(pixels), key_fingerprint(private_key_path), key_fingerprint(public_key_path)
+
+    def get(self, key: tuple) -> Optional[ExtractionEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple, entry: ExtractionEntry):
+        with self._lock:
+            self._discard(key)
+            if entry.nbytes > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._current_bytes += entry.nbytes
+            while self._current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def invalidate(self, key: tuple):
+        """Hapus satu entry dari cache"""
+        with self._lock:
+            self._discard(key)
+
+    def invalidate_image(self, stego_image_path: str) -> int:
+        """Hapus semua entry untuk gambar ini (apa pun kuncinya); return jumlah yang dihapus"""
+        from cover_cache import decode_cover
+        digest = lsb_digest(decode_cover(stego_image_path))
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == digest]
+            for key in keys:
+                self._discard(key)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry.nbytes
@@ -7,29 +7,29 @@ Run: python generate_keys.py
 
 from Crypto.PublicKey import RSA
 
-def generate_keypair():
-    """Generate RSA keypair (2048 bit)"""
-    print("[*] Generating RSA keypair (2048 bit)...")
+def generate_keypair(private_key_path="private_key.pem", public_key_path="public_key.pem", bits=2048):
+    """Generate RSA keypair (default 2048 bit)"""
+    print(f"[*] Generating RSA keypair ({bits} bit)...")
     
     # Generate private key
-    private_key = RSA.generate(2048)
+    private_key = RSA.generate(bits)
     
     # Generate public key from private key
     public_key = private_key.publickey()
     
     # Save private key
-    with open("private_key.pem", "wb") as f:
+    with open(private_key_path, "wb") as f:
         f.write(private_key.export_key())
-    print("[+] Private key saved: private_key.pem")
+    print(f"[+] Private key saved: {private_key_path}")
     
     # Save public key
-    with open("public_key.pem", "wb") as f:
+    with open(public_key_path, "wb") as f:
         f.write(public_key.export_key())
-    print("[+] Public key saved: public_key.pem")
+    print(f"[+] Public key saved: {public_key_path}")
     
     print("\n✅ RSA keypair generated successfully!")
-    print("⚠️  Keep private_key.pem SECRET!")
-    print("📤 You can share public_key.pem")
+    print(f"⚠️  Keep {private_key_path} SECRET!")
+    print(f"📤 You can share {public_key_path}")
 
 if __name__ == "__main__":
     generate_keypair()
\ No newline at end of file
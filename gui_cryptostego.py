@@ -5,23 +5,48 @@ GUI Application for Integrated Cryptography and Steganography System
 """
 
 try:
-    from integrated_system import IntegratedSecuritySystem
-    from rsa_manager import RSAManager
+    from integrated_system import (
+        IntegratedSecuritySystem, OperationCancelled, ENCRYPT_STAGES, DECRYPT_STAGES
+    )
+    import queue
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
     import tkinter as tk
     from tkinter import filedialog, messagebox, ttk
     from pathlib import Path
-    from PIL import Image, ImageTk  # ← TAMBAHKAN INI
     import os  # ← Pastikan ini juga ada
 except ImportError as e:
     print(f"ERROR: {str(e)}")
     print("Pastikan file ada:")
     print("- rsa_manager.py")
-    print("- hello.py") 
+    print("- aes_stego_manager.py")
     print("- integrated_system.py")
     print("- Pillow library (pip install pillow)")
     exit(1)
 
 
+# Label progress untuk setiap tahap pipeline
+STAGE_LABELS = {
+    "read": "Membaca file",
+    "sign": "Membuat digital signature",
+    "combine": "Menggabungkan data + signature",
+    "encrypt": "Enkripsi AES",
+    "wrap": "Enkripsi kunci AES dengan RSA",
+    "package": "Menyiapkan payload",
+    "embed": "Menyembunyikan data & menyimpan gambar",
+    "extract": "Mengekstrak data dari gambar",
+    "parse": "Parsing payload",
+    "unwrap": "Dekripsi kunci AES",
+    "decrypt": "Dekripsi AES",
+    "split": "Memisahkan plaintext & signature",
+    "verify": "Verifikasi signature",
+    "write": "Menyimpan file",
+}
+
+POLL_INTERVAL_MS = 100
+PREVIEW_SIZE = (450, 250)
+
+
 class CryptoStegoGUI:
     """
     GUI Application untuk Sistem Kriptografi dan Steganografi Terintegrasi
@@ -51,11 +76,31 @@ class CryptoStegoGUI:
         self.cover_image_preview = None
         self.stego_image_preview = None
         
+        # Background job: satu worker thread, hasil dikirim lewat queue dan di-poll dengan after()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.job_events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.job_running = False
+        
+        # Preview di-decode di thread terpisah agar tidak antre di belakang job
+        self.preview_executor = ThreadPoolExecutor(max_workers=1)
+        self.preview_cache = None
+        
+        # Batch queue (tab 3)
+        self.batch_inputs = []
+        self.batch_covers = []
+        self.batch_output_dir = tk.StringVar()
+        self.batch_runner = None
+        self.batch_next_id = 0
+        
         # Initialize crypto system
         self.setup_crypto_system()
         
         # Build UI
         self.build_ui()
+        
+        # Load pycryptodome/stegano dan cek/generate kunci di background
+        self.start_warm_up()
     
     def setup_crypto_system(self):
         """Initialize cryptography system"""
@@ -66,12 +111,13 @@ class CryptoStegoGUI:
             self.receiver_private = "private_key.pem"
             self.receiver_public = "public_key.pem"
             
-            # Initialize system
+            # Initialize system (setup kunci ditunda ke start_warm_up)
             self.crypto_system = IntegratedSecuritySystem(
                 sender_private_key_path=self.sender_private,
                 sender_public_key_path=self.sender_public,
                 receiver_public_key_path=self.receiver_public,
-                receiver_private_key_path=self.receiver_private
+                receiver_private_key_path=self.receiver_private,
+                defer_key_setup=True
             )
             
             print("[✓] Crypto system initialized")
@@ -125,10 +171,36 @@ class CryptoStegoGUI:
         self.notebook.add(self.decrypt_frame, text="  🔓 Extract & Decrypt  ")
         self.build_decrypt_tab()
         
+        # Tab 3: Batch Queue
+        self.batch_frame = tk.Frame(self.notebook, bg=self.bg_color)
+        self.notebook.add(self.batch_frame, text="  📦 Batch Queue  ")
+        self.build_batch_tab()
+        
+        # ========== PROGRESS ==========
+        progress_frame = tk.Frame(self.root, bg=self.bg_color)
+        progress_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 5))
+        
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', maximum=len(ENCRYPT_STAGES))
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        
+        self.cancel_button = tk.Button(
+            progress_frame,
+            text="✖ Cancel",
+            command=self.cancel_job,
+            bg=self.error_color,
+            fg="white",
+            font=("Segoe UI", 10, "bold"),
+            cursor="hand2",
+            relief=tk.FLAT,
+            padx=15,
+            state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.LEFT)
+        
         # ========== STATUS BAR ==========
         self.status_bar = tk.Label(
             self.root,
-            text="Ready | RSA Keys: Loaded ✓",
+            text="Loading | RSA Keys: checking...",
             bd=1,
             relief=tk.SUNKEN,
             anchor=tk.W,
@@ -253,7 +325,7 @@ class CryptoStegoGUI:
         action_section = tk.Frame(self.encrypt_frame, bg=self.bg_color)
         action_section.pack(fill=tk.X, padx=20, pady=20)
         
-        tk.Button(
+        self.encrypt_button = tk.Button(
             action_section,
             text="🚀 Encrypt and Hide in Image",
             command=self.encrypt_and_hide,
@@ -263,7 +335,8 @@ class CryptoStegoGUI:
             height=2,
             cursor="hand2",
             relief=tk.FLAT
-        ).pack(fill=tk.X)
+        )
+        self.encrypt_button.pack(fill=tk.X)
     
     def build_decrypt_tab(self):
         """Build extraction and decryption interface"""
@@ -379,7 +452,7 @@ class CryptoStegoGUI:
         action_section = tk.Frame(self.decrypt_frame, bg=self.bg_color)
         action_section.pack(fill=tk.X, padx=20, pady=20)
         
-        tk.Button(
+        self.decrypt_button = tk.Button(
             action_section,
             text="🔓 Extract and Decrypt",
             command=self.extract_and_decrypt,
@@ -389,7 +462,126 @@ class CryptoStegoGUI:
             height=2,
             cursor="hand2",
             relief=tk.FLAT
-        ).pack(fill=tk.X)
+        )
+        self.decrypt_button.pack(fill=tk.X)
+    
+    def build_batch_tab(self):
+        """Build batch queue interface"""
+        
+        # ========== SECTION 1: Queue Jobs ==========
+        queue_section = tk.LabelFrame(
+            self.batch_frame,
+            text="  1️⃣  Queue Files, Covers & Output Folder  ",
+            font=("Segoe UI", 13, "bold"),
+            bg=self.bg_color,
+            fg=self.dark_color,
+            padx=20,
+            pady=10
+        )
+        queue_section.pack(fill=tk.X, padx=20, pady=10)
+        
+        button_frame = tk.Frame(queue_section, bg=self.bg_color)
+        button_frame.pack(fill=tk.X)
+        
+        for text, command in (
+            ("📄 Add Files", self.batch_add_files),
+            ("📁 Add Folder", self.batch_add_folder),
+            ("🖼️  Cover File", self.batch_select_cover_file),
+            ("🗂️  Cover Folder", self.batch_select_cover_folder),
+            ("💾 Output Folder", self.batch_select_output_dir),
+        ):
+            tk.Button(
+                button_frame,
+                text=text,
+                command=command,
+                bg=self.accent_color,
+                fg="white",
+                font=("Segoe UI", 10, "bold"),
+                cursor="hand2",
+                relief=tk.FLAT,
+                padx=10,
+                pady=4
+            ).pack(side=tk.LEFT, padx=(0, 8))
+        
+        self.batch_info_label = tk.Label(
+            queue_section,
+            text="Belum ada file di antrian",
+            bg=self.bg_color,
+            font=("Segoe UI", 10),
+            fg=self.dark_color,
+            anchor=tk.W,
+            justify=tk.LEFT
+        )
+        self.batch_info_label.pack(fill=tk.X, pady=(8, 0))
+        
+        # ========== SECTION 2: Jobs ==========
+        jobs_section = tk.LabelFrame(
+            self.batch_frame,
+            text="  2️⃣  Jobs  ",
+            font=("Segoe UI", 13, "bold"),
+            bg=self.bg_color,
+            fg=self.dark_color,
+            padx=20,
+            pady=10
+        )
+        jobs_section.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+        
+        columns = ("file", "cover", "status", "progress", "time")
+        self.batch_tree = ttk.Treeview(jobs_section, columns=columns, show="headings", height=8)
+        for column, heading, width in (
+            ("file", "File", 230), ("cover", "Cover", 160), ("status", "Status", 90),
+            ("progress", "Progress", 180), ("time", "Time (s)", 70),
+        ):
+            self.batch_tree.heading(column, text=heading)
+            self.batch_tree.column(column, width=width, anchor=tk.W)
+        
+        scrollbar = ttk.Scrollbar(jobs_section, orient=tk.VERTICAL, command=self.batch_tree.yview)
+        self.batch_tree.configure(yscrollcommand=scrollbar.set)
+        self.batch_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.LEFT, fill=tk.Y)
+        
+        # ========== ACTION SECTION ==========
+        action_section = tk.Frame(self.batch_frame, bg=self.bg_color)
+        action_section.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        self.batch_start_button = tk.Button(
+            action_section,
+            text="🚀 Start Batch",
+            command=self.batch_start,
+            bg=self.success_color,
+            fg="white",
+            font=("Segoe UI", 12, "bold"),
+            cursor="hand2",
+            relief=tk.FLAT,
+            padx=15
+        )
+        self.batch_start_button.pack(side=tk.LEFT, padx=(0, 8))
+        
+        for text, command, color in (
+            ("✖ Cancel", self.batch_cancel, self.error_color),
+            ("🧹 Clear", self.batch_clear, self.dark_color),
+            ("📊 Export Report", self.batch_export_report, self.accent_color),
+        ):
+            tk.Button(
+                action_section,
+                text=text,
+                command=command,
+                bg=color,
+                fg="white",
+                font=("Segoe UI", 12, "bold"),
+                cursor="hand2",
+                relief=tk.FLAT,
+                padx=15
+            ).pack(side=tk.LEFT, padx=(0, 8))
+        
+        self.batch_summary_label = tk.Label(
+            action_section,
+            text="",
+            bg=self.bg_color,
+            font=("Segoe UI", 10),
+            fg=self.dark_color
+        )
+        self.batch_summary_label.pack(side=tk.LEFT, padx=10)
     
     # ========== EVENT HANDLERS ==========
     
@@ -453,24 +645,50 @@ class CryptoStegoGUI:
             self.update_status(f"Output akan disimpan sebagai: {Path(filename).name}")
     
     def display_image_preview(self, image_path, label_widget):
-        """Display image preview in label"""
+        """Display image preview in label (decode di background thread)"""
+        if self.preview_cache is None:
+            from image_preview import PreviewCache
+            self.preview_cache = PreviewCache()
+        
+        label_widget.preview_path = image_path
+        label_widget.configure(
+            text=f"Loading preview...\n\n{Path(image_path).name}",
+            image="",
+            fg="gray"
+        )
+        future = self.preview_executor.submit(self.preview_cache.get, image_path)
+        self.root.after(POLL_INTERVAL_MS, self.poll_preview, future, image_path, label_widget)
+    
+    def poll_preview(self, future, image_path, label_widget):
+        """Tampilkan preview setelah selesai di-decode"""
+        if not future.done():
+            self.root.after(POLL_INTERVAL_MS, self.poll_preview, future, image_path, label_widget)
+            return
+        
+        # Abaikan hasil jika user sudah memilih gambar lain
+        if getattr(label_widget, "preview_path", None) != image_path:
+            return
+        
         try:
-            img = Image.open(image_path)
+            from PIL import ImageTk
             
-            # Get image info
-            width, height = img.size
-            img_info = f"{width}x{height} px"
-            
-            # Resize for preview
-            img.thumbnail((450, 250))
-            photo = ImageTk.PhotoImage(img)
-            
-            label_widget.configure(image=photo, text="")
-            label_widget.image = photo  # Keep reference
+            thumb, info = future.result()
+            photo = ImageTk.PhotoImage(thumb)
             
             # Show image info below preview
-            info_text = f"\n{Path(image_path).name}\nSize: {img_info}"
-            # Create compound label with image and text
+            info_text = (
+                f"{Path(image_path).name}  |  {info['width']}x{info['height']} px  |  "
+                f"Kapasitas LSB: {info['capacity_bytes'] / 1024:.1f} KB"
+            )
+            label_widget.configure(
+                image=photo,
+                text=info_text,
+                compound=tk.TOP,
+                fg=self.dark_color,
+                width=PREVIEW_SIZE[0],
+                height=PREVIEW_SIZE[1] + 20
+            )
+            label_widget.image = photo  # Keep reference
             
         except Exception as e:
             label_widget.configure(
@@ -506,16 +724,25 @@ class CryptoStegoGUI:
             output_path = output_path.rsplit('.', 1)[0] + '.png'
             messagebox.showinfo("Info", "Output file akan disimpan sebagai PNG (required untuk LSB)")
         
-        # Perform encryption
+        # Perform encryption (di background thread)
         self.update_status("🔄 Encrypting and hiding data... Please wait...")
-        self.root.update()
-        
-        try:
-            success, message = self.crypto_system.encrypt_and_hide(
+        self.start_job(
+            self.crypto_system.encrypt_and_hide,
+            dict(
                 plaintext_file_path=self.plaintext_file_path.get(),
                 cover_image_path=self.cover_image_path.get(),
                 output_image_path=output_path
-            )
+            ),
+            ENCRYPT_STAGES,
+            self.on_encrypt_done
+        )
+    
+    def on_encrypt_done(self, result):
+        """Dipanggil di main thread setelah job enkripsi selesai"""
+        try:
+            if isinstance(result, Exception):
+                raise result
+            success, message = result
             
             if success:
                 messagebox.showinfo("Success! ✓", 
@@ -542,15 +769,24 @@ class CryptoStegoGUI:
             messagebox.showwarning("Warning", "Silakan tentukan lokasi output file!")
             return
         
-        # Perform decryption
+        # Perform decryption (di background thread)
         self.update_status("🔄 Extracting and decrypting data... Please wait...")
-        self.root.update()
-        
-        try:
-            success, message = self.crypto_system.extract_and_decrypt(
+        self.start_job(
+            self.crypto_system.extract_and_decrypt,
+            dict(
                 stego_image_path=self.stego_image_path.get(),
                 output_file_path=self.output_file_path.get()
-            )
+            ),
+            DECRYPT_STAGES,
+            self.on_decrypt_done
+        )
+    
+    def on_decrypt_done(self, result):
+        """Dipanggil di main thread setelah job dekripsi selesai"""
+        try:
+            if isinstance(result, Exception):
+                raise result
+            success, message = result
             
             if success:
                 messagebox.showinfo("Success! ✓", f"{message}")
@@ -573,6 +809,248 @@ class CryptoStegoGUI:
             messagebox.showerror("Error", f"Unexpected error:\n{str(e)}")
             self.update_status("✗ Error occurred!")
     
+    # ========== BATCH QUEUE ==========
+    
+    def batch_add_files(self):
+        filenames = filedialog.askopenfilenames(title="Add Files to Batch", initialdir="test_files")
+        if filenames:
+            self.batch_inputs.extend(filenames)
+            self.batch_refresh_info()
+    
+    def batch_add_folder(self):
+        folder = filedialog.askdirectory(title="Add Folder to Batch")
+        if folder:
+            self.batch_inputs.append(folder)
+            self.batch_refresh_info()
+    
+    def batch_select_cover_file(self):
+        filename = filedialog.askopenfilename(
+            title="Select Cover Image",
+            initialdir="test_images",
+            filetypes=[("Image Files", "*.png *.jpg *.jpeg")]
+        )
+        if filename:
+            self.batch_covers = [filename]
+            self.batch_refresh_info()
+    
+    def batch_select_cover_folder(self):
+        folder = filedialog.askdirectory(title="Select Cover Folder (dipakai bergiliran)")
+        if folder:
+            from batch_runner import list_covers
+            self.batch_covers = list_covers(folder)
+            self.batch_refresh_info()
+    
+    def batch_select_output_dir(self):
+        folder = filedialog.askdirectory(title="Select Output Folder")
+        if folder:
+            self.batch_output_dir.set(folder)
+            self.batch_refresh_info()
+    
+    def batch_refresh_info(self):
+        self.batch_info_label.config(
+            text=f"Antrian: {len(self.batch_inputs)} file/folder  |  "
+                 f"Cover: {len(self.batch_covers)}  |  "
+                 f"Output: {self.batch_output_dir.get() or '-'}"
+        )
+    
+    def batch_start(self):
+        """Plan job dari antrian lalu jalankan di process pool"""
+        if not self.batch_inputs:
+            messagebox.showwarning("Warning", "Antrian batch masih kosong!")
+            return
+        if not self.batch_covers:
+            messagebox.showwarning("Warning", "Silakan pilih cover image atau folder cover!")
+            return
+        if not self.batch_output_dir.get():
+            messagebox.showwarning("Warning", "Silakan pilih output folder!")
+            return
+        
+        from batch_runner import BatchRunner, plan_folder_jobs
+        
+        jobs = plan_folder_jobs(self.batch_inputs, self.batch_covers,
+                                self.batch_output_dir.get(), first_id=self.batch_next_id)
+        if not jobs:
+            messagebox.showwarning("Warning", "Tidak ada file di folder yang dipilih!")
+            return
+        self.batch_next_id += len(jobs)
+        self.batch_inputs = []
+        self.batch_refresh_info()
+        
+        for job in jobs:
+            self.batch_tree.insert("", tk.END, iid=str(job.job_id), values=(
+                Path(job.plaintext_path).name, Path(job.cover_path).name, "queued", self.progress_text(0, 1), ""
+            ))
+        
+        if self.batch_runner is None:
+            self.batch_runner = BatchRunner(
+                sender_private_key_path=self.sender_private,
+                sender_public_key_path=self.sender_public,
+                receiver_public_key_path=self.receiver_public,
+                receiver_private_key_path=self.receiver_private
+            )
+        polling = self.batch_runner.pending > 0
+        self.batch_runner.start(jobs)
+        self.update_status(f"🔄 Batch: {len(jobs)} job dimulai")
+        if not polling:
+            self.root.after(POLL_INTERVAL_MS, self.batch_poll)
+    
+    @staticmethod
+    def progress_text(step, total, width=12):
+        filled = int(width * step / total)
+        return "█" * filled + "░" * (width - filled) + f" {100 * step // total}%"
+    
+    def batch_poll(self):
+        """Update tabel dari event BatchRunner; dijadwalkan ulang selama masih ada job"""
+        runner = self.batch_runner
+        if runner is None:
+            return
+        
+        for event in runner.poll():
+            iid = str(event[1])
+            if not self.batch_tree.exists(iid):
+                continue
+            if event[0] == "progress":
+                if runner.results[event[1]]['status'] != 'running':
+                    continue  # event terlambat dari job yang sudah selesai
+                _, _, stage, step, total = event
+                self.batch_tree.set(iid, "status", stage)
+                self.batch_tree.set(iid, "progress", self.progress_text(step - 1, total))
+            else:
+                _, _, success, message, seconds = event
+                result = runner.results[event[1]]
+                self.batch_tree.set(iid, "status", result['status'])
+                if success:
+                    self.batch_tree.set(iid, "progress", self.progress_text(1, 1))
+                self.batch_tree.set(iid, "time", f"{seconds:.2f}" if seconds is not None else "")
+        
+        summary = runner.summary()
+        self.batch_summary_label.config(
+            text=f"✓ {summary['ok']}  ✗ {summary['failed']}  ⏹ {summary['cancelled']}  / {summary['jobs']}"
+                 f"  |  {summary['jobs_per_s']:.2f} job/s"
+        )
+        
+        if runner.pending:
+            self.root.after(POLL_INTERVAL_MS, self.batch_poll)
+        else:
+            self.update_status("✓ Batch selesai")
+    
+    def batch_cancel(self):
+        if self.batch_runner is not None and self.batch_runner.pending:
+            self.batch_runner.cancel()
+            self.update_status("⏹ Membatalkan batch...")
+    
+    def batch_clear(self):
+        if self.batch_runner is not None and self.batch_runner.pending:
+            messagebox.showwarning("Warning", "Batch masih berjalan!")
+            return
+        self.batch_inputs = []
+        self.batch_tree.delete(*self.batch_tree.get_children())
+        if self.batch_runner is not None:
+            self.batch_runner.results.clear()
+        self.batch_summary_label.config(text="")
+        self.batch_refresh_info()
+    
+    def batch_export_report(self):
+        if self.batch_runner is None or not self.batch_runner.results:
+            messagebox.showwarning("Warning", "Belum ada hasil batch!")
+            return
+        filename = filedialog.asksaveasfilename(
+            title="Export Batch Report",
+            defaultextension=".csv",
+            initialfile="batch_report.csv",
+            filetypes=[("CSV Files", "*.csv"), ("JSON Files", "*.json")]
+        )
+        if filename:
+            from batch_runner import write_report
+            write_report(filename, list(self.batch_runner.results.values()), self.batch_runner.summary())
+            self.update_status(f"Report disimpan: {Path(filename).name}")
+    
+    # ========== BACKGROUND JOBS ==========
+    
+    def start_warm_up(self):
+        """Import dependency berat dan cek/generate kunci RSA di worker thread"""
+        future = self.executor.submit(self.crypto_system.warm_up)
+        self.root.after(POLL_INTERVAL_MS, self.poll_warm_up, future)
+    
+    def poll_warm_up(self, future):
+        if not future.done():
+            self.root.after(POLL_INTERVAL_MS, self.poll_warm_up, future)
+        elif future.exception() is not None:
+            self.status_bar.config(text=f"✗ Gagal menyiapkan kunci RSA: {future.exception()}")
+        elif not self.job_running:
+            self.status_bar.config(text="Ready | RSA Keys: Loaded ✓")
+    
+    def start_job(self, func, kwargs, stages, on_done):
+        """Jalankan func(**kwargs, progress=...) di worker thread"""
+        if self.job_running:
+            messagebox.showwarning("Warning", "Masih ada proses yang berjalan!")
+            return
+        
+        self.job_running = True
+        self.cancel_event.clear()
+        self.progress_bar.configure(maximum=len(stages), value=0)
+        self.encrypt_button.configure(state=tk.DISABLED)
+        self.decrypt_button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.NORMAL)
+        
+        def run():
+            try:
+                result = func(**kwargs, progress=self.report_progress)
+            except Exception as e:
+                result = e
+            self.job_events.put(("done", result))
+        
+        self.executor.submit(run)
+        self.root.after(POLL_INTERVAL_MS, self.poll_job, on_done)
+    
+    def report_progress(self, stage, step, total):
+        """Callback progress dari worker thread (jangan sentuh widget Tk di sini)"""
+        if self.cancel_event.is_set():
+            raise OperationCancelled()
+        self.job_events.put(("progress", (stage, step, total)))
+    
+    def poll_job(self, on_done):
+        """Ambil event dari worker thread; dijadwalkan ulang dengan after() sampai selesai"""
+        while True:
+            try:
+                kind, data = self.job_events.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == "progress":
+                stage, step, total = data
+                self.progress_bar.configure(value=step - 1)
+                self.status_bar.config(text=f"🔄 [{step}/{total}] {STAGE_LABELS.get(stage, stage)}...")
+            else:
+                self.finish_job()
+                on_done(data)
+                return
+        
+        self.root.after(POLL_INTERVAL_MS, self.poll_job, on_done)
+    
+    def finish_job(self):
+        self.job_running = False
+        self.progress_bar.configure(value=self.progress_bar.cget('maximum'))
+        self.encrypt_button.configure(state=tk.NORMAL)
+        self.decrypt_button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED)
+    
+    def cancel_job(self):
+        """Minta pembatalan; berlaku di batas tahap berikutnya"""
+        if self.job_running:
+            self.cancel_event.set()
+            self.cancel_button.configure(state=tk.DISABLED)
+            self.status_bar.config(text="⏹ Membatalkan... (menunggu tahap saat ini selesai)")
+    
+    def on_close(self):
+        """Batalkan job yang berjalan lalu tutup window"""
+        self.cancel_event.set()
+        self.executor.shutdown(wait=False)
+        self.preview_executor.shutdown(wait=False)
+        if self.batch_runner is not None:
+            self.batch_runner.shutdown()
+        self.root.destroy()
+    
     def update_status(self, message):
         """Update status bar"""
         self.status_bar.config(text=message)
@@ -583,6 +1061,7 @@ def main():
     """Main entry point"""
     root = tk.Tk()
     app = CryptoStegoGUI(root)
+    root.protocol("WM_DELETE_WINDOW", app.on_close)
     
     # Center window on screen
     root.update_idletasks()
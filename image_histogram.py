@@ -0,0 +1,259 @@
+"""
+image_histogram.py
+====================================
+Histogram RGB cepat untuk korpus cover/stego.
+
+- Ketiga kanal dihitung sekali jalan: nilai kanal digeser (R+0, G+256,
+  B+512) lalu satu np.bincount dengan minlength 768.
+- HistogramCache menyimpan hasil di disk (.npy) dengan kunci hash isi file
+  gambar (BLAKE2b), jadi gambar yang sama tidak di-decode ulang walau
+  dipindah/di-rename.
+- histogram_diff: statistik perbedaan cover vs stego per kanal.
+- HistogramPlotter: satu Figure Agg (tanpa pyplot/GUI) yang dipakai ulang
+  untuk semua plot; garis hanya di-update datanya.
+
+Run: python image_histogram.py covers/ stegos/ --csv hist_diff.csv --plots plots/
+     python image_histogram.py covers/ stegos/ --csv hist_diff.csv     (tanpa plot)
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+CHANNELS = ("r", "g", "b")
+CHANNEL_COLORS = ("red", "green", "blue")
+BINS = 256
+HASH_CHUNK = 1024 * 1024
+
+DIFF_FIELDS = (
+    ["cover", "stego"]
+    + [f"{stat}_{c}" for stat in ("l1", "max_bin_diff", "chi2", "intersection", "pov_change") for c in CHANNELS]
+)
+
+
+def compute_histogram(pixels):
+    """Histogram (3, 256) int64 untuk array uint8 HxWx3/4 (alpha diabaikan), satu kali bincount"""
+    import numpy as np
+
+    rgb = pixels[..., :3].reshape(-1, 3)
+    offsets = np.arange(3, dtype=np.uint16) * BINS
+    indices = (rgb.astype(np.uint16) + offsets).ravel()
+    return np.bincount(indices, minlength=3 * BINS).reshape(3, BINS)
+
+
+def file_digest(path: str) -> str:
+    """BLAKE2b (128-bit) dari isi file, dibaca per chunk"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class HistogramCache:
+    """
+    Cache histogram di disk: <cache_dir>/<hash[:2]>/<hash>.npy.
+    Tulis atomik (file sementara + os.replace), aman dipakai beberapa proses.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.npy")
+
+    def load(self, digest: str):
+        import numpy as np
+        try:
+            return np.load(self._path(digest))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def store(self, digest: str, histogram):
+        import numpy as np
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, histogram)
+        os.replace(tmp, path)
+
+    def invalidate(self, digest: str):
+        try:
+            os.remove(self._path(digest))
+        except FileNotFoundError:
+            pass
+
+    def histogram(self, image_path: str):
+        """Histogram image_path dari cache, atau hitung dan simpan"""
+        digest = file_digest(image_path)
+        histogram = self.load(digest)
+        if histogram is None:
+            from cover_cache import decode_cover
+            histogram = compute_histogram(decode_cover(image_path))
+            self.store(digest, histogram)
+        return histogram
+
+
+def image_histogram(image_path: str, cache: Optional[HistogramCache] = None):
+    """Histogram satu gambar, lewat cache jika diberikan"""
+    if cache is not None:
+        return cache.histogram(image_path)
+    from cover_cache import decode_cover
+    return compute_histogram(decode_cover(image_path))
+
+
+def histogram_diff(cover_hist, stego_hist) -> dict:
+    """
+    Statistik perbedaan per kanal:
+      l1           - jumlah |selisih| per bin
+      max_bin_diff - selisih terbesar pada satu bin
+      chi2         - jarak chi-square simetris
+      intersection - irisan histogram ternormalisasi (1.0 = identik)
+      pov_change   - perubahan ketidakseimbangan pasangan nilai (2k, 2k+1);
+                     LSB embedding cenderung menyamakan pasangan (nilai negatif)
+    """
+    import numpy as np
+
+    cover = cover_hist.astype(np.float64)
+    stego = stego_hist.astype(np.float64)
+    diff = np.abs(cover - stego)
+    total = np.sum(cover + stego, axis=1)
+    chi2 = np.sum(np.divide(diff ** 2, cover + stego, out=np.zeros_like(diff), where=(cover + stego) > 0), axis=1)
+    intersection = np.sum(np.minimum(cover, stego), axis=1) / np.maximum(np.sum(cover, axis=1), 1)
+
+    def pov_imbalance(h):
+        return np.sum(np.abs(h[:, 0::2] - h[:, 1::2]), axis=1) / np.maximum(np.sum(h, axis=1), 1)
+
+    pov_change = pov_imbalance(stego) - pov_imbalance(cover)
+    stats = {}
+    for c, name in enumerate(CHANNELS):
+        stats[f'l1_{name}'] = float(diff[c].sum())
+        stats[f'max_bin_diff_{name}'] = float(diff[c].max())
+        stats[f'chi2_{name}'] = float(chi2[c]) if total[c] else 0.0
+        stats[f'intersection_{name}'] = float(intersection[c])
+        stats[f'pov_change_{name}'] = float(pov_change[c])
+    return stats
+
+
+# ============================================================================
+# PLOTTING
+# ============================================================================
+
+class HistogramPlotter:
+    """Satu Figure Agg yang dipakai ulang; render() hanya meng-update data garis"""
+
+    def __init__(self, figsize=(6.4, 4.8), dpi: int = 100):
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.axes.set_xlabel("Bins")
+        self.axes.set_ylabel("# of Pixels")
+        self.axes.set_xlim([0, BINS])
+        x = np.arange(BINS)
+        self.lines = [self.axes.plot(x, np.zeros(BINS), color=color)[0] for color in CHANNEL_COLORS]
+
+    def render(self, histogram, title: str, output_file: str):
+        for line, values in zip(self.lines, histogram):
+            line.set_ydata(values)
+        self.axes.set_ylim(0, max(int(histogram.max()), 1) * 1.05)
+        self.axes.set_title(f"Histogram: {title}")
+        self.figure.savefig(output_file)
+
+
+# ============================================================================
+# BATCH
+# ============================================================================
+
+_worker_cache = None
+
+
+def _init_worker(cache_dir: Optional[str]):
+    global _worker_cache
+    _worker_cache = HistogramCache(cache_dir) if cache_dir else None
+
+
+def _worker_histogram(path: str):
+    return image_histogram(path, _worker_cache)
+
+
+def batch_histograms(paths: Iterable[str], cache_dir: Optional[str] = None,
+                     workers: Optional[int] = None, chunksize: int = 8):
+    """Generator (path, histogram) urut sesuai input; dihitung di process pool"""
+    paths = list(paths)
+    if workers == 1:
+        _init_worker(cache_dir)
+        yield from zip(paths, map(_worker_histogram, paths))
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache_dir,)) as pool:
+        yield from zip(paths, pool.map(_worker_histogram, paths, chunksize=chunksize))
+
+
+def diff_pairs(pairs: List[Tuple[str, str]], cache_dir: Optional[str] = None, workers: Optional[int] = None,
+               plot_dir: Optional[str] = None):
+    """
+    Generator baris statistik histogram_diff untuk setiap (cover, stego).
+    Jika plot_dir diisi, histogram cover dan stego juga di-render (Figure dipakai ulang).
+    """
+    plotter = None
+    if plot_dir:
+        os.makedirs(plot_dir, exist_ok=True)
+        plotter = HistogramPlotter()
+
+    images = list(dict.fromkeys(path for pair in pairs for path in pair))
+    histograms = dict(batch_histograms(images, cache_dir, workers))
+    for cover, stego in pairs:
+        if plotter is not None:
+            for path, label in ((cover, "Cover"), (stego, "Stego")):
+                output = os.path.join(plot_dir, f"{label.lower()}_{Path(path).stem}_hist.png")
+                plotter.render(histograms[path], f"{label} ({Path(path).name})", output)
+        yield {'cover': cover, 'stego': stego, **histogram_diff(histograms[cover], histograms[stego])}
+
+
+def main(argv=None):
+    from image_metrics import pair_folders, read_pairs
+
+    parser = argparse.ArgumentParser(description="Batch RGB histograms with disk cache")
+    parser.add_argument("cover_dir", nargs="?")
+    parser.add_argument("stego_dir", nargs="?")
+    parser.add_argument("--pairs", help="manifest CSV (kolom cover,stego) sebagai ganti folder")
+    parser.add_argument("--suffix", default="_stego", help="akhiran nama file stego (default _stego)")
+    parser.add_argument("--cache", default=".hist_cache", help="folder cache histogram (kosong = tanpa cache)")
+    parser.add_argument("--csv", default="hist_diff.csv", help="output statistik perbedaan")
+    parser.add_argument("--plots", help="folder output plot PNG (tanpa opsi ini: tidak ada plot)")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    if args.pairs:
+        pairs = read_pairs(args.pairs)
+    elif args.cover_dir and args.stego_dir:
+        pairs = pair_folders(args.cover_dir, args.stego_dir, args.suffix)
+    else:
+        parser.error("butuh cover_dir dan stego_dir, atau --pairs")
+    if not pairs:
+        print("[!] Tidak ada pasangan cover/stego yang cocok")
+        return 1
+
+    print(f"[*] Histogram untuk {len(pairs)} pasangan...")
+    with open(args.csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=DIFF_FIELDS)
+        writer.writeheader()
+        for row in diff_pairs(pairs, args.cache or None, args.workers, args.plots):
+            writer.writerow(row)
+    print(f"[✓] Statistik disimpan: {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+image_metrics.py
+====================================
+Metrik kualitas gambar cover vs stego (MSE, PSNR, SSIM) untuk dataset besar.
+
+- Selisih dihitung di float32 (tidak ada wrap-around modulo 256 seperti
+  pengurangan uint8), akumulasi jumlah di float64.
+- Gambar diproses per tile baris, jadi array float sementara dibatasi
+  ukuran tile, bukan ukuran gambar. SSIM memakai halo baris selebar radius
+  window Gaussian sehingga hasil per tile identik dengan hitungan satu gambar.
+- Metrik per kanal (R, G, B) dan gabungan.
+- Ribuan pasangan dievaluasi di process pool; hasil ditulis bertahap ke CSV
+  (atau Parquet jika pandas + pyarrow terpasang).
+
+SSIM: Wang et al. (2004), window Gaussian 11x11 sigma 1.5, K1=0.01, K2=0.03,
+L=255, border reflect.
+
+Run: python image_metrics.py covers/ stegos/ -o metrics.csv
+     python image_metrics.py --pairs pairs.csv -o metrics.parquet --workers 8
+"""
+
+import argparse
+import csv
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+CHANNELS = ("r", "g", "b")
+MAX_PIXEL = 255.0
+SSIM_WINDOW = 11
+SSIM_SIGMA = 1.5
+SSIM_C1 = (0.01 * MAX_PIXEL) ** 2
+SSIM_C2 = (0.03 * MAX_PIXEL) ** 2
+DEFAULT_TILE_ROWS = 256
+
+IMAGE_EXTENSIONS = (".png", ".bmp", ".tif", ".tiff")
+
+RESULT_FIELDS = (
+    ["cover", "stego", "width", "height", "mse", "psnr", "ssim"]
+    + [f"{metric}_{c}" for metric in ("mse", "psnr", "ssim") for c in CHANNELS]
+    + ["seconds", "error"]
+)
+
+
+def psnr_from_mse(mse: float) -> float:
+    """PSNR (dB) untuk pixel 8-bit; inf jika gambar identik"""
+    if mse == 0:
+        return math.inf
+    return 10.0 * math.log10(MAX_PIXEL ** 2 / mse)
+
+
+def _load_rgb(path: str):
+    from cover_cache import decode_cover
+    pixels = decode_cover(path)
+    return pixels[..., :3]  # alpha tidak ikut diukur
+
+
+def _ssim_map(x, y):
+    """Peta SSIM per pixel untuk satu kanal (float32 2D)"""
+    import cv2
+
+    def blur(a):
+        return cv2.GaussianBlur(a, (SSIM_WINDOW, SSIM_WINDOW), SSIM_SIGMA, borderType=cv2.BORDER_REFLECT_101)
+
+    mu_x = blur(x)
+    mu_y = blur(y)
+    mu_xx = mu_x * mu_x
+    mu_yy = mu_y * mu_y
+    mu_xy = mu_x * mu_y
+    sigma_xx = blur(x * x) - mu_xx
+    sigma_yy = blur(y * y) - mu_yy
+    sigma_xy = blur(x * y) - mu_xy
+    return ((2 * mu_xy + SSIM_C1) * (2 * sigma_xy + SSIM_C2)) / (
+        (mu_xx + mu_yy + SSIM_C1) * (sigma_xx + sigma_yy + SSIM_C2))
+
+
+def compare_arrays(cover, stego, tile_rows: int = DEFAULT_TILE_ROWS, ssim: bool = True) -> dict:
+    """
+    MSE, PSNR dan (opsional) SSIM per kanal untuk dua array uint8 HxWx3.
+    Return dict dengan key mse/psnr/ssim (gabungan) dan mse_r, psnr_g, ...
+    """
+    import numpy as np
+
+    if cover.shape != stego.shape:
+        raise ValueError(f"Ukuran berbeda: {cover.shape} vs {stego.shape}")
+    height, width, channels = cover.shape
+    halo = SSIM_WINDOW // 2
+
+    sq_err = np.zeros(channels, dtype=np.float64)
+    ssim_sum = np.zeros(channels, dtype=np.float64)
+    for top in range(0, height, tile_rows):
+        bottom = min(top + tile_rows, height)
+        diff = cover[top:bottom].astype(np.float32) - stego[top:bottom].astype(np.float32)
+        sq_err += np.einsum('ijk,ijk->k', diff, diff, dtype=np.float64)
+
+        if ssim:
+            lo, hi = max(top - halo, 0), min(bottom + halo, height)
+            x = cover[lo:hi].astype(np.float32)
+            y = stego[lo:hi].astype(np.float32)
+            for c in range(channels):
+                ssim_sum[c] += _ssim_map(x[..., c], y[..., c])[top - lo:bottom - lo].sum(dtype=np.float64)
+
+    n_pixels = height * width
+    mse = sq_err / n_pixels
+    result = {
+        'width': width,
+        'height': height,
+        'mse': float(mse.mean()),
+        'psnr': psnr_from_mse(float(mse.mean())),
+    }
+    for c, name in enumerate(CHANNELS[:channels]):
+        result[f'mse_{name}'] = float(mse[c])
+        result[f'psnr_{name}'] = psnr_from_mse(float(mse[c]))
+    if ssim:
+        per_channel = ssim_sum / n_pixels
+        result['ssim'] = float(per_channel.mean())
+        for c, name in enumerate(CHANNELS[:channels]):
+            result[f'ssim_{name}'] = float(per_channel[c])
+    return result
+
+
+def compare_images(cover_path: str, stego_path: str, tile_rows: int = DEFAULT_TILE_ROWS,
+                   ssim: bool = True) -> dict:
+    """compare_arrays untuk dua file gambar"""
+    return compare_arrays(_load_rgb(cover_path), _load_rgb(stego_path), tile_rows, ssim)
+
+
+# ============================================================================
+# DATASET
+# ============================================================================
+
+def _evaluate_pair(args) -> dict:
+    cover_path, stego_path, tile_rows, ssim = args
+    row = {'cover': cover_path, 'stego': stego_path, 'error': ''}
+    start = time.perf_counter()
+    try:
+        row.update(compare_images(cover_path, stego_path, tile_rows, ssim))
+    except Exception as e:
+        row['error'] = str(e)
+    row['seconds'] = time.perf_counter() - start
+    return row
+
+
+def evaluate_pairs(pairs: Iterable[Tuple[str, str]], workers: Optional[int] = None,
+                   tile_rows: int = DEFAULT_TILE_ROWS, ssim: bool = True, chunksize: int = 8):
+    """
+    Generator hasil per pasangan (cover, stego), urut sesuai input.
+    Pasangan yang gagal (file hilang, ukuran beda) tetap menghasilkan baris
+    dengan kolom 'error' terisi. workers=1 menjalankan di proses ini.
+    """
+    tasks = ((cover, stego, tile_rows, ssim) for cover, stego in pairs)
+    if workers == 1:
+        yield from map(_evaluate_pair, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_evaluate_pair, tasks, chunksize=chunksize)
+
+
+def pair_folders(cover_dir: str, stego_dir: str, suffix: str = "_stego") -> List[Tuple[str, str]]:
+    """
+    Pasangkan gambar di stego_dir dengan cover di cover_dir berdasarkan nama:
+    <stem>.png atau <stem><suffix>.png di stego_dir cocok dengan <stem>.* di cover_dir.
+    """
+    covers = {p.stem: str(p) for p in Path(cover_dir).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS + (".jpg", ".jpeg")}
+    pairs = []
+    for p in sorted(Path(stego_dir).iterdir()):
+        if p.suffix.lower() not in IMAGE_EXTENSIONS:
+            continue
+        stem = p.stem[:-len(suffix)] if suffix and p.stem.endswith(suffix) else p.stem
+        if stem in covers:
+            pairs.append((covers[stem], str(p)))
+    return pairs
+
+
+def read_pairs(path: str) -> List[Tuple[str, str]]:
+    """Manifest CSV dengan kolom cover,stego"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [(row['cover'], row['stego']) for row in csv.DictReader(f)]
+
+
+def write_table(path: str, rows: Iterable[dict], fields=RESULT_FIELDS) -> int:
+    """
+    Tulis hasil ke CSV (ditulis per baris, cocok untuk ribuan pasangan) atau
+    Parquet (.parquet, butuh pandas + pyarrow). Return jumlah baris.
+    """
+    if path.lower().endswith(".parquet"):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError("Output Parquet butuh pandas dan pyarrow (pip install pandas pyarrow)")
+        frame = pd.DataFrame(list(rows), columns=list(fields))
+        frame.to_parquet(path, index=False)
+        return len(frame)
+
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch image-quality metrics (MSE, PSNR, SSIM)")
+    parser.add_argument("cover_dir", nargs="?")
+    parser.add_argument("stego_dir", nargs="?")
+    parser.add_argument("--pairs", help="manifest CSV (kolom cover,stego) sebagai ganti folder")
+    parser.add_argument("--suffix", default="_stego", help="akhiran nama file stego (default _stego)")
+    parser.add_argument("-o", "--output", default="metrics.csv", help=".csv atau .parquet")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--tile-rows", type=int, default=DEFAULT_TILE_ROWS)
+    parser.add_argument("--no-ssim", action="store_true", help="hanya MSE/PSNR (lebih cepat)")
+    args = parser.parse_args(argv)
+
+    if args.pairs:
+        pairs = read_pairs(args.pairs)
+    elif args.cover_dir and args.stego_dir:
+        pairs = pair_folders(args.cover_dir, args.stego_dir, args.suffix)
+    else:
+        parser.error("butuh cover_dir dan stego_dir, atau --pairs")
+    if not pairs:
+        print("[!] Tidak ada pasangan cover/stego yang cocok")
+        return 1
+
+    print(f"[*] Mengevaluasi {len(pairs)} pasangan...")
+    start = time.perf_counter()
+    failed = 0
+
+    def rows():
+        nonlocal failed
+        for row in evaluate_pairs(pairs, args.workers, args.tile_rows, not args.no_ssim):
+            if row['error']:
+                failed += 1
+                print(f"[✗] {row['stego']}: {row['error']}")
+            yield row
+
+    count = write_table(args.output, rows())
+    elapsed = time.perf_counter() - start
+    print(f"[✓] {count} baris ditulis ke {args.output} ({elapsed:.1f}s, {failed} gagal)")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+image_preview.py
+====================================
+Preview gambar untuk GUI tanpa decode resolusi penuh.
+
+- Ukuran dan kapasitas LSB dibaca dari header saja (Image.open lazy).
+- JPEG di-decode langsung pada skala kecil dengan Image.draft (DCT scaling).
+- Format lain (PNG) diperkecil dengan Image.reduce sebelum thumbnail (palette,
+  mode 1 dan I;16 dikonversi dulu ke mode yang didukung reduce).
+- Hasil di-cache per (path, mtime) sehingga memilih ulang gambar tidak decode lagi.
+
+Fungsi di modul ini aman dipanggil dari worker thread; konversi ke
+ImageTk.PhotoImage tetap harus dilakukan di main thread Tk.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+PREVIEW_SIZE = (450, 250)
+
+
+def read_image_info(image_path: str) -> dict:
+    """Ukuran, mode dan estimasi kapasitas LSB dari header gambar (tanpa decode pixel)"""
+    with Image.open(image_path) as img:
+        width, height = img.size
+        info = {'width': width, 'height': height, 'mode': img.mode, 'format': img.format}
+    # stegano: 3 bit per pixel (R, G, B); dikurangi prefix panjang "<n>:"
+    capacity = width * height * 3 // 8
+    info['capacity_bytes'] = max(0, capacity - len(str(capacity)) - 1)
+    return info
+
+
+def load_preview(image_path: str, size: tuple = PREVIEW_SIZE):
+    """Return (thumbnail PIL Image, info dict) dengan decode seminimal mungkin"""
+    info = read_image_info(image_path)
+    with Image.open(image_path) as img:
+        if img.format == "JPEG":
+            # Decoder JPEG langsung menghasilkan skala 1/2, 1/4 atau 1/8
+            img.draft("RGB", size)
+            thumb = img.copy()
+        else:
+            factor = max(1, min(img.width // size[0], img.height // size[1]))
+            # reduce()/thumbnail() merata-rata nilai pixel: salah untuk indeks
+            # palette dan tidak didukung untuk mode 1 / I;16
+            if img.mode in ("P", "PA"):
+                img = img.convert("RGBA" if img.mode == "PA" or "transparency" in img.info else "RGB")
+            elif img.mode == "1":
+                img = img.convert("L")
+            elif img.mode.startswith("I;16"):
+                # 16-bit -> 8-bit grayscale (ImageTk hanya menampilkan 1/L/RGB/RGBA)
+                img = img.convert("I").point(lambda v: v / 256).convert("L")
+            thumb = img.reduce(factor) if factor > 1 else img.copy()
+    thumb.thumbnail(size)
+    return thumb, info
+
+
+class PreviewCache:
+    """LRU cache (path, mtime) -> (thumbnail, info)"""
+    
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, image_path: str, size: tuple = PREVIEW_SIZE):
+        key = (os.path.abspath(image_path), os.stat(image_path).st_mtime_ns, size)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        
+        result = load_preview(image_path, size)
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
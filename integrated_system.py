@@ -1,11 +1,55 @@
 import base64
 import json
 import os
-from typing import Tuple
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 
-# Import dari file asli teman (TIDAK DIUBAH)
-from rsa_manager import RSAManager
-from hello import SecurityIntegrator
+from pipeline_trace import NULL_TRACER
+
+# Modul berat (pycryptodome, stegano, PIL, NumPy) di-import saat pertama dipakai
+# supaya import modul ini (dan startup GUI) tetap cepat.
+if TYPE_CHECKING:
+    from seekable_payload import PlaintextRangeReader
+
+
+# Nama tahap pipeline, sesuai urutan STEP 1-7 pada encrypt_and_hide / extract_and_decrypt
+ENCRYPT_STAGES = ("read", "sign", "combine", "encrypt", "wrap", "package", "embed")
+DECRYPT_STAGES = ("extract", "parse", "unwrap", "decrypt", "split", "verify", "write")
+
+AES_KEY_SIZE = 32
+AES_BLOCK_SIZE = 16
+
+INVALID_SIGNATURE_MESSAGE = "⚠️ PERINGATAN: Signature tidak valid!\nData mungkin corrupt!"
+
+
+def _b64_len(n_bytes: int) -> int:
+    """Panjang string Base64 (dengan padding) untuk n byte"""
+    return 4 * ((n_bytes + 2) // 3)
+
+
+def _aes_cbc_len(n_bytes: int) -> int:
+    """Panjang IV + ciphertext AES-CBC dengan padding PKCS#7"""
+    return AES_BLOCK_SIZE + AES_BLOCK_SIZE * (n_bytes // AES_BLOCK_SIZE + 1)
+
+
+def load_calibration(path: str) -> dict:
+    """
+    Baca tabel kalibrasi waktu (JSON) hasil benchmark suite.
+    Format: {"stages": {"<stage>": {"fixed_s": float, "mb_per_s": float}}}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        table = json.load(f)
+    return table.get("calibration", table)
+
+
+class OperationCancelled(Exception):
+    """Di-raise oleh callback progress untuk membatalkan proses di batas tahap"""
+
+
+def _report(progress: Optional[Callable], stages: tuple, stage: str):
+    """Panggil progress(stage, nomor_tahap, total_tahap) di awal sebuah tahap"""
+    if progress is not None:
+        progress(stage, stages.index(stage) + 1, len(stages))
 
 
 class IntegratedSecuritySystem:
@@ -34,18 +78,26 @@ class IntegratedSecuritySystem:
                  sender_private_key_path="private_key.pem", 
                  sender_public_key_path="public_key.pem",
                  receiver_public_key_path="public_key.pem",
-                 receiver_private_key_path="private_key.pem"):
+                 receiver_private_key_path="private_key.pem",
+                 defer_key_setup=False, tracer=None, verbose=True, payload_cache=None,
+                 extraction_cache=None):
         """
         Initialize dengan menggunakan class asli dari teman
-        """
-        # Gunakan class asli dari rsa_manager.py (TIDAK DIUBAH)
-        self.rsa_mgr = RSAManager(
-            private_key_path=sender_private_key_path,
-            public_key_path=sender_public_key_path
-        )
         
-        # Gunakan class asli dari hello.py (TIDAK DIUBAH)
-        self.security = SecurityIntegrator()
+        defer_key_setup: jika True, pengecekan/generate kunci RSA ditunda sampai
+        rsa_mgr pertama kali dipakai (atau warm_up() dipanggil di background).
+        tracer: pipeline_trace.Tracer untuk mencatat waktu & byte per tahap
+        (default NULL_TRACER, nonaktif).
+        verbose: jika False, pesan progress [1]..[7] tidak di-print.
+        payload_cache: payload_cache.PayloadCache opsional; hide ulang plaintext
+        yang sama (kunci sama) memakai payload yang sudah jadi dan langsung embed.
+        extraction_cache: extraction_cache.ExtractionCache opsional; membuka ulang
+        stego image yang sama hanya perlu decrypt AES.
+        """
+        self.tracer = tracer or NULL_TRACER
+        self.verbose = verbose
+        self.payload_cache = payload_cache
+        self.extraction_cache = extraction_cache
         
         # Store key paths
         self.sender_private_key_path = sender_private_key_path
@@ -53,13 +105,60 @@ class IntegratedSecuritySystem:
         self.receiver_public_key_path = receiver_public_key_path
         self.receiver_private_key_path = receiver_private_key_path
         
+        # rsa_manager.py dan aes_stego_manager.py dibuat saat pertama dipakai
+        self._rsa_mgr = None
+        self._security = None
+        self._keys_checked = False
+        self._setup_lock = threading.RLock()
+        
         # Ensure keys exist
-        self._ensure_keys_exist()
+        if not defer_key_setup:
+            self._ensure_keys_exist()
+    
+    @property
+    def rsa_mgr(self):
+        """RSAManager (class asli dari rsa_manager.py); kunci dipastikan ada"""
+        if self._rsa_mgr is None:
+            with self._setup_lock:
+                if self._rsa_mgr is None:
+                    from rsa_manager import RSAManager
+                    if not self._keys_checked:
+                        self._ensure_keys_exist()
+                    self._rsa_mgr = RSAManager(
+                        private_key_path=self.sender_private_key_path,
+                        public_key_path=self.sender_public_key_path
+                    )
+        return self._rsa_mgr
+    
+    @property
+    def security(self):
+        """SecurityIntegrator (class asli dari aes_stego_manager.py)"""
+        if self._security is None:
+            with self._setup_lock:
+                if self._security is None:
+                    from aes_stego_manager import SecurityIntegrator
+                    self._security = SecurityIntegrator(verbose=self.verbose)
+        return self._security
+    
+    def warm_up(self):
+        """Load semua dependency dan pastikan kunci ada (untuk dipanggil di background)"""
+        self.rsa_mgr
+        self.security
+    
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+    
+    def _stage(self, progress: Optional[Callable], stages: tuple, stage: str, bytes_in: int = 0):
+        """Laporkan progress lalu buka span tracer untuk satu tahap"""
+        _report(progress, stages, stage)
+        return self.tracer.stage("encrypt" if stages is ENCRYPT_STAGES else "decrypt", stage, bytes_in)
     
     def _ensure_keys_exist(self):
         """Generate keys jika belum ada"""
+        self._keys_checked = True
         if not os.path.exists(self.sender_private_key_path):
-            print("[*] Generating RSA keys...")
+            self._log("[*] Generating RSA keys...")
             from Crypto.PublicKey import RSA
             key = RSA.generate(2048)
             
@@ -68,148 +167,485 @@ class IntegratedSecuritySystem:
             with open(self.sender_public_key_path, 'wb') as f:
                 f.write(key.publickey().export_key())
             
-            print("[✓] Keys generated")
+            self._log("[✓] Keys generated")
         else:
-            print("[✓] Keys already exist")
+            self._log("[✓] Keys already exist")
     
-    def encrypt_and_hide(self, plaintext_file_path: str, cover_image_path: str, 
-                         output_image_path: str) -> Tuple[bool, str]:
+    def estimate_payload(self, plaintext_size: int, cover_image_path: Optional[str] = None,
+                         calibration: Optional[dict] = None, rsa_key_bytes: Optional[int] = None) -> dict:
         """
-        Proses lengkap enkripsi dan hiding menggunakan KODE ASLI TEMAN
+        Dry-run: hitung ukuran payload yang akan disembunyikan oleh encrypt_and_hide
+        untuk plaintext berukuran plaintext_size byte, TANPA enkripsi.
+        
+        Angka byte/bit yang dihasilkan persis sama dengan hasil encrypt_and_hide
+        (signature, Base64, JSON, padding AES, RSA wrapping, prefix panjang LSB).
+        Jika calibration diberikan (lihat load_calibration), prediksi waktu per
+        tahap juga dihitung.
         """
-        try:
-            print("\n" + "="*60)
-            print("MEMULAI PROSES ENKRIPSI")
-            print("="*60)
-            
-            # STEP 1: Baca plaintext
-            with open(plaintext_file_path, 'rb') as f:
-                plaintext = f.read()
-            print(f"[1] ✓ Plaintext dimuat: {len(plaintext)} bytes")
-            
-            # STEP 2: Digital Signature (menggunakan rsa_manager.py asli)
+        if plaintext_size < 0:
+            raise ValueError("plaintext_size tidak boleh negatif")
+        
+        # Ukuran signature PKCS#1 v1.5 dan output OAEP = ukuran modulus RSA
+        if rsa_key_bytes is None:
+            rsa_key_bytes = self.rsa_mgr.load_public_key().size_in_bytes()
+        
+        signature_b64 = _b64_len(rsa_key_bytes)
+        data_b64 = _b64_len(plaintext_size)
+        combined = len(json.dumps({'data': '', 'signature': ''})) + data_b64 + signature_b64
+        aes_bytes = _aes_cbc_len(combined)
+        ciphertext_b64 = _b64_len(aes_bytes)
+        encrypted_key_b64 = _b64_len(rsa_key_bytes)
+        payload = len(json.dumps({'ciphertext': '', 'encrypted_key': ''})) + ciphertext_b64 + encrypted_key_b64
+        
+        # stegano LSB: prefix "<n>:" + payload, 8 bit per byte, dibulatkan ke kelipatan 3 bit (RGB)
+        embedded_bytes = len(str(payload)) + 1 + payload
+        embedded_bits = 8 * embedded_bytes
+        embedded_bits += (3 - embedded_bits % 3) % 3
+        
+        estimate = {
+            'plaintext_bytes': plaintext_size,
+            'signature_b64_chars': signature_b64,
+            'combined_bytes': combined,
+            'aes_ciphertext_bytes': aes_bytes,
+            'ciphertext_b64_chars': ciphertext_b64,
+            'encrypted_key_b64_chars': encrypted_key_b64,
+            'payload_bytes': payload,
+            'embedded_bytes': embedded_bytes,
+            'embedded_bits': embedded_bits,
+            'pixels_used': embedded_bits // 3,
+            'expansion_ratio': embedded_bytes / plaintext_size if plaintext_size else None,
+        }
+        
+        cover_bytes = None
+        if cover_image_path is not None:
+            from PIL import Image
+            # Image.open hanya membaca header, tidak men-decode pixel
+            with Image.open(cover_image_path) as img:
+                width, height = img.size
+            capacity_bits = width * height * 3
+            cover_bytes = width * height * 3
+            estimate.update({
+                'cover_size': (width, height),
+                'capacity_bits': capacity_bits,
+                'capacity_used': embedded_bits / capacity_bits,
+                'fits': embedded_bits <= capacity_bits,
+            })
+        
+        if calibration is not None:
+            stage_bytes = {
+                'read': plaintext_size,
+                'sign': plaintext_size,
+                'combine': combined,
+                'encrypt': combined,
+                'wrap': AES_KEY_SIZE,
+                'package': payload,
+                'embed': cover_bytes if cover_bytes is not None else embedded_bytes,
+            }
+            stages = calibration.get('stages', {})
+            predicted = {}
+            for stage in ENCRYPT_STAGES:
+                entry = stages.get(stage)
+                if not entry:
+                    continue
+                seconds = entry.get('fixed_s', 0.0)
+                if entry.get('mb_per_s'):
+                    seconds += stage_bytes[stage] / (entry['mb_per_s'] * 1e6)
+                predicted[stage] = seconds
+            estimate['predicted_seconds'] = predicted
+            estimate['predicted_total_seconds'] = sum(predicted.values())
+        
+        return estimate
+    
+    def build_payload(self, plaintext: bytes, progress: Optional[Callable] = None) -> str:
+        """
+        STEP 2-6 enkripsi: sign, gabungkan, AES, bungkus kunci AES dengan RSA.
+        Return payload JSON (string ASCII) yang siap disembunyikan.
+        """
+        # STEP 2: Digital Signature (menggunakan rsa_manager.py asli)
+        with self._stage(progress, ENCRYPT_STAGES, "sign", len(plaintext)) as span:
             private_key = self.rsa_mgr.load_private_key()
             signature = self.rsa_mgr.sign_data(plaintext, private_key)
-            print(f"[2] ✓ Digital signature dibuat")
-            
-            # STEP 3: Gabungkan plaintext + signature
+            span.bytes_out = len(signature)
+        self._log(f"[2] ✓ Digital signature dibuat")
+        
+        # STEP 3: Gabungkan plaintext + signature
+        with self._stage(progress, ENCRYPT_STAGES, "combine", len(plaintext) + len(signature)) as span:
             combined = json.dumps({
                 'data': base64.b64encode(plaintext).decode('utf-8'),
                 'signature': signature
             })
-            print(f"[3] ✓ Data digabungkan dengan signature")
-            
-            # STEP 4: AES Encryption (menggunakan hello.py asli)
+            span.bytes_out = len(combined)
+        self._log(f"[3] ✓ Data digabungkan dengan signature")
+        
+        # STEP 4: AES Encryption (menggunakan aes_stego_manager.py asli)
+        with self._stage(progress, ENCRYPT_STAGES, "encrypt", len(combined)) as span:
             aes_key = self.security.generate_aes_key()
             
-            # hello.py return Base64 STRING (bukan bytes!)
+            # aes_stego_manager.py return Base64 STRING (bukan bytes!)
             ciphertext_b64_string = self.security.encrypt_data_aes(combined, aes_key)
-            
-            print(f"[4] ✓ Data dienkripsi dengan AES")
-            
-            # STEP 5: RSA Key Encryption (menggunakan rsa_manager.py asli)
+            span.bytes_out = len(ciphertext_b64_string)
+        
+        self._log(f"[4] ✓ Data dienkripsi dengan AES")
+        
+        # STEP 5: RSA Key Encryption (menggunakan rsa_manager.py asli)
+        with self._stage(progress, ENCRYPT_STAGES, "wrap", len(aes_key)) as span:
             public_key = self.rsa_mgr.load_public_key()
             encrypted_aes_key = self.rsa_mgr.encrypt_aes_key_with_rsa(aes_key, public_key)
-            print(f"[5] ✓ Kunci AES dienkripsi dengan RSA")
-            
-            # STEP 6: Gabungkan ciphertext + encrypted key
+            span.bytes_out = len(encrypted_aes_key)
+        self._log(f"[5] ✓ Kunci AES dienkripsi dengan RSA")
+        
+        # STEP 6: Gabungkan ciphertext + encrypted key
+        with self._stage(progress, ENCRYPT_STAGES, "package",
+                         len(ciphertext_b64_string) + len(encrypted_aes_key)) as span:
             payload = json.dumps({
                 'ciphertext': ciphertext_b64_string,  # Sudah Base64 string
                 'encrypted_key': encrypted_aes_key
             })
-            print(f"[6] ✓ Payload final disiapkan: {len(payload)} karakter")
+            span.bytes_out = len(payload)
+        self._log(f"[6] ✓ Payload final disiapkan: {len(payload)} karakter")
+        return payload
+    
+    def cached_payload(self, plaintext: bytes, progress: Optional[Callable] = None) -> str:
+        """build_payload lewat payload_cache (jika ada); tahap 2-6 dilewati saat cache hit"""
+        if self.payload_cache is None:
+            return self.build_payload(plaintext, progress)
+        key = self.payload_cache.make_key(plaintext, self.rsa_mgr.public_key_path, self.rsa_mgr.private_key_path)
+        payload = self.payload_cache.get(key)
+        if payload is not None:
+            self._log(f"[2-6] ✓ Payload dari cache: {len(payload)} karakter")
+            return payload
+        payload = self.build_payload(plaintext, progress)
+        self.payload_cache.put(key, payload)
+        return payload
+    
+    def open_payload(self, payload_json: str,
+                     progress: Optional[Callable] = None) -> Tuple[bool, Union[bytes, str]]:
+        """
+        STEP 2-6 dekripsi: parse, unwrap kunci AES, decrypt AES, verify signature.
+        Return (True, plaintext) atau (False, pesan error).
+        Exception JSON/IO dibiarkan naik ke pemanggil.
+        """
+        success, result, _ = self._open_payload(payload_json, progress)
+        return success, result
+    
+    def _open_payload(self, payload_json: str, progress: Optional[Callable] = None) -> tuple:
+        """open_payload + ExtractionEntry (None jika gagal sebelum verify) untuk extraction_cache"""
+        from extraction_cache import ExtractionEntry
+        
+        # STEP 2: Parse payload
+        with self._stage(progress, DECRYPT_STAGES, "parse", len(payload_json)) as span:
+            payload = json.loads(payload_json)
+            ciphertext_b64_string = payload['ciphertext']  # Ini Base64 string
+            encrypted_aes_key = payload['encrypted_key']
+            span.bytes_out = len(ciphertext_b64_string) + len(encrypted_aes_key)
+        self._log(f"[2] ✓ Payload diparsing")
+        
+        # STEP 3: Decrypt AES key (menggunakan rsa_manager.py asli)
+        with self._stage(progress, DECRYPT_STAGES, "unwrap", len(encrypted_aes_key)) as span:
+            private_key = self.rsa_mgr.load_private_key()
+            aes_key = self.rsa_mgr.decrypt_aes_key_with_rsa(encrypted_aes_key, private_key)
+            span.bytes_out = len(aes_key)
+        self._log(f"[3] ✓ Kunci AES didekripsi")
+        
+        # STEP 4: Decrypt ciphertext (menggunakan aes_stego_manager.py asli)
+        with self._stage(progress, DECRYPT_STAGES, "decrypt", len(ciphertext_b64_string)) as span:
+            # aes_stego_manager.py expect Base64 STRING input
+            combined_json = self.security.decrypt_data_aes(ciphertext_b64_string, aes_key)
+            span.bytes_out = len(combined_json)
+        
+        # Check if decryption failed
+        if isinstance(combined_json, str) and combined_json.startswith("Error Decrypting"):
+            return False, f"Dekripsi gagal: {combined_json}", None
+        
+        self._log(f"[4] ✓ Ciphertext didekripsi")
+        
+        # STEP 5: Pisahkan plaintext dan signature
+        with self._stage(progress, DECRYPT_STAGES, "split", len(combined_json)) as span:
+            combined = json.loads(combined_json)
+            plaintext = base64.b64decode(combined['data'])
+            signature = combined['signature']
+            span.bytes_out = len(plaintext) + len(signature)
+        self._log(f"[5] ✓ Plaintext dan signature dipisahkan")
+        
+        # STEP 6: Verify signature (menggunakan rsa_manager.py asli)
+        with self._stage(progress, DECRYPT_STAGES, "verify", len(plaintext) + len(signature)):
+            public_key = self.rsa_mgr.load_public_key()
+            is_valid = self.rsa_mgr.verify_signature(plaintext, signature, public_key)
+        entry = ExtractionEntry(ciphertext_b64_string, aes_key, is_valid)
+        
+        if not is_valid:
+            self._log(f"[6] ✗ Signature verification FAILED!")
+            self._log("="*60)
+            return False, INVALID_SIGNATURE_MESSAGE, entry
+        
+        self._log(f"[6] ✓ Signature berhasil diverifikasi")
+        return True, plaintext, entry
+    
+    def _open_cached(self, entry, progress: Optional[Callable] = None) -> Tuple[bool, Union[bytes, str]]:
+        """Buka hasil extraction_cache: hanya decrypt AES, verdict signature dari cache"""
+        if not entry.signature_valid:
+            self._log(f"[6] ✗ Signature tidak valid (cache)")
+            return False, INVALID_SIGNATURE_MESSAGE
+        
+        with self._stage(progress, DECRYPT_STAGES, "decrypt", len(entry.ciphertext)) as span:
+            combined_json = self.security.decrypt_data_aes(entry.ciphertext, entry.aes_key)
+            span.bytes_out = len(combined_json)
+        if combined_json.startswith("Error Decrypting"):
+            return False, f"Dekripsi gagal: {combined_json}"
+        
+        with self._stage(progress, DECRYPT_STAGES, "split", len(combined_json)) as span:
+            plaintext = base64.b64decode(json.loads(combined_json)['data'])
+            span.bytes_out = len(plaintext)
+        self._log(f"[2-6] ✓ Didekripsi dari cache ekstraksi, signature terverifikasi sebelumnya")
+        return True, plaintext
+    
+    def encrypt_and_hide(self, plaintext_file_path: str, cover_image_path: str, 
+                         output_image_path: str, progress: Optional[Callable] = None) -> Tuple[bool, str]:
+        """
+        Proses lengkap enkripsi dan hiding menggunakan KODE ASLI TEMAN
+        
+        progress: callback opsional progress(stage, nomor, total) yang dipanggil di
+        awal setiap tahap ENCRYPT_STAGES. Raise OperationCancelled dari callback
+        untuk membatalkan proses.
+        """
+        try:
+            self._log("\n" + "="*60)
+            self._log("MEMULAI PROSES ENKRIPSI")
+            self._log("="*60)
+            
+            # STEP 1: Baca plaintext
+            with self._stage(progress, ENCRYPT_STAGES, "read") as span:
+                with open(plaintext_file_path, 'rb') as f:
+                    plaintext = f.read()
+                span.bytes_out = len(plaintext)
+            self._log(f"[1] ✓ Plaintext dimuat: {len(plaintext)} bytes")
+            
+            # STEP 2-6: Sign, AES, RSA wrap
+            payload = self.cached_payload(plaintext, progress)
             
-            # STEP 7: LSB Steganography (menggunakan hello.py asli)
-            success = self.security.hide_secret_in_image(
-                payload,
-                cover_image_path,
-                output_image_path
-            )
+            # STEP 7: LSB Steganography (menggunakan aes_stego_manager.py asli)
+            with self._stage(progress, ENCRYPT_STAGES, "embed", len(payload)) as span:
+                success = self.security.hide_secret_in_image(
+                    payload,
+                    cover_image_path,
+                    output_image_path
+                )
+                if success and self.tracer.enabled:
+                    span.bytes_out = os.path.getsize(output_image_path)
             
             if success:
-                print(f"[7] ✓ Data berhasil disembunyikan dalam gambar!")
-                print("="*60)
+                self._log(f"[7] ✓ Data berhasil disembunyikan dalam gambar!")
+                self._log("="*60)
                 return True, f"Enkripsi berhasil!\nStego image: {output_image_path}"
             else:
                 return False, "Gagal menyembunyikan data dalam gambar"
                 
+        except OperationCancelled:
+            return False, "Proses dibatalkan"
         except FileNotFoundError as e:
             return False, f"File tidak ditemukan: {str(e)}"
         except Exception as e:
             return False, f"Error saat enkripsi: {str(e)}"
     
-    def extract_and_decrypt(self, stego_image_path: str, output_file_path: str) -> Tuple[bool, str]:
+    def extract_and_decrypt(self, stego_image_path: str, output_file_path: str,
+                            progress: Optional[Callable] = None) -> Tuple[bool, str]:
         """
         Proses lengkap extraction dan dekripsi menggunakan KODE ASLI TEMAN
+        
+        progress: sama seperti encrypt_and_hide, untuk tahap DECRYPT_STAGES.
         """
         try:
-            print("\n" + "="*60)
-            print("MEMULAI PROSES DEKRIPSI")
-            print("="*60)
+            self._log("\n" + "="*60)
+            self._log("MEMULAI PROSES DEKRIPSI")
+            self._log("="*60)
             
-            # STEP 1: Extract dari gambar (menggunakan hello.py asli)
-            payload_json = self.security.extract_secret_from_image(stego_image_path)
-            if not payload_json:
-                return False, "Tidak ada data tersembunyi dalam gambar"
-            print(f"[1] ✓ Data diekstrak dari gambar")
+            if self.extraction_cache is not None:
+                success, result = self._extract_with_cache(stego_image_path, progress)
+            else:
+                # STEP 1: Extract dari gambar (menggunakan aes_stego_manager.py asli)
+                with self._stage(progress, DECRYPT_STAGES, "extract") as span:
+                    if self.tracer.enabled:
+                        span.bytes_in = os.path.getsize(stego_image_path)
+                    payload_json = self.security.extract_secret_from_image(stego_image_path)
+                    span.bytes_out = len(payload_json) if payload_json else 0
+                if not payload_json:
+                    return False, "Tidak ada data tersembunyi dalam gambar"
+                self._log(f"[1] ✓ Data diekstrak dari gambar")
+                
+                # STEP 2-6: Unwrap, AES decrypt, verify signature
+                success, result = self.open_payload(payload_json, progress)
+            if not success:
+                return False, result
+            plaintext = result
             
-            # STEP 2: Parse payload
-            payload = json.loads(payload_json)
-            ciphertext_b64_string = payload['ciphertext']  # Ini Base64 string
-            encrypted_aes_key = payload['encrypted_key']
-            print(f"[2] ✓ Payload diparsing")
+            # STEP 7: Save plaintext
+            with self._stage(progress, DECRYPT_STAGES, "write", len(plaintext)) as span:
+                with open(output_file_path, 'wb') as f:
+                    f.write(plaintext)
+                span.bytes_out = len(plaintext)
+            self._log(f"[7] ✓ Plaintext disimpan ke: {output_file_path}")
+            self._log("="*60)
             
-            # STEP 3: Decrypt AES key (menggunakan rsa_manager.py asli)
-            private_key = self.rsa_mgr.load_private_key()
-            aes_key = self.rsa_mgr.decrypt_aes_key_with_rsa(encrypted_aes_key, private_key)
-            print(f"[3] ✓ Kunci AES didekripsi")
+            return True, f"Dekripsi berhasil!\n✓ Signature valid\nFile: {output_file_path}"
             
-            # STEP 4: Decrypt ciphertext (menggunakan hello.py asli)
-            print(f"[DEBUG] Ciphertext (Base64) length: {len(ciphertext_b64_string)}")
-            print(f"[DEBUG] AES Key length: {len(aes_key)} bytes")
+        except OperationCancelled:
+            return False, "Proses dibatalkan"
+        except FileNotFoundError as e:
+            return False, f"File tidak ditemukan: {str(e)}"
+        except json.JSONDecodeError as e:
+            return False, f"Data corrupt atau format JSON tidak valid: {str(e)}"
+        except Exception as e:
+            return False, f"Error: {str(e)}"
+    
+    def _extract_with_cache(self, stego_image_path: str,
+                            progress: Optional[Callable] = None) -> Tuple[bool, Union[bytes, str]]:
+        """STEP 1-6 dekripsi lewat extraction_cache (kunci: digest bidang LSB)"""
+        from cover_cache import decode_cover
+        from lsb_array import read_bytes, read_frame_header
+        
+        with self._stage(progress, DECRYPT_STAGES, "extract") as span:
+            if self.tracer.enabled:
+                span.bytes_in = os.path.getsize(stego_image_path)
+            pixels = decode_cover(stego_image_path)
+            key = self.extraction_cache.make_key(pixels, self.rsa_mgr.private_key_path,
+                                                 self.rsa_mgr.public_key_path)
+            entry = self.extraction_cache.get(key)
+            if entry is None:
+                try:
+                    offset, length = read_frame_header(pixels)
+                except ValueError:
+                    return False, "Tidak ada data tersembunyi dalam gambar"
+                payload_json = read_bytes(pixels, offset, length).decode('utf-8')
+                span.bytes_out = len(payload_json)
+        
+        if entry is not None:
+            self._log(f"[1] ✓ Hasil ekstraksi dari cache")
+            return self._open_cached(entry, progress)
+        
+        self._log(f"[1] ✓ Data diekstrak dari gambar")
+        success, result, entry = self._open_payload(payload_json, progress)
+        if entry is not None:
+            self.extraction_cache.put(key, entry)
+        return success, result
+    
+    # ========== CONTAINER MULTI-ENTRY ==========
+    
+    def append_file_to_image(self, plaintext_file_path: str, image_path: str,
+                             output_image_path: str, entry_name: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Tambahkan file terenkripsi sebagai entry baru ke container di image_path.
+        Jika image_path belum berisi container (cover biasa), container dibuat.
+        Gambar yang sudah membawa payload format stegano (hasil encrypt_and_hide)
+        ditolak, karena directory container akan menimpa payload tersebut.
+        Hanya pixel entry baru dan bit directory yang ditulis.
+        """
+        try:
+            if entry_name is None:
+                entry_name = os.path.basename(plaintext_file_path)
             
-            # hello.py expect Base64 STRING input
-            combined_json = self.security.decrypt_data_aes(ciphertext_b64_string, aes_key)
+            import stego_container
+            from cover_cache import decode_cover
+            from lsb_array import capacity_bytes, read_frame_header
+            pixels = decode_cover(image_path).copy()
+            directory = stego_container.read_directory(pixels)
+            if directory is None:
+                try:
+                    offset, length = read_frame_header(pixels)
+                except ValueError:
+                    pass
+                else:
+                    if offset + length <= capacity_bytes(pixels):
+                        return False, ("Gambar sudah berisi payload (format stegano) yang akan tertimpa "
+                                       "oleh container.\nGunakan cover bersih atau stego container.")
             
-            # Check if decryption failed
-            if isinstance(combined_json, str) and combined_json.startswith("Error Decrypting"):
-                print(f"[DEBUG] Decryption error: {combined_json}")
-                return False, f"Dekripsi gagal: {combined_json}"
+            with open(plaintext_file_path, 'rb') as f:
+                plaintext = f.read()
+            self._log(f"[1] ✓ Plaintext dimuat: {len(plaintext)} bytes")
             
-            print(f"[DEBUG] Decrypted data (first 200 chars): {combined_json[:200]}")
-            print(f"[4] ✓ Ciphertext didekripsi")
+            payload = self.cached_payload(plaintext)
             
-            # STEP 5: Pisahkan plaintext dan signature
-            combined = json.loads(combined_json)
-            plaintext = base64.b64decode(combined['data'])
-            signature = combined['signature']
-            print(f"[5] ✓ Plaintext dan signature dipisahkan")
+            if directory is None:
+                directory = stego_container.init_container(pixels)
+            entry = stego_container.append_entry(pixels, entry_name, payload.encode('ascii'), directory)
             
-            # STEP 6: Verify signature (menggunakan rsa_manager.py asli)
-            public_key = self.rsa_mgr.load_public_key()
-            is_valid = self.rsa_mgr.verify_signature(plaintext, signature, public_key)
+            from PIL import Image
+            Image.fromarray(pixels).save(output_image_path)
+            self._log(f"[7] ✓ Entry '{entry_name}' ditambahkan ({entry.length} bytes)")
+            return True, f"Entry '{entry_name}' ditambahkan!\nStego image: {output_image_path}"
             
-            if not is_valid:
-                print(f"[6] ✗ Signature verification FAILED!")
-                print("="*60)
-                return False, "⚠️ PERINGATAN: Signature tidak valid!\nData mungkin corrupt!"
+        except FileNotFoundError as e:
+            return False, f"File tidak ditemukan: {str(e)}"
+        except ValueError as e:
+            return False, f"Gagal menambahkan entry: {str(e)}"
+        except Exception as e:
+            return False, f"Error saat enkripsi: {str(e)}"
+    
+    def list_image_entries(self, stego_image_path: str) -> list:
+        """Daftar entry (nama, ukuran) dalam container; list kosong jika tidak ada container"""
+        import stego_container
+        from cover_cache import decode_cover
+        directory = stego_container.read_directory(decode_cover(stego_image_path))
+        if directory is None:
+            return []
+        return [(entry.name, entry.length) for entry in directory.entries]
+    
+    def extract_entry(self, stego_image_path: str, entry_name: str,
+                      output_file_path: str) -> Tuple[bool, str]:
+        """Ekstrak dan dekripsi satu entry container tanpa men-decode entry lain"""
+        import stego_container
+        from cover_cache import decode_cover
+        try:
+            pixels = decode_cover(stego_image_path)
+            try:
+                payload_json = stego_container.read_entry(pixels, entry_name).decode('ascii')
+            except KeyError:
+                return False, f"Entry '{entry_name}' tidak ditemukan"
+            self._log(f"[1] ✓ Entry '{entry_name}' diekstrak dari gambar")
             
-            print(f"[6] ✓ Signature berhasil diverifikasi")
+            success, result = self.open_payload(payload_json)
+            if not success:
+                return False, result
             
-            # STEP 7: Save plaintext
             with open(output_file_path, 'wb') as f:
-                f.write(plaintext)
-            print(f"[7] ✓ Plaintext disimpan ke: {output_file_path}")
-            print("="*60)
-            
+                f.write(result)
+            self._log(f"[7] ✓ Plaintext disimpan ke: {output_file_path}")
             return True, f"Dekripsi berhasil!\n✓ Signature valid\nFile: {output_file_path}"
             
         except FileNotFoundError as e:
             return False, f"File tidak ditemukan: {str(e)}"
-        except json.JSONDecodeError as e:
-            return False, f"Data corrupt atau format JSON tidak valid: {str(e)}"
+        except (ValueError, json.JSONDecodeError) as e:
+            return False, f"Data corrupt atau container tidak valid: {str(e)}"
         except Exception as e:
             return False, f"Error: {str(e)}"
+    
+    # ========== RANDOM ACCESS ==========
+    
+    def open_range_reader(self, stego_image_path: str,
+                          entry_name: Optional[str] = None) -> "PlaintextRangeReader":
+        """
+        Buka reader random-access untuk payload encrypt_and_hide (atau satu entry
+        container jika entry_name diisi). Hanya kunci AES yang di-unwrap; isi
+        plaintext baru didekripsi saat reader.read(offset, length) dipanggil.
+        Data parsial TIDAK diverifikasi signature-nya.
+        """
+        from cover_cache import decode_cover
+        from seekable_payload import PlaintextRangeReader, SeekablePayload
+        
+        pixels = decode_cover(stego_image_path)
+        if entry_name is None:
+            payload = SeekablePayload.from_stegano(pixels)
+        else:
+            payload = SeekablePayload.from_entry(pixels, entry_name)
+        
+        private_key = self.rsa_mgr.load_private_key()
+        rsa_key_bytes = private_key.size_in_bytes()
+        aes_key = self.rsa_mgr.decrypt_aes_key_with_rsa(payload.encrypted_key(rsa_key_bytes), private_key)
+        return PlaintextRangeReader(payload, aes_key, rsa_key_bytes)
+    
+    def read_plaintext_range(self, stego_image_path: str, offset: int, length: int,
+                             entry_name: Optional[str] = None) -> bytes:
+        """Dekripsi hanya byte plaintext [offset, offset+length) dari stego image"""
+        return self.open_range_reader(stego_image_path, entry_name).read(offset, length)
 
 
 # ============================================================================
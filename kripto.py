@@ -0,0 +1,303 @@
+"""
+kripto.py
+====================================
+Command-line interface untuk sistem kriptografi + steganografi.
+
+Run: python kripto.py <subcommand> ...
+
+    keygen                               buat pasangan kunci RSA
+    hide   INPUT --cover C -o OUT        enkripsi + sembunyikan (INPUT/OUT boleh "-")
+    reveal STEGO -o OUT                  ekstrak + dekripsi (STEGO/OUT boleh "-")
+    scan   PATH...                       cek kapasitas dan isi tersembunyi gambar
+    audit  PATH... -o REPORT             verifikasi signature massal (paralel, tanpa plaintext)
+    bench                                benchmark startup dan kecepatan
+
+Contoh pipe (tanpa file sementara di sisi pemanggil):
+    tar c dir | python kripto.py hide - --cover c.png -o out.png
+    python kripto.py reveal out.png -o - | tar x
+
+Data dari stdin disalin per chunk ke file sementara dan output ke stdout
+dikirim per chunk, jadi tidak pernah di-buffer utuh di memori CLI. Pesan
+progress pipeline dialihkan ke stderr agar stdout bersih untuk data
+(--quiet untuk mematikannya, --trace FILE untuk timing per tahap).
+"""
+
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+
+from integrated_system import IntegratedSecuritySystem
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _copy_stream(src, dst):
+    shutil.copyfileobj(src, dst, CHUNK_SIZE)
+
+
+@contextlib.contextmanager
+def _input_path(path: str, workdir: str, name: str):
+    """Path file untuk input; "-" berarti stdin yang di-stream ke file sementara"""
+    if path != "-":
+        yield path
+        return
+    tmp_path = os.path.join(workdir, name)
+    with open(tmp_path, "wb") as f:
+        _copy_stream(sys.stdin.buffer, f)
+    yield tmp_path
+
+
+def _emit_output(tmp_path: str, output: str):
+    """Stream hasil ke output per chunk; "-" berarti stdout"""
+    with open(tmp_path, "rb") as f:
+        if output == "-":
+            _copy_stream(f, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            with open(output, "wb") as out:
+                _copy_stream(f, out)
+
+
+def _system(args) -> IntegratedSecuritySystem:
+    tracer = None
+    if args.trace:
+        from pipeline_trace import JsonLinesSink, Tracer
+        tracer = Tracer(JsonLinesSink(args.trace))
+    return IntegratedSecuritySystem(
+        sender_private_key_path=args.private_key,
+        sender_public_key_path=args.public_key,
+        receiver_public_key_path=args.public_key,
+        receiver_private_key_path=args.private_key,
+        defer_key_setup=True,
+        tracer=tracer,
+        verbose=not args.quiet
+    )
+
+
+# ============================================================================
+# SUBCOMMANDS
+# ============================================================================
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"harus >= 0: {value}")
+    return number
+
+
+def cmd_keygen(args):
+    from generate_keys import generate_keypair
+    if os.path.exists(args.private_key) and not args.force:
+        print(f"[!] {args.private_key} sudah ada (pakai --force untuk menimpa)", file=sys.stderr)
+        return 1
+    generate_keypair(args.private_key, args.public_key, args.bits)
+    return 0
+
+
+def cmd_hide(args):
+    system = _system(args)
+
+    if args.estimate:
+        if args.input == "-":
+            print("[!] --estimate butuh file input, bukan stdin", file=sys.stderr)
+            return 2
+        calibration = None
+        if args.calibration:
+            from integrated_system import load_calibration
+            calibration = load_calibration(args.calibration)
+        estimate = system.estimate_payload(os.path.getsize(args.input), args.cover, calibration)
+        for key, value in estimate.items():
+            print(f"{key:<24} {value}")
+        return 0 if estimate.get('fits', True) else 1
+
+    with tempfile.TemporaryDirectory(prefix="kripto_") as workdir:
+        with _input_path(args.input, workdir, "input.bin") as input_path:
+            output_tmp = os.path.join(workdir, "stego.png")
+            with contextlib.redirect_stdout(sys.stderr):
+                if args.entry is not None or args.append:
+                    success, message = system.append_file_to_image(
+                        input_path, args.cover, output_tmp,
+                        entry_name=args.entry or (os.path.basename(args.input) if args.input != "-" else "stdin")
+                    )
+                else:
+                    success, message = system.encrypt_and_hide(input_path, args.cover, output_tmp)
+            if not success:
+                print(f"[✗] {message}", file=sys.stderr)
+                return 1
+            _emit_output(output_tmp, args.output)
+    return 0
+
+
+def cmd_reveal(args):
+    system = _system(args)
+
+    with tempfile.TemporaryDirectory(prefix="kripto_") as workdir:
+        with _input_path(args.stego, workdir, "stego.png") as stego_path:
+            if args.list:
+                for name, size in system.list_image_entries(stego_path):
+                    print(f"{size:>10}  {name}")
+                return 0
+
+            output_tmp = os.path.join(workdir, "plaintext.bin")
+            with contextlib.redirect_stdout(sys.stderr):
+                if args.offset is not None or args.length is not None:
+                    try:
+                        reader = system.open_range_reader(stego_path, args.entry)
+                        offset = args.offset or 0
+                        length = args.length if args.length is not None else reader.plaintext_size - offset
+                        with open(output_tmp, "wb") as f:
+                            # Dekripsi per chunk supaya range besar tidak di-buffer utuh
+                            end = min(offset + length, reader.plaintext_size)
+                            while offset < end:
+                                n = min(CHUNK_SIZE * 3, end - offset)
+                                f.write(reader.read(offset, n))
+                                offset += n
+                        success, message = True, "Range didekripsi (tanpa verifikasi signature)"
+                    except KeyError as e:
+                        success, message = False, f"Entry {e} tidak ditemukan"
+                    except ValueError as e:
+                        success, message = False, str(e)
+                elif args.entry is not None:
+                    success, message = system.extract_entry(stego_path, args.entry, output_tmp)
+                else:
+                    success, message = system.extract_and_decrypt(stego_path, output_tmp)
+            if not success:
+                print(f"[✗] {message}", file=sys.stderr)
+                return 1
+            _emit_output(output_tmp, args.output)
+    return 0
+
+
+def cmd_scan(args):
+    import stego_container
+    from cover_cache import decode_cover
+    from image_preview import read_image_info
+    from lsb_array import read_frame_header
+
+    status = 0
+    for path in args.paths:
+        try:
+            info = read_image_info(path)
+            pixels = decode_cover(path)
+            directory = stego_container.read_directory(pixels)
+            if directory is not None:
+                content = f"container: {len(directory.entries)}/{directory.slots} entry, {directory.data_end} bytes"
+            else:
+                try:
+                    _, length = read_frame_header(pixels)
+                    content = f"payload stegano: {length} bytes"
+                except ValueError:
+                    content = "tidak ada payload"
+            print(f"{path}: {info['width']}x{info['height']} {info['mode']}, "
+                  f"kapasitas {info['capacity_bytes']} bytes, {content}")
+        except Exception as e:
+            print(f"{path}: error: {e}", file=sys.stderr)
+            status = 1
+    return status
+
+
+def cmd_audit(args):
+    import signature_audit
+    audit_args = list(args.paths) + ["-o", args.output,
+                                     "--private-key", args.private_key, "--public-key", args.public_key]
+    if args.recursive:
+        audit_args.append("--recursive")
+    if args.workers:
+        audit_args += ["--workers", str(args.workers)]
+    return signature_audit.main(audit_args)
+
+
+def cmd_bench(args):
+    status = 0
+    if args.startup:
+        import startup_bench
+        status = startup_bench.main([])
+    if args.memory:
+        import memory_bench
+        status = memory_bench.main([]) or status
+    if args.suite:
+        import bench_suite
+        suite_args = ["run", "--quick"] if args.quick else ["run"]
+        if args.json:
+            suite_args += ["-o", args.json]
+        if args.baseline:
+            suite_args += ["--baseline", args.baseline]
+        return bench_suite.main(suite_args) or status
+
+    from aes_stego_manager import SecurityIntegrator
+    from research_lab import speed_test
+    engine = SecurityIntegrator()
+    for size in args.sizes:
+        print(f"AES {size:>6} KB : {speed_test(engine, size):.5f} detik")
+    return status
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="kripto", description="Cryptography + steganography CLI")
+    parser.add_argument("--private-key", default="private_key.pem")
+    parser.add_argument("--public-key", default="public_key.pem")
+    parser.add_argument("-q", "--quiet", action="store_true", help="sembunyikan pesan progress pipeline")
+    parser.add_argument("--trace", metavar="FILE", help="catat waktu & byte per tahap ke FILE (JSON-lines)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("keygen", help="buat pasangan kunci RSA")
+    p.add_argument("--bits", type=int, default=2048)
+    p.add_argument("--force", action="store_true", help="timpa kunci yang sudah ada")
+    p.set_defaults(func=cmd_keygen)
+
+    p = sub.add_parser("hide", help="enkripsi file dan sembunyikan dalam gambar")
+    p.add_argument("input", help='file plaintext, atau "-" untuk stdin')
+    p.add_argument("--cover", required=True, help="cover image (atau stego container untuk --append)")
+    p.add_argument("-o", "--output", default="-", help='stego PNG, atau "-" untuk stdout')
+    p.add_argument("--append", action="store_true", help="tambahkan sebagai entry container")
+    p.add_argument("--entry", help="nama entry container (mengaktifkan --append)")
+    p.add_argument("--estimate", action="store_true", help="hanya estimasi ukuran payload (dry-run)")
+    p.add_argument("--calibration", help="hasil JSON bench_suite untuk prediksi waktu (dengan --estimate)")
+    p.set_defaults(func=cmd_hide)
+
+    p = sub.add_parser("reveal", help="ekstrak dan dekripsi file dari gambar")
+    p.add_argument("stego", help='stego PNG, atau "-" untuk stdin')
+    p.add_argument("-o", "--output", default="-", help='file output, atau "-" untuk stdout')
+    p.add_argument("--entry", help="nama entry container")
+    p.add_argument("--list", action="store_true", help="daftar entry container")
+    p.add_argument("--offset", type=_non_negative_int, help="offset byte plaintext (random access)")
+    p.add_argument("--length", type=_non_negative_int, help="jumlah byte plaintext (random access)")
+    p.set_defaults(func=cmd_reveal)
+
+    p = sub.add_parser("scan", help="cek kapasitas dan isi tersembunyi gambar")
+    p.add_argument("paths", nargs="+")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("audit", help="verifikasi signature banyak stego image (paralel)")
+    p.add_argument("paths", nargs="+", help="stego image atau folder")
+    p.add_argument("-o", "--output", default="audit.csv", help="laporan .csv atau .parquet")
+    p.add_argument("-r", "--recursive", action="store_true")
+    p.add_argument("--workers", type=int)
+    p.set_defaults(func=cmd_audit)
+
+    p = sub.add_parser("bench", help="benchmark startup dan kecepatan")
+    p.add_argument("--startup", action="store_true", help="jalankan juga startup_bench")
+    p.add_argument("--memory", action="store_true", help="jalankan juga memory_bench (peak memory per tahap)")
+    p.add_argument("--suite", action="store_true", help="jalankan bench_suite (semua tahap, grid ukuran x resolusi)")
+    p.add_argument("--quick", action="store_true", help="grid kecil untuk --suite")
+    p.add_argument("--json", help="simpan hasil --suite sebagai JSON (juga tabel kalibrasi)")
+    p.add_argument("--baseline", help="bandingkan hasil --suite dengan baseline JSON")
+    p.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000], help="ukuran data AES (KB)")
+    p.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
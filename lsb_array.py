@@ -0,0 +1,93 @@
+"""
+lsb_array.py
+====================================
+LSB embedding berbasis NumPy yang kompatibel dengan format stegano.lsb:
+prefix panjang "<n>:" + pesan (UTF-8), 8 bit per byte, 3 bit per pixel
+(R, G, B) berurutan baris demi baris. Alpha tidak disentuh.
+"""
+
+import numpy as np
+
+
+def message_bits(message: str, encoding: str = "UTF-8") -> np.ndarray:
+    """Bit stream (uint8 0/1) yang ditulis stegano untuk message, dibulatkan ke kelipatan 3"""
+    data = message.encode(encoding)
+    framed = (str(len(data)) + ":").encode("ascii") + data
+    bits = np.unpackbits(np.frombuffer(framed, dtype=np.uint8))
+    remainder = len(bits) % 3
+    if remainder:
+        bits = np.concatenate([bits, np.zeros(3 - remainder, dtype=np.uint8)])
+    return bits
+
+
+def embed_message(pixels: np.ndarray, message: str, encoding: str = "UTF-8") -> np.ndarray:
+    """
+    Sisipkan message ke salinan pixels (HxWx3/4, uint8) dan kembalikan salinannya.
+    Array input tidak diubah sehingga aman dipakai dengan CoverCache.
+    """
+    if not message:
+        raise ValueError("message length is zero")
+    
+    bits = message_bits(message, encoding)
+    n_pixels = len(bits) // 3
+    height, width, channels = pixels.shape
+    if n_pixels > height * width:
+        raise ValueError(f"The message you want to hide is too long: {len(bits) // 8} bytes")
+    
+    stego = np.array(pixels, copy=True)
+    flat = stego.reshape(-1, channels)
+    flat[:n_pixels, :3] = (flat[:n_pixels, :3] & 0xFE) | bits.reshape(-1, 3)
+    return stego
+
+
+def capacity_bytes(pixels: np.ndarray) -> int:
+    """Jumlah byte penuh yang muat di LSB kanal RGB"""
+    height, width = pixels.shape[:2]
+    return height * width * 3 // 8
+
+
+def _bit_positions(channels: int, bit_start: int, n_bits: int) -> np.ndarray:
+    """Index flat (pixels.reshape(-1)) untuk bit stream [bit_start, bit_start + n_bits)"""
+    bits = np.arange(bit_start, bit_start + n_bits, dtype=np.int64)
+    return (bits // 3) * channels + bits % 3
+
+
+def read_bytes(pixels: np.ndarray, byte_offset: int, length: int) -> bytes:
+    """Baca length byte dari bit stream LSB mulai byte_offset, tanpa men-decode sisanya"""
+    if byte_offset < 0 or length < 0 or byte_offset + length > capacity_bytes(pixels):
+        raise ValueError("Range di luar kapasitas gambar")
+    positions = _bit_positions(pixels.shape[-1], 8 * byte_offset, 8 * length)
+    return np.packbits(pixels.reshape(-1)[positions] & 1).tobytes()
+
+
+def write_bytes(pixels: np.ndarray, byte_offset: int, data: bytes):
+    """Tulis data ke bit stream LSB mulai byte_offset (in-place), hanya menyentuh bit yang perlu"""
+    if byte_offset < 0 or byte_offset + len(data) > capacity_bytes(pixels):
+        raise ValueError("Data melebihi kapasitas gambar")
+    positions = _bit_positions(pixels.shape[-1], 8 * byte_offset, 8 * len(data))
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+    flat = pixels.reshape(-1)
+    flat[positions] = (flat[positions] & 0xFE) | bits
+
+
+def locate_byte(byte_offset: int, width: int) -> tuple:
+    """Posisi (row, col, channel) bit pertama dari byte ke-byte_offset pada bit stream"""
+    bit = 8 * byte_offset
+    pixel = bit // 3
+    return pixel // width, pixel % width, bit % 3
+
+
+def read_frame_header(pixels: np.ndarray, max_digits: int = 20) -> tuple:
+    """
+    Baca hanya prefix "<n>:" dari pesan format stegano.
+    Return (offset byte awal pesan, panjang pesan dalam byte).
+    """
+    digits = b""
+    for offset in range(min(max_digits + 1, capacity_bytes(pixels))):
+        byte = read_bytes(pixels, offset, 1)
+        if byte == b":":
+            if not digits.isdigit():
+                break
+            return offset + 1, int(digits)
+        digits += byte
+    raise ValueError("Impossible to detect message.")
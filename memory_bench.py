@@ -0,0 +1,138 @@
+"""
+memory_bench.py
+====================================
+Profil peak memory per tahap pipeline (tracemalloc) untuk input referensi,
+dengan pengecekan budget.
+
+Input referensi dibuat deterministik di folder sementara: plaintext acak
+(seed tetap) dan cover PNG noise. Satu putaran encrypt_and_hide +
+extract_and_decrypt dijalankan dulu tanpa profiling (import, kunci, cover
+cache), lalu putaran kedua diprofil dengan pipeline_trace.MemoryProfiler.
+Jika peak salah satu pipeline melebihi budget, script keluar dengan
+status 1 sehingga bisa dipakai sebagai guard regresi di CI.
+
+Run: python memory_bench.py
+     python memory_bench.py --size 32768 --top 5 --budget encrypt=8
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+from integrated_system import DECRYPT_STAGES, ENCRYPT_STAGES, IntegratedSecuritySystem
+from pipeline_trace import MemoryCollector, MemoryProfiler
+
+REFERENCE_PLAINTEXT_BYTES = 16 * 1024
+REFERENCE_COVER_SIZE = (512, 512)
+
+# Budget (MB) peak alokasi per pipeline untuk input referensi
+DEFAULT_BUDGETS_MB = {
+    "encrypt": 3.0,
+    "decrypt": 1.5,
+}
+
+
+def make_reference_inputs(workdir: str, plaintext_bytes: int = REFERENCE_PLAINTEXT_BYTES,
+                          cover_size: tuple = REFERENCE_COVER_SIZE, seed: int = 0) -> tuple:
+    """Tulis plaintext dan cover referensi ke workdir; return (plaintext_path, cover_path)"""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    plaintext_path = os.path.join(workdir, "reference.bin")
+    with open(plaintext_path, "wb") as f:
+        f.write(rng.randbytes(plaintext_bytes))
+
+    width, height = cover_size
+    cover_path = os.path.join(workdir, "reference_cover.png")
+    Image.frombytes("RGB", cover_size, rng.randbytes(width * height * 3)).save(cover_path)
+    return plaintext_path, cover_path
+
+
+def profile_pipeline(plaintext_bytes: int = REFERENCE_PLAINTEXT_BYTES,
+                     cover_size: tuple = REFERENCE_COVER_SIZE, top: int = 0) -> list:
+    """Jalankan pipeline referensi dengan MemoryProfiler; return list record per tahap"""
+    with tempfile.TemporaryDirectory(prefix="kripto_mem_") as workdir:
+        plaintext_path, cover_path = make_reference_inputs(workdir, plaintext_bytes, cover_size)
+        stego_path = os.path.join(workdir, "stego.png")
+        output_path = os.path.join(workdir, "recovered.bin")
+
+        system = IntegratedSecuritySystem(
+            sender_private_key_path=os.path.join(workdir, "private_key.pem"),
+            sender_public_key_path=os.path.join(workdir, "public_key.pem"),
+            receiver_public_key_path=os.path.join(workdir, "public_key.pem"),
+            receiver_private_key_path=os.path.join(workdir, "private_key.pem"),
+            verbose=False
+        )
+
+        def run_once():
+            ok, message = system.encrypt_and_hide(plaintext_path, cover_path, stego_path)
+            if ok:
+                ok, message = system.extract_and_decrypt(stego_path, output_path)
+            if not ok:
+                raise RuntimeError(message)
+
+        # Putaran pemanasan: import, load kunci dan cover cache tidak ikut diukur
+        run_once()
+
+        collector = MemoryCollector()
+        system.tracer = MemoryProfiler(collector, top=top)
+        try:
+            run_once()
+        finally:
+            system.tracer.close()
+            system.security.cover_cache.invalidate(cover_path)
+        return collector.records
+
+
+def check_budgets(records: list, budgets: dict) -> list:
+    """Peak terbesar per pipeline dibandingkan dengan budget (MB)"""
+    results = []
+    for pipeline, budget in budgets.items():
+        stages = [r for r in records if r['pipeline'] == pipeline]
+        peak = max((r['mem_peak_bytes'] for r in stages), default=0)
+        worst = max(stages, key=lambda r: r['mem_peak_bytes'])['stage'] if stages else None
+        results.append({
+            'pipeline': pipeline,
+            'peak_mb': peak / 1e6,
+            'worst_stage': worst,
+            'budget_mb': budget,
+            'ok': peak / 1e6 <= budget,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Peak-memory profile per pipeline stage")
+    parser.add_argument("--size", type=int, default=REFERENCE_PLAINTEXT_BYTES, help="ukuran plaintext (byte)")
+    parser.add_argument("--cover", type=int, nargs=2, default=REFERENCE_COVER_SIZE, metavar=("W", "H"))
+    parser.add_argument("--top", type=int, default=0, help="tampilkan N baris alokasi terbesar per tahap")
+    parser.add_argument("--budget", action="append", default=[],
+                        help="pipeline=MB, menimpa budget default (encrypt/decrypt)")
+    args = parser.parse_args(argv)
+
+    budgets = dict(DEFAULT_BUDGETS_MB)
+    for item in args.budget:
+        pipeline, _, mb = item.partition("=")
+        budgets[pipeline] = float(mb)
+
+    records = profile_pipeline(args.size, tuple(args.cover), args.top)
+    order = {stage: i for i, stage in enumerate(ENCRYPT_STAGES + DECRYPT_STAGES)}
+    print(f"{'pipeline':<8} {'stage':<8} {'peak KB':>10} {'retained KB':>12} {'in KB':>9} {'out KB':>9}")
+    for r in sorted(records, key=lambda r: (r['pipeline'] != 'encrypt', order[r['stage']])):
+        print(f"{r['pipeline']:<8} {r['stage']:<8} {r['mem_peak_bytes'] / 1024:10.1f} "
+              f"{r['mem_retained_bytes'] / 1024:12.1f} {r['bytes_in'] / 1024:9.1f} {r['bytes_out'] / 1024:9.1f}")
+        for line in r.get('top_allocations', []):
+            print(f"         {line}")
+
+    results = check_budgets(records, budgets)
+    for r in results:
+        mark = "✓" if r['ok'] else "✗"
+        print(f"[{mark}] {r['pipeline']:<8} peak {r['peak_mb']:.2f} MB di tahap {r['worst_stage']} "
+              f"(budget {r['budget_mb']:.1f} MB)")
+    return 0 if all(r['ok'] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
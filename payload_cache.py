@@ -0,0 +1,120 @@
+"""
+payload_cache.py
+====================================
+Cache payload terenkripsi (content-addressed) untuk dokumen yang sering
+disembunyikan berulang kali (template, file kebijakan).
+
+Kunci cache: SHA-256 plaintext + fingerprint kunci publik penerima (kunci
+pembungkus AES) + fingerprint kunci privat penandatangan. Nilainya payload
+JSON final (signature, AES, kunci AES terbungkus RSA), jadi hide berikutnya
+untuk plaintext yang sama langsung ke tahap embed. Signature tetap valid
+karena plaintext identik; ganti kunci = fingerprint berubah = cache miss.
+
+PERHATIAN: payload dari cache identik byte-per-byte (kunci AES dan IV sama),
+sehingga stego image yang membawa dokumen yang sama bisa dikaitkan satu sama
+lain oleh pihak yang bisa mengekstrak payload. Pakai ttl untuk membatasi
+berapa lama satu payload dipakai ulang.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+_fingerprints = {}  # path -> ((mtime_ns, size), sha256)
+_fingerprint_lock = threading.Lock()
+
+
+def key_fingerprint(path: str) -> str:
+    """SHA-256 isi file kunci, di-cache per (path, mtime, size)"""
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    signature = (st.st_mtime_ns, st.st_size)
+    with _fingerprint_lock:
+        entry = _fingerprints.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+    with open(key, 'rb') as f:
+        fingerprint = hashlib.sha256(f.read()).hexdigest()
+    with _fingerprint_lock:
+        _fingerprints[key] = (signature, fingerprint)
+    return fingerprint
+
+
+class PayloadCache:
+    """
+    LRU cache payload dengan batas total ukuran (byte) dan TTL opsional
+    (detik sejak payload dibuat). Aman dipakai dari beberapa thread.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (created, payload)
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def make_key(self, plaintext: bytes, recipient_key_path: str, signer_key_path: str) -> tuple:
+        return (
+            hashlib.sha256(plaintext).hexdigest(),
+            key_fingerprint(recipient_key_path),
+            key_fingerprint(signer_key_path),
+        )
+
+    def get(self, key: tuple) -> Optional[str]:
+        """Payload untuk key, atau None jika belum ada/kedaluwarsa"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and self._clock() - entry[0] > self.ttl:
+                self._discard(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, payload: str):
+        size = len(payload)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (self._clock(), payload)
+            self._current_bytes += size
+            while self._current_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def invalidate(self, key: tuple):
+        """Hapus satu entry dari cache"""
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= len(entry[1])
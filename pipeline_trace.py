@@ -0,0 +1,254 @@
+"""
+pipeline_trace.py
+====================================
+Instrumentasi per tahap untuk pipeline IntegratedSecuritySystem.
+
+Setiap tahap (ENCRYPT_STAGES / DECRYPT_STAGES) dibungkus span yang mencatat:
+  pipeline, stage, wall_s (perf_counter), cpu_s (process_time),
+  bytes_in, bytes_out, ok (False jika tahap raise exception)
+
+Record dikirim ke satu atau lebih sink (callable yang menerima dict):
+  MemoryCollector  - simpan di list, plus ringkasan per tahap
+  JsonLinesSink    - satu record JSON per baris ke file
+  LoggerSink       - ke logging.Logger
+
+MemoryProfiler menambahkan peak dan retained allocation per tahap
+(tracemalloc); lihat memory_bench.py untuk pengecekan budget memori.
+
+Tanpa tracer, pipeline memakai NULL_TRACER: tidak ada pemanggilan timer
+sama sekali, span yang dikembalikan adalah satu objek no-op yang sama.
+
+Contoh:
+    collector = MemoryCollector()
+    system = IntegratedSecuritySystem(tracer=Tracer(collector), verbose=False)
+    system.encrypt_and_hide("secret.txt", "cover.png", "stego.png")
+    print(collector.summary())
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+
+class StageSpan:
+    """Context manager satu tahap; isi bytes_out sebelum blok selesai"""
+
+    __slots__ = ('tracer', 'pipeline', 'stage', 'bytes_in', 'bytes_out', '_started', '_wall', '_cpu')
+
+    def __init__(self, tracer, pipeline: str, stage: str, bytes_in: int = 0):
+        self.tracer = tracer
+        self.pipeline = pipeline
+        self.stage = stage
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+
+    def __enter__(self):
+        self._started = time.time()
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.emit(self._finish(exc_type))
+        return False
+
+    def _finish(self, exc_type) -> dict:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        return {
+            'pipeline': self.pipeline,
+            'stage': self.stage,
+            'time': self._started,
+            'wall_s': wall,
+            'cpu_s': cpu,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'ok': exc_type is None,
+            'pid': os.getpid(),
+        }
+
+
+class _NullSpan:
+    """Span no-op; atribut boleh ditulis tapi diabaikan"""
+
+    __slots__ = ('bytes_in', 'bytes_out')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class NullTracer:
+    """Tracer nonaktif (default)"""
+
+    enabled = False
+    _span = _NullSpan()
+
+    def stage(self, pipeline: str, stage: str, bytes_in: int = 0):
+        return self._span
+
+    def emit(self, record: dict):
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+
+class Tracer:
+    """Tracer aktif; setiap record tahap dikirim ke semua sink"""
+
+    enabled = True
+
+    def __init__(self, *sinks):
+        self.sinks = list(sinks)
+
+    def stage(self, pipeline: str, stage: str, bytes_in: int = 0) -> StageSpan:
+        return StageSpan(self, pipeline, stage, bytes_in)
+
+    def emit(self, record: dict):
+        for sink in self.sinks:
+            sink(record)
+
+    def close(self):
+        for sink in self.sinks:
+            close = getattr(sink, 'close', None)
+            if close is not None:
+                close()
+
+
+# ============================================================================
+# MEMORY PROFILING
+# ============================================================================
+
+class MemoryStageSpan(StageSpan):
+    """StageSpan yang juga mengukur alokasi Python (tracemalloc) selama tahap"""
+
+    __slots__ = ('_mem_start', '_snapshot')
+
+    def __enter__(self):
+        self._snapshot = tracemalloc.take_snapshot() if self.tracer.top else None
+        tracemalloc.reset_peak()
+        self._mem_start = tracemalloc.get_traced_memory()[0]
+        return super().__enter__()
+
+    def _finish(self, exc_type) -> dict:
+        record = super()._finish(exc_type)
+        current, peak = tracemalloc.get_traced_memory()
+        record['mem_start_bytes'] = self._mem_start
+        record['mem_peak_bytes'] = peak - self._mem_start
+        record['mem_retained_bytes'] = current - self._mem_start
+        if self._snapshot is not None:
+            diff = tracemalloc.take_snapshot().filter_traces(self.tracer.filters).compare_to(
+                self._snapshot.filter_traces(self.tracer.filters), 'lineno')
+            record['top_allocations'] = [str(stat) for stat in diff[:self.tracer.top]]
+            self._snapshot = None
+        return record
+
+
+class MemoryProfiler(Tracer):
+    """
+    Tracer mode profiling memori (opt-in). Selain waktu dan byte, setiap
+    record berisi:
+      mem_peak_bytes     - puncak alokasi selama tahap, relatif ke awal tahap
+      mem_retained_bytes - alokasi yang masih hidup saat tahap selesai
+      top_allocations    - (jika top > 0) baris kode dengan selisih alokasi terbesar
+
+    tracemalloc di-start otomatis pada tahap pertama dan di-stop oleh close()
+    (jika profiler yang men-start-nya). tracemalloc memperlambat eksekusi,
+    jadi wall_s/cpu_s dari mode ini tidak dipakai untuk benchmark.
+    """
+
+    def __init__(self, *sinks, top: int = 0, frames: int = 1):
+        super().__init__(*sinks)
+        self.top = top
+        self.frames = frames
+        self.filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        self._started_tracing = False
+
+    def stage(self, pipeline: str, stage: str, bytes_in: int = 0) -> MemoryStageSpan:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        return MemoryStageSpan(self, pipeline, stage, bytes_in)
+
+    def close(self):
+        super().close()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+# ============================================================================
+# SINKS
+# ============================================================================
+
+class MemoryCollector:
+    """Kumpulkan record di memori (untuk test, GUI, benchmark)"""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict):
+        with self._lock:
+            self.records.append(record)
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+
+    def summary(self) -> dict:
+        """{(pipeline, stage): {count, wall_s, cpu_s, bytes_in, bytes_out}} (total)"""
+        totals = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            key = (record['pipeline'], record['stage'])
+            entry = totals.setdefault(key, {'count': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'bytes_in': 0, 'bytes_out': 0})
+            entry['count'] += 1
+            for field in ('wall_s', 'cpu_s', 'bytes_in', 'bytes_out'):
+                entry[field] += record[field]
+        return totals
+
+
+class JsonLinesSink:
+    """Tulis setiap record sebagai satu baris JSON (file dibuka mode append)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict):
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self._fh.write(line)
+            self._fh.flush()
+
+    def close(self):
+        self._fh.close()
+
+
+class LoggerSink:
+    """Kirim record ke logger (default: logger 'kripto.trace', level INFO)"""
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("kripto.trace")
+        self.level = level
+
+    def __call__(self, record: dict):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level, "%s.%s wall=%.6fs cpu=%.6fs in=%dB out=%dB%s",
+                record['pipeline'], record['stage'], record['wall_s'], record['cpu_s'],
+                record['bytes_in'], record['bytes_out'], "" if record['ok'] else " FAILED",
+                extra={'trace': record},
+            )
@@ -1,56 +1,45 @@
-import cv2
-import numpy as np
-import matplotlib.pyplot as plt
 import time
 import os
 from aes_stego_manager import SecurityIntegrator
 
+# NumPy, matplotlib, image_metrics dan image_histogram di-import di dalam fungsi yang memakainya,
+# supaya run yang hanya melakukan speed test tidak membayar biaya import-nya.
+
 
 def calculate_psnr_mse(image_path_original, image_path_stego):
     """Menghitung nilai MSE dan PSNR untuk Paper Bab Result."""
-    img1 = cv2.imread(image_path_original)
-    img2 = cv2.imread(image_path_stego)
+    from image_metrics import compare_images
     
-    if img1 is None or img2 is None:
+    # Selisih dihitung di float32 (pengurangan uint8 langsung wrap-around modulo 256)
+    try:
+        metrics = compare_images(image_path_original, image_path_stego, ssim=False)
+    except (OSError, ValueError):
         return "Error", "Error"
-
-    mse = np.mean((img1 - img2) ** 2)
     
+    mse = metrics['mse']
     if mse == 0:
         psnr = 100
     else:
-        PIXEL_MAX = 255.0
-        psnr = 20 * np.log10(PIXEL_MAX / np.sqrt(mse))
+        psnr = metrics['psnr']
         
     return mse, psnr
 
 def generate_histogram(image_path, title, output_file):
     """Membuat grafik Histogram RGB untuk Paper."""
-    img = cv2.imread(image_path)
-    colors = ('b', 'g', 'r')
+    from image_histogram import HistogramPlotter, image_histogram
     
-    plt.figure()
-    plt.title(f"Histogram: {title}")
-    plt.xlabel("Bins")
-    plt.ylabel("# of Pixels")
-    
-    for i, color in enumerate(colors):
-        hist = cv2.calcHist([img], [i], None, [256], [0, 256])
-        plt.plot(hist, color=color)
-        plt.xlim([0, 256])
-        
-    plt.savefig(output_file)
-    plt.close()
+    # Satu pass np.bincount untuk ketiga kanal; Figure Agg tanpa pyplot
+    HistogramPlotter().render(image_histogram(image_path), title, output_file)
     print(f"[+] Grafik Histogram disimpan: {output_file}")
 
 def speed_test(engine, file_size_kb):
-    """Mengukur kecepatan enkripsi."""
+    """Mengukur kecepatan enkripsi (satu run; untuk benchmark lengkap pakai bench_suite.py)."""
     dummy_data = "A" * (1024 * file_size_kb)
     key = engine.generate_aes_key()
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     engine.encrypt_data_aes(dummy_data, key)
-    end_time = time.time()
+    end_time = time.perf_counter()
     
     duration = end_time - start_time
     return duration
@@ -0,0 +1,147 @@
+"""
+seekable_payload.py
+====================================
+Random-access ke payload yang disembunyikan oleh IntegratedSecuritySystem.
+
+Payload berbentuk JSON dengan layout yang deterministik:
+
+    {"ciphertext": "<B64(IV + AES-CBC(combined))>", "encrypted_key": "<B64>"}
+    combined = {"data": "<B64(plaintext)>", "signature": "<B64>"}
+
+Base64 bisa di-seek per 4 karakter (3 byte) dan dekripsi CBC bisa dilakukan
+per blok (P_i = D(C_i) xor C_{i-1}), jadi range plaintext [offset, offset+n)
+bisa dipetakan ke range byte di bit stream LSB lalu ke pixel/kanal tertentu.
+Hanya range itu yang dibaca dari LSB dan didekripsi. Format payload tidak
+berubah, jadi tidak perlu mode cipher baru (mis. CTR).
+
+PERHATIAN: signature hanya bisa diverifikasi atas plaintext lengkap. Data
+hasil read() parsial BELUM terverifikasi.
+"""
+
+import base64
+import json
+
+import numpy as np
+from Crypto.Cipher import AES
+
+import stego_container
+from lsb_array import read_bytes, read_frame_header
+
+BLOCK = AES.block_size
+
+# Panjang bagian JSON yang tetap (semua karakter Base64 tidak di-escape)
+_PAYLOAD_HEAD = len('{"ciphertext": "')
+_PAYLOAD_OVERHEAD = len(json.dumps({'ciphertext': '', 'encrypted_key': ''}))
+_COMBINED_HEAD = len('{"data": "')
+_COMBINED_OVERHEAD = len(json.dumps({'data': '', 'signature': ''}))
+
+
+def _b64_len(n_bytes: int) -> int:
+    return 4 * ((n_bytes + 2) // 3)
+
+
+class SeekablePayload:
+    """Akses byte mentah payload JSON di dalam bit stream LSB"""
+    
+    def __init__(self, pixels: np.ndarray, base_offset: int, length: int):
+        self.pixels = pixels
+        self.base_offset = base_offset
+        self.length = length
+    
+    @classmethod
+    def from_stegano(cls, pixels: np.ndarray) -> "SeekablePayload":
+        """Payload format stegano ("<n>:" + pesan), seperti hasil encrypt_and_hide"""
+        base_offset, length = read_frame_header(pixels)
+        return cls(pixels, base_offset, length)
+    
+    @classmethod
+    def from_entry(cls, pixels: np.ndarray, name: str) -> "SeekablePayload":
+        """Payload satu entry container (lihat stego_container.py)"""
+        directory = stego_container.read_directory(pixels)
+        if directory is None:
+            raise ValueError("Gambar tidak berisi container")
+        entry = directory.find(name)
+        if entry is None:
+            raise KeyError(name)
+        return cls(pixels, directory.data_start + entry.offset, entry.length)
+    
+    def read(self, offset: int, length: int) -> bytes:
+        """Baca byte payload [offset, offset+length)"""
+        if offset < 0 or length < 0 or offset + length > self.length:
+            raise ValueError("Range di luar payload")
+        return read_bytes(self.pixels, self.base_offset + offset, length)
+    
+    def encrypted_key(self, rsa_key_bytes: int) -> str:
+        """Field encrypted_key (Base64), diambil dari ujung payload"""
+        key_chars = _b64_len(rsa_key_bytes)
+        return self.read(self.length - 2 - key_chars, key_chars).decode('ascii')
+
+
+class PlaintextRangeReader:
+    """
+    Dekripsi range plaintext dari SeekablePayload tanpa membaca/dekripsi sisanya.
+    rsa_key_bytes: ukuran modulus RSA (encrypted_key dan signature).
+    """
+    
+    def __init__(self, payload: SeekablePayload, aes_key: bytes, rsa_key_bytes: int):
+        self.payload = payload
+        self.aes_key = aes_key
+        
+        ciphertext_chars = payload.length - _PAYLOAD_OVERHEAD - _b64_len(rsa_key_bytes)
+        if ciphertext_chars <= 0 or ciphertext_chars % 4:
+            raise ValueError("Layout payload tidak dikenali")
+        tail = self._read_b64(ciphertext_chars - 4, ciphertext_chars)
+        self.aes_bytes = 3 * ciphertext_chars // 4 - (3 - len(tail))
+        if self.aes_bytes % BLOCK or self.aes_bytes < 2 * BLOCK:
+            raise ValueError("Layout payload tidak dikenali")
+        
+        # Padding PKCS#7 diketahui dari blok terakhir
+        n_blocks = self.aes_bytes // BLOCK - 1
+        pad = self._decrypt_blocks(n_blocks - 1, n_blocks)[-1]
+        if not 1 <= pad <= BLOCK:
+            raise ValueError("Padding tidak valid (kunci salah?)")
+        combined_len = self.aes_bytes - BLOCK - pad
+        
+        data_chars = combined_len - _COMBINED_OVERHEAD - _b64_len(rsa_key_bytes)
+        if data_chars < 0 or data_chars % 4:
+            raise ValueError("Layout payload tidak dikenali")
+        self._data_chars = data_chars
+        if data_chars:
+            last = self._read_combined(_COMBINED_HEAD + data_chars - 4, _COMBINED_HEAD + data_chars)
+            self.plaintext_size = 3 * data_chars // 4 - (3 - len(base64.b64decode(last)))
+        else:
+            self.plaintext_size = 0
+    
+    def read(self, offset: int, length: int) -> bytes:
+        """Dekripsi plaintext [offset, offset+length) (dipotong di akhir file)"""
+        if offset < 0 or length < 0:
+            raise ValueError("offset dan length tidak boleh negatif")
+        end = min(offset + length, self.plaintext_size)
+        if offset >= end:
+            return b""
+        group_start, group_end = offset // 3, (end + 2) // 3
+        chars = self._read_combined(_COMBINED_HEAD + 4 * group_start, _COMBINED_HEAD + 4 * group_end)
+        data = base64.b64decode(chars)
+        skip = offset - 3 * group_start
+        return data[skip:skip + end - offset]
+    
+    def _read_b64(self, char_start: int, char_end: int) -> bytes:
+        """Decode karakter Base64 ciphertext [char_start, char_end) (kelipatan 4)"""
+        raw = self.payload.read(_PAYLOAD_HEAD + char_start, char_end - char_start)
+        return base64.b64decode(raw)
+    
+    def _decrypt_blocks(self, first: int, last: int) -> bytes:
+        """Dekripsi blok ciphertext [first, last) (blok 0 = setelah IV)"""
+        # Byte AES [BLOCK*first, BLOCK*(last+1)) mencakup blok sebelumnya sebagai IV
+        byte_start, byte_end = BLOCK * first, BLOCK * (last + 1)
+        group_start, group_end = byte_start // 3, (byte_end + 2) // 3
+        raw = self._read_b64(4 * group_start, 4 * group_end)
+        raw = raw[byte_start - 3 * group_start:][:byte_end - byte_start]
+        cipher = AES.new(self.aes_key, AES.MODE_CBC, raw[:BLOCK])
+        return cipher.decrypt(raw[BLOCK:])
+    
+    def _read_combined(self, start: int, end: int) -> bytes:
+        """Byte JSON combined (plaintext AES) [start, end)"""
+        first, last = start // BLOCK, (end + BLOCK - 1) // BLOCK
+        plain = self._decrypt_blocks(first, last)
+        return plain[start - BLOCK * first:end - BLOCK * first]
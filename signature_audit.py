@@ -0,0 +1,188 @@
+"""
+signature_audit.py
+====================================
+Audit massal: apakah arsip stego image masih membawa payload dengan
+signature valid.
+
+Per gambar: ekstrak payload (stegano, atau setiap entry container),
+unwrap kunci AES (RSA-OAEP), decrypt AES, lalu verifikasi signature
+dengan RSAManager.verify_signature. Plaintext hanya ada di memori worker
+selama verifikasi dan TIDAK PERNAH ditulis ke disk; laporan hanya berisi
+ukuran dan SHA-256-nya.
+
+Berbeda dengan memanggil extract_and_decrypt per gambar:
+- kunci RSA di-load sekali per worker, bukan per gambar
+- gambar diproses paralel di process pool
+- tidak ada file output plaintext
+
+Status per payload:
+  valid      - signature cocok
+  invalid    - payload terbaca dan terdekripsi, signature tidak cocok
+  unreadable - tidak ada payload, format rusak, atau gagal dekripsi (kunci salah)
+
+Run: python signature_audit.py archive/ -r -o audit.csv --workers 8
+     python kripto.py audit archive/ -r -o audit.csv
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
+
+STATUSES = ("valid", "invalid", "unreadable")
+
+REPORT_FIELDS = (
+    "path", "entry", "status", "payload_bytes", "plaintext_bytes",
+    "plaintext_sha256", "seconds", "error",
+)
+
+
+class AuditKeys:
+    """Kunci RSA yang sudah di-parse, dipakai ulang untuk semua payload"""
+
+    def __init__(self, private_key_path: str = "private_key.pem", public_key_path: str = "public_key.pem"):
+        from aes_stego_manager import SecurityIntegrator
+        from rsa_manager import RSAManager
+
+        self.rsa_mgr = RSAManager(private_key_path=private_key_path, public_key_path=public_key_path)
+        self.private_key = self.rsa_mgr.load_private_key()
+        self.public_key = self.rsa_mgr.load_public_key()
+        self.security = SecurityIntegrator(cover_cache=None, verbose=False)
+
+    def verify_payload(self, payload_json: str) -> dict:
+        """Verifikasi satu payload; return dict status/plaintext_bytes/plaintext_sha256/error"""
+        try:
+            payload = json.loads(payload_json)
+            aes_key = self.rsa_mgr.decrypt_aes_key_with_rsa(payload['encrypted_key'], self.private_key)
+            combined_json = self.security.decrypt_data_aes(payload['ciphertext'], aes_key)
+            if combined_json.startswith("Error Decrypting"):
+                return {'status': "unreadable", 'error': combined_json}
+            combined = json.loads(combined_json)
+            plaintext = base64.b64decode(combined['data'])
+            valid = self.rsa_mgr.verify_signature(plaintext, combined['signature'], self.public_key)
+        except (ValueError, KeyError, TypeError) as e:
+            # JSONDecodeError, OAEP gagal (kunci salah), Base64 rusak, field hilang
+            return {'status': "unreadable", 'error': str(e) or type(e).__name__}
+        return {
+            'status': "valid" if valid else "invalid",
+            'plaintext_bytes': len(plaintext),
+            'plaintext_sha256': hashlib.sha256(plaintext).hexdigest(),
+            'error': "" if valid else "Signature tidak valid",
+        }
+
+
+def read_payloads(pixels) -> List[tuple]:
+    """Semua payload dalam gambar sebagai [(entry, payload_json)]; entry '' untuk format stegano"""
+    import stego_container
+    from lsb_array import read_bytes, read_frame_header
+
+    directory = stego_container.read_directory(pixels)
+    if directory is not None:
+        return [
+            (entry.name, stego_container.read_entry(pixels, entry.name, directory).decode('ascii'))
+            for entry in directory.entries
+        ]
+    offset, length = read_frame_header(pixels)
+    return [("", read_bytes(pixels, offset, length).decode('utf-8'))]
+
+
+# ============================================================================
+# WORKER
+# ============================================================================
+
+_worker_keys = None
+
+
+def _init_worker(private_key_path: str, public_key_path: str):
+    global _worker_keys
+    _worker_keys = AuditKeys(private_key_path, public_key_path)
+
+
+def _audit_path(path: str) -> List[dict]:
+    from cover_cache import decode_cover
+
+    start = time.perf_counter()
+    try:
+        payloads = read_payloads(decode_cover(path))
+    except Exception as e:
+        return [{'path': path, 'entry': "", 'status': "unreadable", 'error': str(e),
+                 'seconds': time.perf_counter() - start}]
+
+    rows = []
+    for entry, payload_json in payloads:
+        row = {'path': path, 'entry': entry, 'payload_bytes': len(payload_json)}
+        row.update(_worker_keys.verify_payload(payload_json))
+        row['seconds'] = time.perf_counter() - start
+        start = time.perf_counter()
+        rows.append(row)
+    return rows
+
+
+def audit_paths(paths: Iterable[str], private_key_path: str = "private_key.pem",
+                public_key_path: str = "public_key.pem", workers: Optional[int] = None,
+                chunksize: int = 4):
+    """Generator baris laporan (satu per payload, urut sesuai input); workers=1 tanpa pool"""
+    if workers == 1:
+        _init_worker(private_key_path, public_key_path)
+        for path in paths:
+            yield from _audit_path(path)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(private_key_path, public_key_path)) as pool:
+        for rows in pool.map(_audit_path, paths, chunksize=chunksize):
+            yield from rows
+
+
+def main(argv=None):
+    from image_metrics import write_table
+    from steganalysis import collect_images
+
+    parser = argparse.ArgumentParser(description="Parallel signature audit for stego image archives")
+    parser.add_argument("paths", nargs="+", help="stego image atau folder")
+    parser.add_argument("-o", "--output", default="audit.csv", help=".csv atau .parquet")
+    parser.add_argument("-r", "--recursive", action="store_true")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--private-key", default="private_key.pem")
+    parser.add_argument("--public-key", default="public_key.pem")
+    args = parser.parse_args(argv)
+
+    for key_path in (args.private_key, args.public_key):
+        if not os.path.exists(key_path):
+            print(f"[✗] Kunci tidak ditemukan: {key_path}")
+            return 1
+    images = collect_images(args.paths, args.recursive)
+    if not images:
+        print("[!] Tidak ada gambar")
+        return 1
+
+    print(f"[*] Mengaudit {len(images)} gambar...")
+    start = time.perf_counter()
+    counts = dict.fromkeys(STATUSES, 0)
+    payload_bytes = 0
+
+    def rows():
+        nonlocal payload_bytes
+        for row in audit_paths(images, args.private_key, args.public_key, args.workers):
+            counts[row['status']] += 1
+            payload_bytes += row.get('payload_bytes') or 0
+            if row['status'] != "valid":
+                label = f"{row['path']}:{row['entry']}" if row['entry'] else row['path']
+                print(f"[✗] {label}: {row['status']} ({row['error']})")
+            yield row
+
+    total = write_table(args.output, rows(), REPORT_FIELDS)
+    elapsed = time.perf_counter() - start
+    print(f"[✓] {total} payload: {counts['valid']} valid, {counts['invalid']} invalid, "
+          f"{counts['unreadable']} unreadable -> {args.output}")
+    print(f"[*] {elapsed:.2f}s, {len(images) / elapsed:.1f} gambar/s, "
+          f"{payload_bytes / elapsed / (1024 * 1024):.2f} MB/s payload")
+    return 0 if total == counts['valid'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
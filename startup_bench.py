@@ -0,0 +1,100 @@
+"""
+startup_bench.py
+====================================
+Benchmark cold-start import berbasis `python -X importtime`.
+
+Setiap modul di-import di interpreter baru; waktu kumulatif modul
+top-level diambil dari laporan importtime (stderr). Jika melebihi budget,
+script keluar dengan status 1 sehingga bisa dipakai sebagai guard di CI.
+
+Run: python startup_bench.py
+     python startup_bench.py --repeat 5 --budget gui_cryptostego=400
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# Budget (ms) waktu import kumulatif per modul entry point
+DEFAULT_BUDGETS_MS = {
+    "integrated_system": 100.0,
+    "gui_cryptostego": 150.0,
+    "research_lab": 150.0,
+}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(.+)$")
+
+
+def measure_import(module: str, python: str = sys.executable, cwd: str = None) -> dict:
+    """Import module di proses baru; return waktu kumulatif (ms) dan modul terlambat"""
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Import {module} gagal:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            entries.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+    # Hanya baris top-level (tanpa indentasi) yang dijumlahkan
+    total_us = sum(c for name, _, c in entries if not name.startswith(" "))
+    target = next((c for name, _, c in entries if name == module), None)
+    slowest = sorted(entries, key=lambda e: e[2], reverse=True)[:10]
+    return {
+        'module': module,
+        'module_ms': target / 1000 if target is not None else None,
+        'total_ms': total_us / 1000,
+        'slowest': [(name.strip(), c / 1000) for name, _, c in slowest],
+    }
+
+
+def run_startup_bench(budgets: dict, repeat: int = 3) -> list:
+    """Ukur setiap modul repeat kali (median); return list hasil dengan status budget"""
+    results = []
+    for module, budget in budgets.items():
+        runs = [measure_import(module) for _ in range(repeat)]
+        module_ms = statistics.median(r['module_ms'] for r in runs)
+        results.append({
+            'module': module,
+            'median_ms': module_ms,
+            'budget_ms': budget,
+            'ok': module_ms <= budget,
+            'slowest': runs[-1]['slowest'],
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", action="append", default=[],
+                        help="modul=ms, menimpa/menambah budget default")
+    parser.add_argument("-v", "--verbose", action="store_true", help="tampilkan 10 import terlambat")
+    args = parser.parse_args(argv)
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for item in args.budget:
+        module, _, ms = item.partition("=")
+        budgets[module] = float(ms)
+
+    results = run_startup_bench(budgets, args.repeat)
+    for r in results:
+        mark = "✓" if r['ok'] else "✗"
+        print(f"[{mark}] {r['module']:<20} {r['median_ms']:8.1f} ms  (budget {r['budget_ms']:.0f} ms)")
+        if args.verbose or not r['ok']:
+            for name, ms in r['slowest']:
+                print(f"       {ms:8.1f} ms  {name}")
+    return 0 if all(r['ok'] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+stego_container.py
+====================================
+Container multi-entry di dalam bit stream LSB (lihat lsb_array.py).
+
+LAYOUT (byte offset dalam bit stream):
+======================================
+0                : header  ">4sHH"  magic b"KRC1", jumlah entry, jumlah slot
+8                : directory, MAX slot x ">32sII" (nama UTF-8, offset, panjang)
+8 + 40*slot      : area data; offset entry relatif terhadap awal area ini
+
+Entry baru ditulis tepat setelah entry terakhir, lalu slot dan jumlah entry
+di header di-update. Pixel milik entry lain tidak disentuh, dan satu entry
+bisa dibaca tanpa men-decode entry lainnya.
+"""
+
+import struct
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from lsb_array import capacity_bytes, read_bytes, write_bytes
+
+MAGIC = b"KRC1"
+HEADER = struct.Struct(">4sHH")
+SLOT = struct.Struct(">32sII")
+NAME_MAX_BYTES = 32
+DEFAULT_SLOTS = 16
+
+
+class ContainerEntry(NamedTuple):
+    name: str
+    offset: int  # relatif terhadap data_start
+    length: int
+
+
+class ContainerDirectory(NamedTuple):
+    slots: int
+    entries: List[ContainerEntry]
+    
+    @property
+    def data_start(self) -> int:
+        return HEADER.size + SLOT.size * self.slots
+    
+    @property
+    def data_end(self) -> int:
+        """Offset relatif byte pertama setelah entry terakhir"""
+        if not self.entries:
+            return 0
+        last = self.entries[-1]
+        return last.offset + last.length
+    
+    def find(self, name: str) -> Optional[ContainerEntry]:
+        for entry in self.entries:
+            if entry.name == name:
+                return entry
+        return None
+
+
+def read_directory(pixels: np.ndarray) -> Optional[ContainerDirectory]:
+    """Baca directory container; None jika gambar tidak berisi container"""
+    if capacity_bytes(pixels) < HEADER.size:
+        return None
+    magic, count, slots = HEADER.unpack(read_bytes(pixels, 0, HEADER.size))
+    if magic != MAGIC or count > slots:
+        return None
+    
+    raw = read_bytes(pixels, HEADER.size, SLOT.size * count)
+    entries = []
+    for i in range(count):
+        name, offset, length = SLOT.unpack_from(raw, i * SLOT.size)
+        entries.append(ContainerEntry(name.rstrip(b"\0").decode("utf-8"), offset, length))
+    return ContainerDirectory(slots, entries)
+
+
+def init_container(pixels: np.ndarray, slots: int = DEFAULT_SLOTS) -> ContainerDirectory:
+    """Tulis header container kosong (in-place)"""
+    directory = ContainerDirectory(slots, [])
+    if directory.data_start > capacity_bytes(pixels):
+        raise ValueError("Gambar terlalu kecil untuk directory container")
+    write_bytes(pixels, 0, HEADER.pack(MAGIC, 0, slots))
+    return directory
+
+
+def append_entry(pixels: np.ndarray, name: str, data: bytes,
+                 directory: Optional[ContainerDirectory] = None) -> ContainerEntry:
+    """
+    Tambahkan entry ke container (in-place). Hanya pixel untuk data baru,
+    slot directory baru, dan header yang ditulis ulang.
+    """
+    if directory is None:
+        directory = read_directory(pixels)
+        if directory is None:
+            raise ValueError("Gambar tidak berisi container")
+    
+    name_bytes = name.encode("utf-8")
+    if not name_bytes or len(name_bytes) > NAME_MAX_BYTES:
+        raise ValueError(f"Nama entry harus 1-{NAME_MAX_BYTES} byte UTF-8")
+    if directory.find(name) is not None:
+        raise ValueError(f"Entry '{name}' sudah ada")
+    if len(directory.entries) >= directory.slots:
+        raise ValueError(f"Directory penuh ({directory.slots} entry)")
+    
+    entry = ContainerEntry(name, directory.data_end, len(data))
+    end = directory.data_start + entry.offset + entry.length
+    if end > capacity_bytes(pixels):
+        raise ValueError(
+            f"Entry terlalu besar: butuh {end} byte, kapasitas {capacity_bytes(pixels)} byte"
+        )
+    
+    count = len(directory.entries)
+    write_bytes(pixels, directory.data_start + entry.offset, data)
+    write_bytes(pixels, HEADER.size + SLOT.size * count, SLOT.pack(name_bytes, entry.offset, entry.length))
+    write_bytes(pixels, 0, HEADER.pack(MAGIC, count + 1, directory.slots))
+    directory.entries.append(entry)
+    return entry
+
+
+def read_entry(pixels: np.ndarray, name: str,
+               directory: Optional[ContainerDirectory] = None) -> bytes:
+    """Baca satu entry berdasarkan nama"""
+    if directory is None:
+        directory = read_directory(pixels)
+        if directory is None:
+            raise ValueError("Gambar tidak berisi container")
+    entry = directory.find(name)
+    if entry is None:
+        raise KeyError(name)
+    return read_bytes(pixels, directory.data_start + entry.offset, entry.length)
@@ -0,0 +1,378 @@
+"""
+stego_service.py
+====================================
+Service lokal (asyncio, HTTP/1.1 via TCP atau Unix socket) untuk pipeline
+IntegratedSecuritySystem. Kunci RSA dan cover cache tetap "hangat" di
+setiap worker process, sehingga caller tidak membayar startup Python,
+import dan load key per job.
+
+ENDPOINT:
+=========
+POST /hide?cover=<path cover di server>   body: plaintext   -> image/png
+POST /reveal                              body: stego PNG   -> plaintext
+GET  /status                                                -> JSON statistik
+
+Upload ditulis bertahap ke file sementara dan download dikirim per chunk
+(dengan drain), jadi payload tidak pernah di-buffer utuh di event loop.
+Tahap CPU-bound (crypto, embedding, encode PNG) jalan di ProcessPoolExecutor.
+Antrian job dibatasi; jika penuh, request langsung dijawab 503.
+--payload-cache-mb mengaktifkan PayloadCache per worker: hide ulang dokumen
+yang sama langsung ke tahap embed (lihat payload_cache.py);
+--extraction-cache-mb mengaktifkan ExtractionCache per worker: reveal ulang
+gambar yang sama hanya perlu decrypt AES (lihat extraction_cache.py).
+
+Run: python stego_service.py --port 8765
+     python stego_service.py --unix /tmp/kripto.sock
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from integrated_system import IntegratedSecuritySystem
+
+CHUNK_SIZE = 64 * 1024
+MAX_HEADER_BYTES = 16 * 1024
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 422: "Unprocessable Entity",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+# ============================================================================
+# WORKER PROCESS
+# ============================================================================
+
+_worker_system = None
+
+
+def _init_worker(key_paths: dict, payload_cache_bytes: int = 0, payload_ttl: float = None,
+                 extraction_cache_bytes: int = 0):
+    """Dipanggil sekali per worker process: load system (dan kunci) satu kali"""
+    global _worker_system
+    payload_cache = None
+    if payload_cache_bytes:
+        from payload_cache import PayloadCache
+        payload_cache = PayloadCache(payload_cache_bytes, payload_ttl)
+    extraction_cache = None
+    if extraction_cache_bytes:
+        from extraction_cache import ExtractionCache
+        extraction_cache = ExtractionCache(extraction_cache_bytes)
+    _worker_system = IntegratedSecuritySystem(**key_paths, verbose=False, payload_cache=payload_cache,
+                                              extraction_cache=extraction_cache)
+
+
+def _worker_hide(plaintext_path: str, cover_path: str, output_path: str):
+    return _worker_system.encrypt_and_hide(plaintext_path, cover_path, output_path)
+
+
+def _worker_reveal(stego_path: str, output_path: str):
+    return _worker_system.extract_and_decrypt(stego_path, output_path)
+
+
+# ============================================================================
+# SERVICE
+# ============================================================================
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class StegoService:
+    """
+    Service asyncio dengan antrian job terbatas dan process pool.
+
+    workers  : jumlah worker process (dan job yang berjalan bersamaan)
+    max_queue: jumlah job yang boleh menunggu sebelum request ditolak (503)
+    payload_cache_bytes: batas PayloadCache per worker (0 = nonaktif)
+    payload_ttl: umur maksimum payload di cache dalam detik (None = tanpa batas)
+    extraction_cache_bytes: batas ExtractionCache per worker (0 = nonaktif)
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 16, max_body_bytes: int = 256 * 1024 * 1024,
+                 sender_private_key_path="private_key.pem",
+                 sender_public_key_path="public_key.pem",
+                 receiver_public_key_path="public_key.pem",
+                 receiver_private_key_path="private_key.pem",
+                 payload_cache_bytes: int = 0, payload_ttl: float = None,
+                 extraction_cache_bytes: int = 0):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_body_bytes = max_body_bytes
+        self.key_paths = {
+            'sender_private_key_path': sender_private_key_path,
+            'sender_public_key_path': sender_public_key_path,
+            'receiver_public_key_path': receiver_public_key_path,
+            'receiver_private_key_path': receiver_private_key_path,
+        }
+        self.payload_cache_bytes = payload_cache_bytes
+        self.payload_ttl = payload_ttl
+        self.extraction_cache_bytes = extraction_cache_bytes
+        self.stats = {'accepted': 0, 'rejected': 0, 'completed': 0, 'failed': 0}
+        self._pool = None
+        self._queue = None
+        self._consumers = []
+        self._server = None
+        self._started_at = None
+
+    # ---------- lifecycle ----------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, unix_path: str = None):
+        """Start pool, consumer dan listener. port=0 memilih port bebas."""
+        # Buat kunci di proses utama dulu supaya worker tidak berebut generate
+        IntegratedSecuritySystem(**self.key_paths)
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker,
+            initargs=(self.key_paths, self.payload_cache_bytes, self.payload_ttl, self.extraction_cache_bytes)
+        )
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._consumers = [asyncio.create_task(self._consume()) for _ in range(self.workers)]
+
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle, path=unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        self._started_at = time.monotonic()
+        return self._server
+
+    @property
+    def address(self):
+        """Alamat listener (host, port) atau path Unix socket"""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._consumers:
+            task.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    # ---------- job queue ----------
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, future = await self._queue.get()
+            try:
+                if not future.cancelled():
+                    result = await loop.run_in_executor(self._pool, func, *args)
+                    if not future.cancelled():
+                        future.set_result(result)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def _submit(self, func, *args):
+        """Masukkan job ke antrian; HTTPError 503 jika antrian penuh (backpressure)"""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((func, args, future))
+        except asyncio.QueueFull:
+            self.stats['rejected'] += 1
+            raise HTTPError(503, "Antrian penuh, coba lagi nanti")
+        self.stats['accepted'] += 1
+        return await future
+
+    # ---------- HTTP ----------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        workdir = tempfile.mkdtemp(prefix="kripto_")
+        try:
+            try:
+                method, path, headers = await self._read_head(reader)
+                await self._dispatch(method, path, headers, reader, writer, workdir)
+            except HTTPError as e:
+                await self._send_json(writer, e.status, {'success': False, 'message': e.message})
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            except Exception as e:
+                await self._send_json(writer, 500, {'success': False, 'message': str(e)})
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_head(self, reader):
+        try:
+            raw = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise HTTPError(400, "Header terlalu besar")
+        if len(raw) > MAX_HEADER_BYTES:
+            raise HTTPError(400, "Header terlalu besar")
+        lines = raw.decode('latin-1').split("\r\n")
+        try:
+            method, path, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "Request line tidak valid")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        return method.upper(), path, headers
+
+    async def _dispatch(self, method, path, headers, reader, writer, workdir):
+        url = urlsplit(path)
+        query = parse_qs(url.query)
+
+        if url.path == "/status":
+            if method != "GET":
+                raise HTTPError(405, "Gunakan GET")
+            await self._send_json(writer, 200, self.status())
+            return
+
+        if url.path not in ("/hide", "/reveal"):
+            raise HTTPError(404, f"Endpoint tidak dikenal: {url.path}")
+        if method != "POST":
+            raise HTTPError(405, "Gunakan POST")
+
+        # Tolak sebelum upload jika antrian sudah penuh
+        if self._queue.full():
+            self.stats['rejected'] += 1
+            raise HTTPError(503, "Antrian penuh, coba lagi nanti")
+
+        input_path = os.path.join(workdir, "input.bin")
+        await self._receive_body(reader, headers, input_path)
+
+        if url.path == "/hide":
+            cover = query.get('cover', [None])[0]
+            if not cover:
+                raise HTTPError(400, "Parameter 'cover' wajib diisi")
+            output_path = os.path.join(workdir, "stego.png")
+            success, message = await self._submit(_worker_hide, input_path, cover, output_path)
+            content_type = "image/png"
+        else:
+            output_path = os.path.join(workdir, "plaintext.bin")
+            success, message = await self._submit(_worker_reveal, input_path, output_path)
+            content_type = "application/octet-stream"
+
+        if not success:
+            self.stats['failed'] += 1
+            raise HTTPError(422, message)
+        self.stats['completed'] += 1
+        await self._send_file(writer, output_path, content_type)
+
+    async def _receive_body(self, reader, headers, path):
+        """Stream body request ke file, per chunk"""
+        if 'content-length' not in headers:
+            raise HTTPError(411, "Content-Length wajib diisi")
+        try:
+            remaining = int(headers['content-length'])
+        except ValueError:
+            raise HTTPError(400, "Content-Length tidak valid")
+        if remaining < 0:
+            raise HTTPError(400, "Content-Length tidak valid")
+        if remaining > self.max_body_bytes:
+            raise HTTPError(413, f"Body melebihi {self.max_body_bytes} bytes")
+
+        with open(path, 'wb') as f:
+            while remaining:
+                chunk = await reader.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise HTTPError(400, "Body terputus")
+                f.write(chunk)
+                remaining -= len(chunk)
+
+    async def _send_head(self, writer, status, content_type, length):
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {length}\r\n"
+            f"Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1'))
+
+    async def _send_json(self, writer, status, body):
+        data = json.dumps(body).encode('utf-8')
+        await self._send_head(writer, status, "application/json", len(data))
+        writer.write(data)
+        await writer.drain()
+
+    async def _send_file(self, writer, path, content_type):
+        """Stream file ke client per chunk; drain() menahan pengiriman jika client lambat"""
+        await self._send_head(writer, 200, content_type, os.path.getsize(path))
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                writer.write(chunk)
+                await writer.drain()
+
+    def status(self) -> dict:
+        return {
+            **self.stats,
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'max_queue': self.max_queue,
+            'workers': self.workers,
+            'uptime_s': time.monotonic() - self._started_at if self._started_at else 0.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local steganography service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Path Unix socket (menggantikan host/port)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--max-queue", type=int, default=16)
+    parser.add_argument("--private-key", default="private_key.pem")
+    parser.add_argument("--public-key", default="public_key.pem")
+    parser.add_argument("--payload-cache-mb", type=float, default=0,
+                        help="cache payload terenkripsi per worker (MB, 0 = nonaktif)")
+    parser.add_argument("--payload-ttl", type=float, help="umur maksimum payload di cache (detik)")
+    parser.add_argument("--extraction-cache-mb", type=float, default=0,
+                        help="cache hasil ekstraksi per worker (MB, 0 = nonaktif)")
+    args = parser.parse_args()
+
+    service = StegoService(
+        workers=args.workers,
+        max_queue=args.max_queue,
+        sender_private_key_path=args.private_key,
+        sender_public_key_path=args.public_key,
+        receiver_public_key_path=args.public_key,
+        receiver_private_key_path=args.private_key,
+        payload_cache_bytes=int(args.payload_cache_mb * 1024 * 1024),
+        payload_ttl=args.payload_ttl,
+        extraction_cache_bytes=int(args.extraction_cache_mb * 1024 * 1024),
+    )
+
+    async def run():
+        await service.start(args.host, args.port, args.unix)
+        print(f"[✓] Service berjalan di {service.address}")
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\n[*] Service dihentikan")
+
+
+if __name__ == "__main__":
+    main()
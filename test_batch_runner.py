@@ -0,0 +1,53 @@
+"""
+test_batch_runner.py
+====================================
+Nama output plan_folder_jobs tidak boleh bertabrakan (dalam satu batch,
+antar batch, maupun dengan file dari sesi sebelumnya).
+
+Run: python -m pytest -q test_batch_runner.py
+"""
+
+import os
+
+from batch_runner import plan_folder_jobs
+
+
+def _inputs(root, *names):
+    paths = []
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+        paths.append(str(path))
+    return paths
+
+
+def test_same_stem_in_one_batch(tmp_path):
+    inputs = _inputs(tmp_path, "a/report.pdf", "a/report.docx", "b/report.pdf", "b/REPORT.PDF")
+    jobs = plan_folder_jobs(inputs, ["cover.png"], str(tmp_path / "out"))
+
+    outputs = [job.output_path.lower() for job in jobs]
+    assert len(set(outputs)) == len(inputs)
+
+
+def test_two_batches_into_one_folder(tmp_path):
+    """GUI: batch kedua direncanakan saat batch pertama masih berjalan (output belum ada di disk)"""
+    out = str(tmp_path / "out")
+    first = plan_folder_jobs(_inputs(tmp_path, "a/report.pdf"), ["cover.png"], out, first_id=0)
+    second = plan_folder_jobs(_inputs(tmp_path, "b/report.pdf"), ["cover.png"], out, first_id=len(first))
+
+    assert first[0].output_path != second[0].output_path
+
+
+def test_existing_output_not_overwritten(tmp_path):
+    """Sesi baru (job_id mulai dari 0 lagi) tidak menimpa output sesi sebelumnya"""
+    out = tmp_path / "out"
+    out.mkdir()
+    inputs = _inputs(tmp_path, "a/report.pdf")
+    first = plan_folder_jobs(inputs, ["cover.png"], str(out))
+    (out / os.path.basename(first[0].output_path)).write_bytes(b"stego")
+
+    second = plan_folder_jobs(inputs, ["cover.png"], str(out))
+
+    assert second[0].output_path != first[0].output_path
+    assert not (out / os.path.basename(second[0].output_path)).exists()
@@ -0,0 +1,62 @@
+"""
+test_image_preview.py
+====================================
+load_preview untuk mode gambar yang tidak didukung Image.reduce.
+
+Run: python -m pytest -q test_image_preview.py
+"""
+
+import pytest
+from PIL import Image
+
+from image_preview import PREVIEW_SIZE, load_preview
+
+LARGE = (2000, 2000)
+
+
+def _gradient(mode: str, path, **save_args):
+    img = Image.linear_gradient("L").resize(LARGE)
+    if mode == "P":
+        img = Image.merge("RGB", (img, img.transpose(Image.Transpose.ROTATE_90), img)).convert(
+            "P", palette=Image.Palette.ADAPTIVE)
+    elif mode == "I;16":
+        img = img.convert("I").point(lambda v: v * 256).convert("I;16")
+    else:
+        img = img.convert(mode)
+    img.save(path, **save_args)
+    return path
+
+
+@pytest.mark.parametrize("mode", ["P", "1", "I;16", "L", "RGBA"])
+def test_large_image_preview(tmp_path, mode):
+    path = _gradient(mode, tmp_path / "cover.png")
+    with Image.open(path) as img:
+        assert img.mode == mode
+
+    thumb, info = load_preview(str(path))
+
+    assert (info['width'], info['height']) == LARGE
+    assert thumb.width <= PREVIEW_SIZE[0] and thumb.height <= PREVIEW_SIZE[1]
+    assert thumb.mode in ("L", "RGB", "RGBA")
+
+
+def test_palette_preview_keeps_colors(tmp_path):
+    """Palette dikonversi ke RGB sebelum reduce, bukan merata-rata indeks palette"""
+    img = Image.new("RGB", LARGE, (200, 30, 30)).convert("P", palette=Image.Palette.ADAPTIVE)
+    path = tmp_path / "red.png"
+    img.save(path)
+
+    thumb, _ = load_preview(str(path))
+
+    assert thumb.convert("RGB").getpixel((0, 0)) == (200, 30, 30)
+
+
+def test_palette_transparency_preview(tmp_path):
+    img = Image.new("RGBA", LARGE, (0, 0, 255, 0)).convert("P")
+    img.info['transparency'] = 0
+    path = tmp_path / "transparent.png"
+    img.save(path, transparency=0)
+
+    thumb, _ = load_preview(str(path))
+
+    assert thumb.mode == "RGBA"
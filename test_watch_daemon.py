@@ -0,0 +1,42 @@
+"""
+test_watch_daemon.py
+====================================
+File yang di-drop ulang (nama sama, isi baru) tidak menimpa output sebelumnya.
+
+Run: python -m pytest -q test_watch_daemon.py
+"""
+
+import os
+
+from watch_daemon import WatchDaemon
+
+COVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_images", "sample_image.png")
+
+
+def _run_once(tmp_path):
+    key_paths = {
+        'sender_private_key_path': str(tmp_path / "private_key.pem"),
+        'sender_public_key_path': str(tmp_path / "public_key.pem"),
+        'receiver_public_key_path': str(tmp_path / "public_key.pem"),
+        'receiver_private_key_path': str(tmp_path / "private_key.pem"),
+    }
+    daemon = WatchDaemon(str(tmp_path / "inbox"), str(tmp_path / "outbox"), [COVER], workers=1,
+                         use_polling=True, key_paths=key_paths)
+    daemon.run(run_until_idle=True)
+    return daemon.counters
+
+
+def test_redropped_file_keeps_previous_output(tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+
+    (inbox / "report.txt").write_bytes(b"versi pertama")
+    assert _run_once(tmp_path)['completed'] == 1
+    first = {p.name for p in (tmp_path / "outbox").glob("*.png")}
+
+    (inbox / "report.txt").write_bytes(b"versi kedua, isi lebih panjang")
+    assert _run_once(tmp_path)['completed'] == 1
+    second = {p.name for p in (tmp_path / "outbox").glob("*.png")}
+
+    assert len(first) == 1
+    assert first < second and len(second) == 2
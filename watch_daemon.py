@@ -0,0 +1,341 @@
+"""
+watch_daemon.py
+====================================
+Daemon watch-folder: setiap file baru di folder inbox dienkripsi dan
+disembunyikan (IntegratedSecuritySystem.encrypt_and_hide) ke folder outbox.
+
+- Deteksi file baru dengan inotify (Linux, via ctypes); fallback ke polling.
+- Job dijalankan di BatchRunner (process pool) dengan batas job in-flight.
+- Journal JSON-lines mencatat file yang sudah selesai (nama, ukuran, mtime),
+  jadi setelah crash/restart daemon hanya memproses file yang belum selesai.
+- Statistik (queue depth, in-flight, throughput) ditulis berkala ke file JSON.
+
+Run: python watch_daemon.py inbox/ outbox/ --cover test_images/sample_image.png
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+IGNORED_SUFFIXES = (".part", ".tmp", ".swp", ".crdownload")
+
+
+def _is_candidate(path: str) -> bool:
+    name = os.path.basename(path)
+    return not name.startswith(".") and not name.endswith(IGNORED_SUFFIXES) and os.path.isfile(path)
+
+
+# ============================================================================
+# WATCHERS
+# ============================================================================
+
+class PollingWatcher:
+    """Scan folder berkala; file dilaporkan setelah ukuran & mtime stabil satu interval"""
+
+    def __init__(self, directory: str, interval: float = 1.0):
+        self.directory = directory
+        self.interval = interval
+        self._last_seen = {}
+        self._reported = {}
+
+    def poll(self, timeout: float) -> list:
+        time.sleep(min(timeout, self.interval))
+        ready = []
+        seen = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not _is_candidate(entry.path):
+                    continue
+                st = entry.stat()
+                signature = (st.st_size, st.st_mtime_ns)
+                seen[entry.path] = signature
+                if self._last_seen.get(entry.path) == signature and self._reported.get(entry.path) != signature:
+                    self._reported[entry.path] = signature
+                    ready.append(entry.path)
+        self._last_seen = seen
+        self._reported = {p: s for p, s in self._reported.items() if p in seen}
+        return ready
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """inotify (Linux) via ctypes: IN_CLOSE_WRITE dan IN_MOVED_TO"""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.directory = directory
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 gagal")
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), self.IN_CLOSE_WRITE | self.IN_MOVED_TO)
+        if wd < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch gagal: {directory}")
+
+    def poll(self, timeout: float) -> list:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        ready = []
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            _, _, _, name_len = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+            path = os.path.join(self.directory, os.fsdecode(name))
+            if name and _is_candidate(path):
+                ready.append(path)
+        return ready
+
+    def close(self):
+        os.close(self.fd)
+
+
+def make_watcher(directory: str, use_polling: bool = False, interval: float = 1.0):
+    """InotifyWatcher jika tersedia, selain itu PollingWatcher"""
+    if not use_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, interval)
+
+
+# ============================================================================
+# JOURNAL
+# ============================================================================
+
+class Journal:
+    """Journal append-only (JSON-lines) berisi file yang sudah selesai diproses"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # baris terakhir terpotong saat crash
+                    self.completed.add(self._key(record['file'], record['size'], record['mtime_ns']))
+        self._fh = open(path, "a", encoding="utf-8")
+
+    @staticmethod
+    def _key(name, size, mtime_ns):
+        return (name, size, mtime_ns)
+
+    @staticmethod
+    def file_key(path: str):
+        st = os.stat(path)
+        return os.path.basename(path), st.st_size, st.st_mtime_ns
+
+    def is_done(self, key) -> bool:
+        return key in self.completed
+
+    def record(self, key, **fields):
+        name, size, mtime_ns = key
+        entry = {'file': name, 'size': size, 'mtime_ns': mtime_ns, 'time': time.time(), **fields}
+        self._fh.write(json.dumps(entry) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self.completed.add(key)
+
+    def close(self):
+        self._fh.close()
+
+
+# ============================================================================
+# DAEMON
+# ============================================================================
+
+class WatchDaemon:
+    """
+    inbox      : folder yang dipantau
+    outbox     : folder output stego PNG (<nama file>_<mtime_ns>.png; file yang
+                 di-drop ulang dengan isi baru tidak menimpa output versi sebelumnya)
+    covers     : list cover image, dipakai bergiliran
+    max_in_flight: batas job yang sedang dikerjakan pool (sisanya menunggu di antrian)
+    """
+
+    def __init__(self, inbox: str, outbox: str, covers: list, workers: int = None,
+                 max_in_flight: int = None, journal_path: str = None, status_path: str = None,
+                 use_polling: bool = False, poll_interval: float = 1.0, key_paths: dict = None):
+        from batch_runner import BatchRunner
+
+        self.inbox = inbox
+        self.outbox = outbox
+        self.covers = covers
+        os.makedirs(outbox, exist_ok=True)
+        self.runner = BatchRunner(workers, **(key_paths or {}))
+        self.max_in_flight = max_in_flight or 2 * self.runner.workers
+        self.journal = Journal(journal_path or os.path.join(outbox, ".kripto_journal.jsonl"))
+        self.status_path = status_path or os.path.join(outbox, ".kripto_status.json")
+        self.watcher = make_watcher(inbox, use_polling, poll_interval)
+
+        self._waiting = deque()
+        self._known = set()
+        self._in_flight = {}  # job_id -> journal key
+        self._next_id = 0
+        self._stop = False
+        self.counters = {'completed': 0, 'failed': 0, 'bytes': 0, 'started_at': time.time()}
+
+    def stats(self) -> dict:
+        elapsed = max(time.time() - self.counters['started_at'], 1e-9)
+        return {
+            'watcher': type(self.watcher).__name__,
+            'queue_depth': len(self._waiting),
+            'in_flight': len(self._in_flight),
+            'completed': self.counters['completed'],
+            'failed': self.counters['failed'],
+            'files_per_s': self.counters['completed'] / elapsed,
+            'mb_per_s': self.counters['bytes'] / 1e6 / elapsed,
+            'uptime_s': elapsed,
+        }
+
+    def enqueue(self, path: str):
+        try:
+            key = Journal.file_key(path)
+        except FileNotFoundError:
+            return
+        if self.journal.is_done(key) or key in self._known:
+            return
+        self._known.add(key)
+        self._waiting.append((path, key))
+
+    def _dispatch(self):
+        from batch_runner import BatchJob
+
+        jobs = []
+        while self._waiting and len(self._in_flight) + len(jobs) < self.max_in_flight:
+            path, key = self._waiting.popleft()
+            cover = self.covers[self._next_id % len(self.covers)]
+            output = os.path.join(self.outbox, f"{key[0]}_{key[2]}.png")
+            jobs.append(BatchJob(self._next_id, path, cover, output))
+            self._in_flight[self._next_id] = key
+            self._next_id += 1
+        if jobs:
+            self.runner.start(jobs)
+
+    def _collect(self):
+        for event in self.runner.poll():
+            if event[0] != "done":
+                continue
+            _, job_id, success, message, seconds = event
+            key = self._in_flight.pop(job_id)
+            result = self.runner.results[job_id]
+            self._known.discard(key)
+            if success:
+                self.counters['completed'] += 1
+                self.counters['bytes'] += key[1]
+                self.journal.record(key, output=result['output'], seconds=seconds)
+                print(f"[✓] {key[0]} -> {result['output']} ({seconds:.2f}s)")
+            else:
+                # Tidak dicatat di journal: akan dicoba lagi saat file berubah atau daemon restart
+                self.counters['failed'] += 1
+                print(f"[✗] {key[0]}: {message}")
+            self.runner.forget(job_id)
+
+    def _write_status(self):
+        tmp = self.status_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.stats(), f, indent=2)
+        os.replace(tmp, self.status_path)
+
+    def stop(self, *_):
+        self._stop = True
+
+    def run(self, status_interval: float = 5.0, run_until_idle: bool = False):
+        """Loop utama; run_until_idle=True berhenti saat antrian dan job habis (untuk testing/cron)"""
+        # Resume: file yang sudah ada di inbox tapi belum tercatat selesai
+        for path in sorted(str(p) for p in Path(self.inbox).iterdir()):
+            if _is_candidate(path):
+                self.enqueue(path)
+
+        last_status = 0.0
+        try:
+            while not self._stop:
+                for path in self.watcher.poll(0.2):
+                    self.enqueue(path)
+                self._dispatch()
+                self._collect()
+
+                now = time.time()
+                if now - last_status >= status_interval:
+                    self._write_status()
+                    last_status = now
+
+                if run_until_idle and not self._waiting and not self._in_flight:
+                    break
+        finally:
+            self._write_status()
+            self.watcher.close()
+            self.runner.shutdown()
+            self.journal.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch-folder encrypt & hide daemon")
+    parser.add_argument("inbox")
+    parser.add_argument("outbox")
+    parser.add_argument("--cover", required=True, help="cover image atau folder cover")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--max-in-flight", type=int)
+    parser.add_argument("--journal", help="default: <outbox>/.kripto_journal.jsonl")
+    parser.add_argument("--status", help="default: <outbox>/.kripto_status.json")
+    parser.add_argument("--polling", action="store_true", help="paksa polling (tanpa inotify)")
+    parser.add_argument("--interval", type=float, default=1.0, help="interval polling (detik)")
+    parser.add_argument("--once", action="store_true", help="proses isi inbox lalu keluar")
+    parser.add_argument("--private-key", default="private_key.pem")
+    parser.add_argument("--public-key", default="public_key.pem")
+    args = parser.parse_args(argv)
+
+    from batch_runner import list_covers
+    covers = list_covers(args.cover)
+    if not covers:
+        print(f"[!] Tidak ada cover image di {args.cover}")
+        return 1
+
+    daemon = WatchDaemon(
+        args.inbox, args.outbox, covers,
+        workers=args.workers, max_in_flight=args.max_in_flight,
+        journal_path=args.journal, status_path=args.status,
+        use_polling=args.polling, poll_interval=args.interval,
+        key_paths={
+            'sender_private_key_path': args.private_key,
+            'sender_public_key_path': args.public_key,
+            'receiver_public_key_path': args.public_key,
+            'receiver_private_key_path': args.private_key,
+        },
+    )
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    print(f"[*] Memantau {args.inbox} ({type(daemon.watcher).__name__}), output ke {args.outbox}")
+    daemon.run(run_until_idle=args.once)
+    print(f"[✓] Daemon berhenti: {daemon.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())